@@ -0,0 +1,50 @@
+"""
+Renders the text of reports for every forecast type in both locales, on its own and together with the creation of
+the report.
+
+Usage: python -m benchmarks.answer_rendering
+"""
+import datetime
+
+from benchmarks.common import load_config, build_response, report
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types import item_list
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+from rhasspy_weather.data_types.temperature import TemperatureType
+
+
+def render(request, forecast):
+    return WeatherReport(request, forecast).speech[request.forecast_type]
+
+
+def main():
+    for locale_name in ["german", "english"]:
+        config = load_config(locale=locale_name)
+        # the item list of the last imported locale is the global one
+        item_list.items = config.locale.items
+        location = Location("Frankfurt")
+        location.set_lat_and_lon(50.1167, 8.6833)
+        forecast = openweathermap.parse_forecast(build_response(40), location, config.timezone)
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+
+        requests = []
+        for forecast_type, requested in [(ForecastType.FULL, None), (ForecastType.TEMPERATURE, TemperatureType.WARM),
+                                         (ForecastType.CONDITION, ConditionType.RAIN), (ForecastType.ITEM, config.locale.items.get_all_item_names()[0])]:
+            request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, forecast_type)
+            request.requested = requested
+            request.location = location
+            request.location_specified = True
+            requests.append(request)
+        for request in requests:
+            print(render(request, forecast))
+        for request in requests:
+            weather_report = WeatherReport(request, forecast)
+            report(f"{locale_name} {request.forecast_type.name.lower()}, speech only", weather_report.report, 5000)
+            report(f"{locale_name} {request.forecast_type.name.lower()}, report and speech", lambda: render(request, forecast), 2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Starts a fresh interpreter per intent like examples/custom_commands.py does and measures the time until the answer
+of a forecast that is already in the disk cache. Also lists the heaviest imports of such a start.
+
+Usage: python -m benchmarks.cold_start [number of starts]
+"""
+import configparser
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import load_config, build_response
+import rhasspy_weather.data_types.config as cf
+from rhasspy_weather import weather
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.cache import disk
+
+root_path = str(Path(__file__).parent.parent)
+snapshot_path = tempfile.mkdtemp()
+
+answer_script = """
+import sys
+import rhasspy_weather.data_types.config as cf
+import rhasspy_weather.weather as weather
+cf.snapshot_path = sys.argv[2]
+intent = {"intent": {"name": "GetWeatherForecast"}, "slots": {"when_day": "morgen"}, "text": "wie wird das wetter morgen"}
+weather.get_weather_forecast(intent, config_path=sys.argv[1])
+"""
+
+
+def prepare(snapshot: bool = True) -> str:
+    """Writes a config with a disk cache in a temporary directory, fills the cache and returns the config path."""
+    cf.snapshot_path = snapshot_path
+    load_config(cache="disk", output="return")
+    parser = configparser.ConfigParser(allow_no_value=True)
+    parser.read(cf.config_path)
+    parser["Cache"]["path"] = os.path.join(tempfile.mkdtemp(), "forecast_cache.sqlite")
+    parser["Cache"]["config_snapshot"] = str(snapshot)
+    with open(cf.config_path, "w") as config_file:
+        parser.write(config_file)
+    cf.set_config_path(cf.config_path)
+    config = cf.get_config()
+    location = config.location
+    # a new process looks the forecast up by the configured location, before its coordinates are known
+    key = weather.get_cache_key(location)
+    if not location.has_coordinates:
+        location.set_lat_and_lon(52.52, 13.405)
+    disk.put(key, openweathermap.parse_forecast(build_response(40), location, config.timezone))
+    return cf.config_path
+
+
+def start(config_path: str, *options) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", answer_script, config_path, snapshot_path], cwd=root_path,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+
+def import_times(config_path: str) -> list:
+    """Returns (cumulative microseconds, module) of all top level imports of one start, the slowest first."""
+    times = []
+    for line in start(config_path, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            times.append((int(cumulative), module.strip()))
+    return sorted(times, reverse=True)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    for name, snapshot in [("config parsed", False), ("config snapshot", True)]:
+        config_path = prepare(snapshot)
+        # the first start saves the snapshot
+        start(config_path)
+        durations = []
+        for _ in range(number):
+            begin = time.perf_counter()
+            start(config_path)
+            durations.append(time.perf_counter() - begin)
+        print(f"{'time to first answer, ' + name + ' (median of ' + str(number) + ')':55} {statistics.median(durations) * 1e3:12.1f} ms")
+    baseline = []
+    for _ in range(number):
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        baseline.append(time.perf_counter() - begin)
+    print(f"{'empty interpreter (median of ' + str(number) + ')':55} {statistics.median(baseline) * 1e3:12.1f} ms")
+    for cumulative, module in import_times(config_path)[:12]:
+        print(f"  {module:53} {cumulative / 1e3:12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
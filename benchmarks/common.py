@@ -0,0 +1,55 @@
+import configparser
+import datetime
+import os
+import tempfile
+import timeit
+from pathlib import Path
+
+import rhasspy_weather.data_types.config as cf
+from tests.data.openweathermap_weather import MockResponse
+
+default_config_path = os.path.join(str(Path(__file__).parent.parent), "rhasspy_weather", "config.default")
+
+slot_data = [
+    {"temp": 30, "f_temp": 29, "min_temp": 28, "max_temp": 31, "pressure": 1009, "humidity": 50, "weather_id": 500},
+    {"temp": 25, "f_temp": 27, "min_temp": 23, "max_temp": 28, "pressure": 1006, "humidity": 58, "weather_id": 503},
+    {"temp": 0, "f_temp": 3, "min_temp": -3, "max_temp": 5, "pressure": 1009, "humidity": 11, "weather_id": 601},
+    {"temp": 5, "f_temp": 4, "min_temp": 3, "max_temp": 7, "pressure": 1015, "humidity": 20, "weather_id": 800},
+    {"temp": 15, "f_temp": 18, "min_temp": 14, "max_temp": 17, "pressure": 1020, "humidity": 33, "weather_id": 802},
+    {"temp": 18, "f_temp": 16, "min_temp": 17, "max_temp": 18, "pressure": 1019, "humidity": 35, "weather_id": 803},
+    {"temp": 12, "f_temp": 11, "min_temp": 10, "max_temp": 13, "pressure": 1012, "humidity": 80, "weather_id": 211},
+    {"temp": 9, "f_temp": 8, "min_temp": 8, "max_temp": 10, "pressure": 1011, "humidity": 90, "weather_id": 804}
+]
+
+
+def load_config(**options) -> cf.WeatherConfig:
+    """
+    Writes config.default with an api key and the given options of the General section into a temporary file and
+    loads it.
+    """
+    parser = configparser.ConfigParser(allow_no_value=True)
+    parser.read(default_config_path)
+    parser["General"]["output"] = "return"
+    parser["OpenWeatherMap"]["api_key"] = "benchmark"
+    # every call writes a new file, its snapshot would never be used again
+    parser["Cache"]["config_snapshot"] = "False"
+    for option, value in options.items():
+        parser["General"][option] = value
+    file_descriptor, path = tempfile.mkstemp(suffix=".ini")
+    with os.fdopen(file_descriptor, "w") as config_file:
+        parser.write(config_file)
+    cf.set_config_path(path)
+    return cf.get_config()
+
+
+def build_response(slot_count: int) -> dict:
+    """Builds a decoded openweathermap forecast response with slot_count forecasts starting today at midnight."""
+    data = [slot_data[x % len(slot_data)] for x in range(slot_count)]
+    return MockResponse("response_200", data, start_date=datetime.date.today(), start_time=datetime.time(0, 0)).json()
+
+
+def report(name: str, function, number: int, repeat: int = 5):
+    """Prints the best time of repeat runs of number calls of function in microseconds per call."""
+    best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+    print(f"{name:55} {best * 1e6:12.1f} us")
+    return best
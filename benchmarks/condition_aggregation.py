@@ -0,0 +1,53 @@
+"""
+Aggregates the conditions of forecasts with 5, 50 and 500 days (3 hour slots). The list based aggregation
+WeatherReport used before is included as a reference, the time per slot should stay constant for both.
+
+Usage: python -m benchmarks.condition_aggregation
+"""
+from benchmarks.common import load_config, build_response, report
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.aggregate import WeatherAggregate
+from rhasspy_weather.data_types.location import Location
+
+
+def list_aggregation(slots):
+    condition_list = []
+    condition_counts = {}
+    for weather_at_time in slots:
+        for condition in [weather_at_time.main_condition] + weather_at_time.other_conditions:
+            condition_type_list = [x.condition_type for x in condition_list]
+            if condition.condition_type not in condition_type_list:
+                condition_list.append(condition)
+            else:
+                condition_in_list = next(x for x in condition_list if x.condition_type == condition.condition_type)
+                if condition.severity > condition_in_list.severity:
+                    condition_list.remove(condition_in_list)
+                    condition_list.append(condition)
+            if condition.condition_type not in condition_counts:
+                condition_counts[condition.condition_type] = 0
+            condition_counts[condition.condition_type] = condition_counts[condition.condition_type] + 1
+    return condition_list, condition_counts
+
+
+def dict_aggregation(slots):
+    aggregate = WeatherAggregate()
+    for weather_at_time in slots:
+        aggregate.add_conditions(weather_at_time)
+    return aggregate.conditions, aggregate.condition_counts
+
+
+def main():
+    config = load_config()
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.1167, 8.6833)
+    for days, number in [(5, 200), (50, 20), (500, 2)]:
+        forecast = openweathermap.parse_forecast(build_response(days * 8), location, config.timezone)
+        slots = forecast.get_slots(0, len(forecast))
+        assert sorted(map(str, list_aggregation(slots)[0])) == sorted(map(str, dict_aggregation(slots)[0]))
+        for name, function in [("list", list_aggregation), ("dict", dict_aggregation)]:
+            best = report(f"{name} aggregation, {days} days", lambda: function(slots), number)
+            print(f"{'':55} {best * 1e6 / len(slots):12.2f} us per slot")
+
+
+if __name__ == "__main__":
+    main()
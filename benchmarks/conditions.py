@@ -0,0 +1,67 @@
+"""
+Counts the get_config() calls and allocations of decoding a full 5 day / 3 hour forecast (40 slots, including the
+aggregates) and of creating the WeatherAtTime objects of all its slots, which is what a report of the whole forecast
+needs.
+
+Usage: python -m benchmarks.conditions
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.common import load_config, build_response, report
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.location import Location
+
+
+def count_calls(function, code):
+    """Calls function and counts how often code was called meanwhile"""
+    calls = 0
+
+    def profile(frame, event, arg):
+        nonlocal calls
+        if event == "call" and frame.f_code is code:
+            calls = calls + 1
+
+    sys.setprofile(profile)
+    try:
+        function()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+
+def count_allocations(function):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = function()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return blocks
+
+
+def main():
+    config = load_config()
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.1167, 8.6833)
+    response = build_response(40)
+    forecast = openweathermap.parse_forecast(response, location, config.timezone)
+
+    functions = {
+        "decode 40 slots": lambda: openweathermap.parse_forecast(response, location, config.timezone),
+        "WeatherAtTime objects of 40 slots": lambda: forecast.get_slots(0, len(forecast))
+    }
+    for name, function in functions.items():
+        calls = count_calls(function, get_config.__code__)
+        blocks = count_allocations(function)
+        print(f"{name:35} {calls:6} get_config() calls {blocks:8} allocations")
+    for name, function in functions.items():
+        report(name, function, 200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares the per-request latency of a fresh connection per request (plain requests.get) with the pooled
+keep-alive session of rhasspy_weather.utils.http_client against a local stub server.
+
+Usage: python -m benchmarks.http_client [number of requests]
+"""
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from rhasspy_weather.utils import http_client
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b'{"cod": "200", "list": []}' * 200
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(function, url, count):
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        function(url).content
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main(count=200):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/data/2.5/forecast"
+
+    results = {
+        "requests.get (new connection)": measure(lambda u: requests.get(u, headers={"Connection": "close"}), url, count),
+        "http_client.get (keep-alive)": measure(http_client.get, url, count)
+    }
+    for name, timings in results.items():
+        print(f"{name:32} mean {statistics.mean(timings):7.3f} ms   median {statistics.median(timings):7.3f} ms")
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,54 @@
+"""
+Looks up items by name and by weather type in the item lists of both locales. The list scans WeatherItemList used
+before are included as a reference. Also answers an item request without an item ("what should I bring") for
+today's forecast.
+
+Usage: python -m benchmarks.item_lookup
+"""
+import datetime
+
+from benchmarks.common import load_config, build_response, report
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.item import WeatherItem
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+from rhasspy_weather.data_types.temperature import TemperatureType
+
+
+def list_get_item(item_list, item_name):
+    items = list(item_list)
+    item = WeatherItem(item_name)
+    if item in items:
+        return items[items.index(item)]
+
+
+def list_get_useful_items(item_list, weather_types):
+    return [item for item in item_list if item.variant_of is None and any(item.is_for_weather_type(x) for x in weather_types)]
+
+
+def main():
+    weather_types = {ConditionType.RAIN, ConditionType.WIND, TemperatureType.COLD}
+    for locale_name in ["german", "english"]:
+        config = load_config(locale=locale_name)
+        item_list = config.locale.items
+        items = list(item_list)
+        # the last item is the worst case for a scan
+        name = items[-1].name
+        assert list_get_item(item_list, name) is item_list.get_item(name)
+        assert list_get_useful_items(items, weather_types) == item_list.get_items_for_weather_types(weather_types)
+        report(f"{locale_name} get item, list scan", lambda: list_get_item(items, name), 20000)
+        report(f"{locale_name} get item, index", lambda: item_list.get_item(name), 20000)
+        report(f"{locale_name} items for weather types, list scan", lambda: list_get_useful_items(items, weather_types), 20000)
+        report(f"{locale_name} items for weather types, index", lambda: item_list.get_items_for_weather_types(weather_types), 20000)
+
+        location = Location("Frankfurt")
+        location.set_lat_and_lon(50.1167, 8.6833)
+        forecast = openweathermap.parse_forecast(build_response(8), location, config.timezone)
+        request = WeatherRequest(DateType.FIXED, Grain.DAY, datetime.date.today(), ForecastType.ITEM)
+        report(f"{locale_name} what should I bring", lambda: WeatherReport(request, forecast).speech[ForecastType.ITEM], 2000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Parses the date, time, condition, temperature and item slots of intents like the parsers do, for both locales.
+
+Usage: python -m benchmarks.locale_lookup
+"""
+from benchmarks.common import load_config, report
+from rhasspy_weather.data_types.context import WeatherContext
+from rhasspy_weather.utils import dt_utils
+from rhasspy_weather.utils.parser import parse_date, parse_time, parse_condition, parse_temperature, parse_item
+
+slots = {
+    "german": {"date": ["morgen", "heilig abend", "Freitag", "12 Dezember", "am Wochenende"],
+               "time": ["Abend", "früh", "15 30"], "condition": ["sonnig", "Regen"], "temperature": ["heiß", "kalt"],
+               "item": ["Schirm", "gummistiefel"]},
+    "english": {"date": ["tomorrow", "the day after tomorrow", "Friday", "12 December", "over the weekend"],
+                "time": ["evening", "noon", "15 30"], "condition": ["sunny", "Rain"], "temperature": ["hot", "cold"],
+                "item": ["umbrella", "Sunglasses"]}
+}
+
+
+def parse_slots(values, context):
+    locale = context.locale
+    for date in values["date"]:
+        parse_date(date, locale, context)
+    for time in values["time"]:
+        parse_time(time, locale, context)
+    for condition in values["condition"]:
+        parse_condition(condition, locale)
+    for temperature in values["temperature"]:
+        parse_temperature(temperature, locale)
+    for item in values["item"]:
+        parse_item(item, locale)
+
+
+def main():
+    for locale_name, values in slots.items():
+        context = WeatherContext(load_config(locale=locale_name))
+        report(f"{locale_name} all slots", lambda: parse_slots(values, context), 2000)
+        report(f"{locale_name} named day to str", lambda: dt_utils.named_day_to_str(values["date"][1], context), 20000)
+        report(f"{locale_name} condition", lambda: parse_condition(values["condition"][0], context.locale), 20000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Decodes openweathermap forecast responses of 40 (the real 5 day / 3 hour forecast) and 1000 synthetic forecasts.
+The quadratic grouping the decoder used before is included as a reference.
+
+Usage: python -m benchmarks.openweathermap_decoder
+"""
+import datetime
+
+from benchmarks.common import load_config, build_response, report
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.condition import WeatherCondition
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+
+
+def quadratic_decoder(response, location):
+    forecasts = {}
+    for x in response["list"]:
+        if str(datetime.date.fromtimestamp(x["dt"])) not in forecasts:
+            forecasts[str(datetime.date.fromtimestamp(x["dt"]))] = \
+                list(filter(lambda forecast: datetime.date.fromtimestamp(forecast["dt"]) == datetime.date.fromtimestamp(x["dt"]), response["list"]))
+    weather = Weather()
+    for key, forecast in forecasts.items():
+        date = datetime.datetime.strptime(key, "%Y-%m-%d").date()
+        times = [datetime.datetime.strptime(x, "%H:%M:%S").time() for x in [x["dt_txt"].split(" ")[1] for x in forecast]]
+        for x in range(len(forecast)):
+            owm_id = forecast[x]["weather"][0]["id"]
+            condition = WeatherCondition(openweathermap.__get_severity_from_open_weather_map_id(owm_id), forecast[x]["weather"][0]["description"], openweathermap.__get_condition_type(owm_id))
+            weather.add_weather(date, WeatherAtTime(date, times[x], forecast[x]["main"]["temp"], condition, forecast[x]["main"]["pressure"],
+                                                    forecast[x]["main"]["humidity"], forecast[x]["wind"]["speed"], forecast[x]["wind"]["deg"], 3, location))
+    return weather
+
+
+def main():
+    config = load_config()
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.1167, 8.6833)
+    for slot_count, number in [(40, 200), (1000, 5)]:
+        response = build_response(slot_count)
+        report(f"quadratic decoder, {slot_count} forecasts", lambda: quadratic_decoder(response, location), number)
+        report(f"single pass decoder, {slot_count} forecasts", lambda: openweathermap.parse_forecast(response, location, config.timezone), number)
+
+
+if __name__ == "__main__":
+    main()
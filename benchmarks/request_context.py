@@ -0,0 +1,55 @@
+"""
+Answers a rhasspy intent from a cached forecast, once with every step looking up the global config on its own (like
+before WeatherContext) and once with one WeatherContext passed through all steps. Counts the get_config() calls of
+both.
+
+Usage: python -m benchmarks.request_context
+"""
+from benchmarks.common import load_config, build_response, report
+from benchmarks.conditions import count_calls
+from rhasspy_weather import weather
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.cache import answers
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import WeatherContext
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.templates import fill_template
+
+intent = {"intent": {"name": "GetWeatherForecast"}, "slots": {"when_day": "morgen"}, "text": "wie wird das wetter morgen"}
+
+
+def without_context(config):
+    request = config.parser.parse_intent_message(intent)
+    forecast = weather.get_weather(request)
+    weather_report = WeatherReport(request, forecast)
+    return [fill_template(intent, weather_report, x.get_template()) for x in config.output]
+
+
+def with_context(config):
+    context = WeatherContext(config)
+    request = weather.get_request(intent, context=context)
+    forecast = weather.get_weather(request, context=context)
+    weather_report = weather.get_report(request, forecast, context=context)
+    return weather.render_answer(intent, weather_report, context)
+
+
+def main():
+    config = load_config(cache="memory", output="return")
+    answers.enabled = False
+    location = config.location
+    if not location.has_coordinates:
+        location.set_lat_and_lon(52.52, 13.405)
+    forecast = openweathermap.parse_forecast(build_response(40), location, config.timezone)
+    for cache in config.cache:
+        cache.put(weather.get_cache_key(location), forecast)
+
+    print(with_context(config))
+    for name, function in [("global config per step", without_context), ("one WeatherContext", with_context)]:
+        calls = count_calls(lambda: function(config), get_config.__code__)
+        print(f"{name:35} {calls:6} get_config() calls")
+    for name, function in [("global config per step", without_context), ("one WeatherContext", with_context)]:
+        report(name, lambda: function(config), 500)
+
+
+if __name__ == "__main__":
+    main()
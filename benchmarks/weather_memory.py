@@ -0,0 +1,45 @@
+"""
+Measures the memory a cached forecast needs. The columnar Weather object is compared to the WeatherAtTime objects
+of all slots, which is how forecasts were stored before.
+
+Usage: python -m benchmarks.weather_memory [number of cached locations]
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.common import load_config, build_response
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.location import Location
+
+
+def measure(function, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [function() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return size, blocks
+
+
+def main(location_count=100):
+    config = load_config()
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.1167, 8.6833)
+    response = build_response(40)
+    forecast = openweathermap.parse_forecast(response, location, config.timezone)
+
+    results = {
+        "columnar Weather": measure(lambda: openweathermap.parse_forecast(response, location, config.timezone), location_count),
+        "WeatherAtTime per slot": measure(lambda: forecast.get_slots(0, len(forecast)), location_count)
+    }
+    for name, (size, blocks) in results.items():
+        print(f"{name:25} {size / location_count / 1024:8.1f} KiB {blocks / location_count:8.0f} allocations per forecast")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
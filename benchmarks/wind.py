@@ -0,0 +1,46 @@
+"""
+Classifies synthetic wind speeds and directions (beaufort and compass direction). The per slot WindCondition
+construction used before is included as a reference.
+
+Usage: python -m benchmarks.wind [number of slots]
+"""
+import random
+import sys
+
+from benchmarks.common import load_config, report
+from rhasspy_weather.data_types.condition import ConditionType, classify_wind, classify_wind_batch
+from rhasspy_weather.utils.utils import normal_round
+
+
+def per_slot_classification(wind_speeds, wind_directions, config):
+    results = []
+    for wind_speed, wind_direction in zip(wind_speeds, wind_directions):
+        if config.units == "imperial":
+            wind_speed = wind_speed / 2.237
+        severity = normal_round((wind_speed / 0.836) * (2 / 3))
+        compass_index = int((wind_direction / 45) + 0.5) % 8
+        compass_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+        try:
+            description = config.locale.conditions[ConditionType.WIND][severity]
+        except KeyError:
+            description = ""
+        results.append((severity, compass_directions[compass_index], description))
+    return results
+
+
+def main(slot_count=100000):
+    config = load_config()
+    wind_speeds = [random.uniform(0, 30) for _ in range(slot_count)]
+    wind_directions = [random.uniform(0, 360) for _ in range(slot_count)]
+
+    severities, compass_indices = classify_wind_batch(wind_speeds, wind_directions, config.units)
+    assert [(x[0], x[1]) for x in per_slot_classification(wind_speeds, wind_directions, config)] == \
+           [classify_wind(speed, direction, config.units) for speed, direction in zip(wind_speeds, wind_directions)]
+
+    report(f"per slot classification, {slot_count} slots", lambda: per_slot_classification(wind_speeds, wind_directions, config), 3)
+    report(f"classify_wind per slot, {slot_count} slots", lambda: [classify_wind(speed, direction, config.units) for speed, direction in zip(wind_speeds, wind_directions)], 3)
+    report(f"classify_wind_batch, {slot_count} slots", lambda: classify_wind_batch(wind_speeds, wind_directions, config.units), 3)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
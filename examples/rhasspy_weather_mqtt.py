@@ -9,6 +9,7 @@ import logging
 import os
 import sys
 import pytz
+import rhasspy_weather.data_types.config as cf
 import rhasspy_weather.weather as weather
 from custom_logger import custom_logger
 
@@ -49,7 +50,7 @@ def on_message(client, userdata, msg):
         elif intent.startswith("GetWeatherForecast"):
             log.info("Detected Weather Intent")
             try:
-                forecast = weather.get_weather_forecast(o, config_path="../rhasspy_weather_config.ini")
+                forecast = weather.get_weather_forecast(o)
                 print(json.dumps(o))
             except Exception as e:
                 log.error(f'Error handling intent {o}:{e}')
@@ -58,6 +59,10 @@ def on_message(client, userdata, msg):
             print(json.dumps(o))
 
 
+# changes of the config file are picked up without a restart, so the cached forecasts are kept
+cf.set_config_path("../rhasspy_weather_config.ini")
+cf.watch_config()
+
 client = mqtt.Client()
 # Insert mqtt credentials here
 client.username_pw_set(username="",password="")
@@ -24,6 +24,7 @@ slots = {
     "conditions": "list(config.locale.condition_types.keys()) + list(config.locale.condition_synonyms.keys())",
     "items": "list(config.locale.items.get_all_item_names())",
     "named_days": "list(config.locale.named_days.keys()) + list(config.locale.named_days_synonyms.keys())",
+    "named_ranges": "list(config.locale.named_ranges.keys()) + list(config.locale.named_ranges_synonyms.keys())",
     "named_times": "list(config.locale.named_times.keys()) + list(config.locale.named_times_synonyms.keys())",
     "temperatures": "list(config.locale.temperature_types.keys()) + list(config.locale.temperature_synonyms.keys())"
 }
@@ -1,40 +1,42 @@
-import datetime
 import logging
 
-import requests
-
-from rhasspy_weather.data_types.config import get_config
-from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType
+from rhasspy_weather.data_types.context import get_context
+from rhasspy_weather.data_types.condition import ConditionType, get_condition
 from rhasspy_weather.data_types.error import ErrorCode, WeatherError, ConfigError
 from rhasspy_weather.data_types.weather import Weather
-from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+from rhasspy_weather.utils import http_client
 
 log = logging.getLogger(__name__)
 
 api_key = None
+forecast_url = "http://api.openweathermap.org/data/2.5/forecast"
 
 
-def get_weather(location):
+def get_weather(location, context=None):
     """gets weather from openweathermap API and parses it
 
     Parameters:
     weather_api_key : str
         API key for openweathermap
     weather_forecast: WeatherForecast
+    context: WeatherContext, the current config is used if it is None
         
     """
+    # only needed when the forecast isn't cached
+    import requests
+
     log.debug("parsing weather from openweathermap")
-    config = get_config()
+    config = get_context(context)
 
     if hasattr(location, "lat") and hasattr(location, "lon"):
-        url_location = f"lat={location.lat}&lon={location.lon}"
+        params = {"lat": location.lat, "lon": location.lon}
     elif hasattr(location, "zipcode") and hasattr(location, "country_code"):
-        url_location = f"zip={location.zipcode},{location.country_code}"
+        params = {"zip": f"{location.zipcode},{location.country_code}"}
     else:
-        url_location = f"q={location.city}"
-    forecast_url = f"http://api.openweathermap.org/data/2.5/forecast?{url_location}&APPID={api_key}&units={config.units}&lang={config.locale.language_code}"
+        params = {"q": location.city}
+    params = {**params, "APPID": api_key, "units": config.units, "lang": config.locale.language_code}
     try:
-        response = requests.get(forecast_url)
+        response = http_client.get(forecast_url, params=params)
         response = response.json()
 
         if str(response["cod"]) == "400":
@@ -48,42 +50,44 @@ def get_weather(location):
 
         # Parse the output of Open Weather Map's forecast endpoint
         if not (hasattr(location, "lat") and hasattr(location, "lon")):
-            location.set_lat_and_lon(response["city"]["coord"]["lat"], response["city"]["coord"]["lon"])
-
-        forecasts = {}
-        for x in response["list"]:
-            if str(datetime.date.fromtimestamp(x["dt"])) not in forecasts:
-                forecasts[str(datetime.date.fromtimestamp(x["dt"]))] = \
-                    list(filter(lambda forecast: datetime.date.fromtimestamp(forecast["dt"]) == datetime.date.fromtimestamp(x["dt"]), response["list"]))
-
-        weather = Weather()
-        for key, forecast in forecasts.items():
-            condition_list = []
-            weather_condition = [x["weather"][0]["main"] for x in forecast]
-            weather_description = [x["weather"][0]["description"] for x in forecast]
-            weather_id = [x["weather"][0]["id"] for x in forecast]
-            for x in range(len(weather_condition)):
-                temp_condition = WeatherCondition(__get_severity_from_open_weather_map_id(weather_id[x]), weather_description[x], __get_condition_type(weather_id[x]))
-                condition_list.append(temp_condition)
-
-            __parse_weather(
-                weather,
-                datetime.datetime.strptime(key, "%Y-%m-%d").date(),
-                location,
-                3,
-                [datetime.datetime.strptime(x, "%H:%M:%S").time() for x in [x["dt_txt"].split(" ")[1] for x in forecast]],
-                [x["main"]["temp"] for x in forecast],
-                condition_list,
-                [x["main"]["pressure"] for x in forecast],
-                [x["main"]["humidity"] for x in forecast],
-                [x["wind"]["speed"] for x in forecast],
-                [x["wind"]["deg"] for x in forecast]
-            )
-    except (requests.exceptions.ConnectionError, ValueError):
+            location.set_resolved_lat_and_lon(response["city"]["coord"]["lat"], response["city"]["coord"]["lon"])
+
+        weather = parse_forecast(response, location, config.timezone, context=config)
+    except (requests.exceptions.RequestException, ValueError):
         raise WeatherError(ErrorCode.NO_NETWORK_ERROR, "Weather could not be fetched.")
     return weather
 
 
+def parse_forecast(response: dict, location, timezone, interval: int = 3, context=None) -> Weather:
+    """
+    Turns the json of the forecast endpoint into a Weather object in a single pass over the list of forecasts.
+    The timestamps are kept as they are, dates and times are derived from them in the configured timezone.
+
+    Args:
+        response: the decoded json answer of openweathermap
+        location: Location the forecast is for
+        timezone: timezone the dates and times of the forecasts are converted to
+        interval: hours between two forecasts
+        context: WeatherContext for the locale, the current config is used if it is None
+
+    Returns: Weather object
+
+    """
+    weather = Weather(location, interval, timezone)
+    context = get_context(context)
+    locale = context.locale
+    for forecast in response["list"]:
+        owm_weather = forecast["weather"][0]
+        owm_id = owm_weather["id"]
+        condition = get_condition(__get_severity_from_open_weather_map_id(owm_id), owm_weather["description"], __get_condition_type(owm_id), locale)
+        main = forecast["main"]
+        wind = forecast["wind"]
+        weather.add(forecast["dt"], main["temp"], condition, main["pressure"], main["humidity"], wind["speed"], wind["deg"])
+    weather.build_aggregates(context)
+    weather.get_interpolation()
+    return weather
+
+
 def parse_config(config):
     """
     Parses config options that are api specific from the config file.
@@ -93,13 +97,17 @@ def parse_config(config):
     Returns: Nothing
 
     """
-    global api_key
+    global api_key, forecast_url
     section = config.get_external_section("OpenWeatherMap")
 
     if section is not None:
         api_key = section.get("api_key")
         if api_key is None or api_key is "":
             raise ConfigError("API Error", "API is set to OpenWeatherMap yet no API-Key is found. Please refer to 'config.default' for an example config.")
+        url = section.get("url")
+        if url is not None and url != "":
+            forecast_url = url
+        http_client.parse_config(section)
 
 
 # parses the weather condition into my own format (WeatherCondition)
@@ -177,8 +185,3 @@ def __get_condition_type(owm_id):
     else:
         return ConditionType.MISC
 
-
-def __parse_weather(weather: Weather, date, location, interval, time, temperature, weather_condition_list, pressure, humidity, wind_speed, wind_direction):
-    for x in range(len(time)):
-        weather_at_time = WeatherAtTime(date, time[x], temperature[x], weather_condition_list[x], pressure[x], humidity[x], wind_speed[x], wind_direction[x], interval, location)
-        weather.add_weather(date, weather_at_time)
@@ -0,0 +1,116 @@
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+# not a forecast cache, it can't be selected with 'cache' in [General]
+# defaults, can be overwritten by parse_config
+enabled = True
+ttl = 3600
+max_entries = 256
+# reports created per key before they are reused, so the random choices of the locale still vary
+variants = 3
+
+hits = 0
+misses = 0
+
+# key -> [version, creation time, list of variants]
+__entries = OrderedDict()
+__lock = threading.Lock()
+
+
+def get(key, version):
+    """
+    Returns one of the variants of a report, once there are enough of them. Entries of another forecast
+    version or older than the ttl are dropped.
+
+    Args:
+        key: cache key built by weather.get_answer_key
+        version: version of the forecast the report is based on (its fetch time)
+
+    Returns: the variant or None if a new one has to be created
+
+    """
+    global hits, misses
+    if not enabled:
+        return None
+    with __lock:
+        entry = __entries.get(key)
+        if entry is not None:
+            if entry[0] != version or time.time() - entry[1] >= ttl:
+                del __entries[key]
+            elif len(entry[2]) >= variants:
+                __entries.move_to_end(key)
+                hits = hits + 1
+                return random.choice(entry[2])
+        misses = misses + 1
+    return None
+
+
+def put(key, version, variant):
+    """
+    Adds a variant of a report. If there are more than max_entries reports, the least recently used is dropped.
+
+    Args:
+        key: cache key built by weather.get_answer_key
+        version: version of the forecast the report is based on (its fetch time)
+        variant: the WeatherReport
+
+    Returns: Nothing
+
+    """
+    if not enabled:
+        return
+    with __lock:
+        entry = __entries.get(key)
+        if entry is None or entry[0] != version:
+            entry = [version, time.time(), []]
+            __entries[key] = entry
+        if len(entry[2]) < variants:
+            entry[2].append(variant)
+        __entries.move_to_end(key)
+        while len(__entries) > max_entries:
+            __entries.popitem(last=False)
+
+
+def clear():
+    """Removes all answers and resets the counters."""
+    global hits, misses
+    with __lock:
+        __entries.clear()
+        hits = 0
+        misses = 0
+
+
+def get_statistics() -> dict:
+    return {"hits": hits, "misses": misses, "entries": len(__entries)}
+
+
+def parse_config(config):
+    """
+    Parses the answer cache options from the optional 'Cache' section of the config file.
+
+    Args:
+        config: Config object
+
+    Returns: Nothing
+
+    """
+    global enabled, ttl, max_entries, variants
+    section = config.get_external_section("Cache", required=False)
+
+    if section is not None:
+        enabled = section.get("answers", str(enabled)).strip().lower() not in ["false", "no", "off", "0"]
+        ttl = __get_int(section, "answer_ttl", ttl)
+        max_entries = __get_int(section, "answer_max_entries", max_entries)
+        variants = max(1, __get_int(section, "answer_variants", variants))
+
+
+def __get_int(section, option, default_value):
+    value = section.get(option)
+    if value is not None and value.isnumeric():
+        return int(value)
+    return default_value
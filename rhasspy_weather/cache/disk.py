@@ -0,0 +1,139 @@
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from rhasspy_weather.data_types.weather import Weather
+
+log = logging.getLogger(__name__)
+
+# version of the table layout, the table is recreated if the file has another one
+SCHEMA_VERSION = 1
+
+# defaults, can be overwritten by parse_config
+ttl = 3600
+path = os.path.join(os.path.expanduser("~"), ".config", "rhasspy_weather", "forecast_cache.sqlite")
+
+hits = 0
+misses = 0
+
+__connection = None
+__lock = threading.Lock()
+
+
+def __get_connection() -> sqlite3.Connection:
+    global __connection
+    if __connection is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # sqlite locks the file itself, the timeout makes concurrent writers wait instead of failing
+        connection = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            log.info(f"Creating forecast cache at '{path}'")
+            connection.execute("DROP TABLE IF EXISTS forecasts")
+            connection.execute("CREATE TABLE forecasts (key TEXT PRIMARY KEY, fetch_time REAL NOT NULL, "
+                               "format_version INTEGER NOT NULL, data BLOB NOT NULL)")
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        __connection = connection
+    return __connection
+
+
+def get(key: str):
+    """
+    Returns the cached forecast for key if it is younger than the ttl and was saved with the current layout of Weather.
+
+    Args:
+        key: cache key built by weather.get_cache_key
+
+    Returns: Weather object or None
+
+    """
+    global hits, misses
+    with __lock:
+        try:
+            row = __get_connection().execute("SELECT fetch_time, format_version, data FROM forecasts WHERE key = ?",
+                                             (key,)).fetchone()
+        except sqlite3.Error as e:
+            log.error(f"Can't read forecast cache: {e}")
+            row = None
+        if row is not None and time.time() - row[0] < ttl and row[1] == Weather.format_version:
+            try:
+                weather = pickle.loads(row[2])
+                hits = hits + 1
+                log.debug(f"disk cache hit for {key}")
+                return weather
+            except (pickle.UnpicklingError, AttributeError, EOFError, ImportError) as e:
+                log.warning(f"Cached forecast for {key} could not be loaded: {e}")
+        misses = misses + 1
+    return None
+
+
+def put(key: str, weather):
+    """
+    Saves a forecast under key and removes all forecasts older than the ttl.
+
+    Args:
+        key: cache key built by weather.get_cache_key
+        weather: Weather object
+
+    Returns: Nothing
+
+    """
+    data = pickle.dumps(weather, protocol=pickle.HIGHEST_PROTOCOL)
+    with __lock:
+        try:
+            connection = __get_connection()
+            connection.execute("INSERT OR REPLACE INTO forecasts VALUES (?, ?, ?, ?)",
+                               (key, weather.fetch_time, Weather.format_version, data))
+            connection.execute("DELETE FROM forecasts WHERE fetch_time < ?", (time.time() - ttl,))
+        except sqlite3.Error as e:
+            log.error(f"Can't write forecast cache: {e}")
+
+
+def clear():
+    """Removes all forecasts and resets the counters."""
+    global hits, misses
+    with __lock:
+        __get_connection().execute("DELETE FROM forecasts")
+        hits = 0
+        misses = 0
+
+
+def close():
+    """Closes the database, it is opened again on the next access."""
+    global __connection
+    with __lock:
+        if __connection is not None:
+            __connection.close()
+            __connection = None
+
+
+def get_statistics() -> dict:
+    with __lock:
+        entries = __get_connection().execute("SELECT COUNT(*) FROM forecasts").fetchone()[0]
+    return {"hits": hits, "misses": misses, "entries": entries}
+
+
+def parse_config(config):
+    """
+    Parses the cache options from the optional 'Cache' section of the config file.
+
+    Args:
+        config: Config object
+
+    Returns: Nothing
+
+    """
+    global ttl, path
+    section = config.get_external_section("Cache", required=False)
+
+    if section is not None:
+        value = section.get("ttl")
+        if value is not None and value.isnumeric():
+            ttl = int(value)
+        value = section.get("path")
+        if value is not None and value != "" and os.path.expanduser(value) != path:
+            close()
+            path = os.path.expanduser(value)
@@ -0,0 +1,96 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+log = logging.getLogger(__name__)
+
+# defaults, can be overwritten by parse_config
+ttl = 3600
+max_entries = 32
+
+hits = 0
+misses = 0
+
+__entries = OrderedDict()
+__lock = threading.Lock()
+
+
+def get(key: str):
+    """
+    Returns the cached forecast for key if it is younger than the ttl. Expired forecasts are dropped.
+
+    Args:
+        key: cache key built by weather.get_cache_key
+
+    Returns: Weather object or None
+
+    """
+    global hits, misses
+    with __lock:
+        weather = __entries.get(key)
+        if weather is not None:
+            if time.time() - weather.fetch_time < ttl:
+                __entries.move_to_end(key)
+                hits = hits + 1
+                log.debug(f"memory cache hit for {key}")
+                return weather
+            del __entries[key]
+        misses = misses + 1
+    return None
+
+
+def put(key: str, weather):
+    """
+    Saves a forecast under key. If there are more than max_entries forecasts, the least recently used is dropped.
+
+    Args:
+        key: cache key built by weather.get_cache_key
+        weather: Weather object
+
+    Returns: Nothing
+
+    """
+    with __lock:
+        __entries[key] = weather
+        __entries.move_to_end(key)
+        while len(__entries) > max_entries:
+            __entries.popitem(last=False)
+
+
+def clear():
+    """Removes all forecasts and resets the counters."""
+    global hits, misses
+    with __lock:
+        __entries.clear()
+        hits = 0
+        misses = 0
+
+
+def get_statistics() -> dict:
+    return {"hits": hits, "misses": misses, "entries": len(__entries)}
+
+
+def parse_config(config):
+    """
+    Parses the cache options from the optional 'Cache' section of the config file.
+
+    Args:
+        config: Config object
+
+    Returns: Nothing
+
+    """
+    global ttl, max_entries
+    section = config.get_external_section("Cache", required=False)
+
+    if section is not None:
+        ttl = __get_int(section, "ttl", ttl)
+        max_entries = __get_int(section, "max_entries", max_entries)
+
+
+def __get_int(section, option, default_value):
+    value = section.get(option)
+    if value is not None and value.isnumeric():
+        return int(value)
+    return default_value
@@ -0,0 +1,45 @@
+import math
+
+
+class WeatherAggregate:
+    """
+    Summary of a number of forecast slots: minimum and maximum values, the most severe condition of every condition
+    type and how often each condition type occurs.
+    """
+    def __init__(self):
+        self.count = 0
+        self.min_temperature = math.inf
+        self.max_temperature = -math.inf
+        self.min_pressure = math.inf
+        self.max_pressure = -math.inf
+        self.min_humidity = math.inf
+        self.max_humidity = -math.inf
+        # condition type -> most severe condition of that type
+        self.__conditions = {}
+        self.condition_counts = {}
+
+    def __str__(self):
+        return f"[count: {self.count}, min_temp: {self.min_temperature}, max_temp: {self.max_temperature}, conditions: {self.conditions}]"
+
+    __repr__ = __str__
+
+    def add_conditions(self, weather_at_time):
+        """
+        Adds the conditions of a WeatherAtTime to the summary. The minimum and maximum values are not updated, they
+        are set from the range queries of Weather.
+        """
+        self.count = self.count + 1
+        for condition in [weather_at_time.main_condition] + weather_at_time.other_conditions:
+            self.add_condition(condition)
+
+    def add_condition(self, condition):
+        """keeps the most severe condition of each type and counts how often the type occurs"""
+        kept = self.__conditions.get(condition.condition_type)
+        if kept is None or condition.severity > kept.severity:
+            self.__conditions[condition.condition_type] = condition
+        self.condition_counts[condition.condition_type] = self.condition_counts.get(condition.condition_type, 0) + 1
+
+    @property
+    def conditions(self):
+        """the most severe condition of every type, in the order the types first occurred"""
+        return list(self.__conditions.values())
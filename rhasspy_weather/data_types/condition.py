@@ -1,8 +1,8 @@
+from array import array
 from enum import Enum
 
 from rhasspy_weather.data_types.config import get_config
 from rhasspy_weather.data_types.weather_type import WeatherType
-from rhasspy_weather.utils.utils import normal_round
 
 
 class ConditionType(WeatherType, Enum):
@@ -17,44 +17,197 @@ class ConditionType(WeatherType, Enum):
     STARS = "stars"  # clear during night
 
 
+compass_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+
+# shared instances returned by get_condition and get_wind_condition
+__conditions = {}
+
+
 class WeatherCondition:
-    def __init__(self, severity, description, condition_type: ConditionType):
-        self.severity = severity
-        self.description = description
-        if description == "":
-            try:
-                self.description = get_config().locale.conditions[condition_type][severity]
-            except KeyError:
-                self.description = ""
-        self.condition_type = condition_type
+    """
+    Immutable weather condition. Use get_condition to get a shared instance instead of creating a new one for every
+    forecast slot.
+    """
+    __slots__ = ("__severity", "__description", "__condition_type")
+
+    def __init__(self, severity, description, condition_type: ConditionType, locale=None):
+        self.__severity = severity
+        self.__description = description if description != "" else get_description(condition_type, severity, locale)
+        self.__condition_type = condition_type
 
     def __eq__(self, other):
         return self.condition_type == other.condition_type and self.severity == other.severity
 
+    def __hash__(self):
+        return hash((self.condition_type, self.severity))
+
     def __str__(self):
         return "[" + str(self.condition_type) + ", " + str(self.severity) + ", " + str(self.description) + "]"
 
     def __repr__(self):
         return "[" + str(self.condition_type) + ", " + str(self.severity) + ", " + str(self.description) + "]"
 
+    @property
+    def severity(self):
+        return self.__severity
+
+    @property
+    def description(self):
+        return self.__description
+
+    @property
+    def condition_type(self):
+        return self.__condition_type
+
 
 class WindCondition(WeatherCondition):
-    def __init__(self, wind_speed, wind_direction):
+    __slots__ = ("__wind_direction",)
+
+    def __init__(self, wind_speed, wind_direction, config=None):
+        if config is None:
+            config = get_config()
+        severity, compass_direction = classify_wind(wind_speed, wind_direction, config.units)
+        self.__wind_direction = compass_direction
+        super().__init__(severity, "", ConditionType.WIND, config.locale)
+
+    @classmethod
+    def from_classification(cls, severity, compass_direction, locale=None):
+        """creates a WindCondition from the results of classify_wind or classify_wind_batch"""
+        condition = cls.__new__(cls)
+        condition.__wind_direction = compass_direction
+        WeatherCondition.__init__(condition, severity, "", ConditionType.WIND, locale)
+        return condition
+
+    @property
+    def wind_direction(self):
+        """compass direction the wind is coming from"""
+        return self.__wind_direction
+
+
+def get_description(condition_type: ConditionType, severity, locale=None) -> str:
+    """
+    Looks up the description of a condition in the locale.
+
+    Args:
+        condition_type: the ConditionType
+        severity: the severity
+        locale: the locale module, the locale of the config is used if it is None
+
+    Returns:
+        the description or an empty string if the locale has none
+
+    """
+    if locale is None:
+        locale = get_config().locale
+    try:
+        return locale.conditions[condition_type][severity]
+    except KeyError:
+        return ""
+
+
+def classify_wind(wind_speed, wind_direction, units="metric"):
+    """
+    Converts wind speed and direction to a severity (beaufort) and a compass direction. classify_wind_batch does
+    the same for whole columns.
+
+    Args:
+        wind_speed: wind speed in m/s or mph for imperial units
+        wind_direction: wind direction in degrees
+        units: the units set in the config
+
+    Returns:
+        tuple of severity and compass direction
+
+    """
+    if units == "imperial":
+        wind_speed = wind_speed / 2.237
+    severity = int((wind_speed / 0.836) * (2 / 3) + 0.5)
+    return severity, compass_directions[int(wind_direction / 45 + 0.5) % 8]
+
+
+def classify_wind_batch(wind_speeds, wind_directions, units="metric"):
+    """
+    Converts wind speeds and directions of a whole forecast to severities (beaufort) and indices of
+    compass_directions, with one pass over each column.
+
+    Args:
+        wind_speeds: sequence of wind speeds in m/s or mph for imperial units
+        wind_directions: sequence of wind directions in degrees
+        units: the units set in the config
+
+    Returns:
+        tuple of two arrays: severities and compass indices
+
+    """
+    # same arithmetic as utils.normal_round((speed / 0.836) * (2 / 3)) for non negative speeds
+    if units == "imperial":
+        severities = array("B", [int((x / 2.237 / 0.836) * (2 / 3) + 0.5) for x in wind_speeds])
+    else:
+        severities = array("B", [int((x / 0.836) * (2 / 3) + 0.5) for x in wind_speeds])
+    compass_indices = array("B", [int(x / 45 + 0.5) % 8 for x in wind_directions])
+    return severities, compass_indices
+
+
+def get_condition(severity, description, condition_type: ConditionType, locale=None) -> WeatherCondition:
+    """
+    Returns the shared WeatherCondition for these values, it is created on first use. The description is looked up
+    in the locale if it is empty.
+
+    Args:
+        severity: the severity
+        description: the description or an empty string
+        condition_type: the ConditionType
+        locale: the locale module for the description, the locale of the config is used if it is None
+
+    Returns:
+        the WeatherCondition
+
+    """
+    if description == "" and locale is None:
+        locale = get_config().locale
+    key = (condition_type, severity, description, locale if description == "" else None)
+    condition = __conditions.get(key)
+    if condition is None:
+        condition = __conditions.setdefault(key, WeatherCondition(severity, description, condition_type, locale))
+    return condition
+
+
+def get_wind_condition(wind_speed, wind_direction, config=None) -> WindCondition:
+    """
+    Returns the shared WindCondition for a wind speed and direction, it is created on first use.
+
+    Args:
+        wind_speed: wind speed in the units set in the config
+        wind_direction: wind direction in degrees
+        config: the config for units and locale, the current config is used if it is None
+
+    Returns:
+        the WindCondition
+
+    """
+    if config is None:
         config = get_config()
-        if config.units == "imperial":
-            wind_speed = wind_speed / 2.237
-        severity = normal_round((wind_speed / 0.836) * (2 / 3))
+    severity, compass_direction = classify_wind(wind_speed, wind_direction, config.units)
+    return get_classified_wind_condition(severity, compass_direction, config.locale)
+
 
-        compass_index = int((wind_direction / 45) + 0.5) % 8
-        compass_directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+def get_classified_wind_condition(severity, compass_direction, locale=None) -> WindCondition:
+    """
+    Returns the shared WindCondition for a severity and compass direction, like the results of classify_wind_batch.
 
-        self.wind_speed = wind_speed
-        self.wind_direction = compass_directions[compass_index]
+    Args:
+        severity: the severity (beaufort)
+        compass_direction: the compass direction, one of compass_directions
+        locale: the locale module for the description, the locale of the config is used if it is None
 
-        description = ""
-        try:
-            self.description = config.locale.conditions[ConditionType.WIND][severity]
-        except KeyError:
-            self.description = ""
-        super().__init__(severity, description, ConditionType.WIND)
+    Returns:
+        the WindCondition
 
+    """
+    if locale is None:
+        locale = get_config().locale
+    key = (ConditionType.WIND, severity, compass_direction, locale)
+    condition = __conditions.get(key)
+    if condition is None:
+        condition = __conditions.setdefault(key, WindCondition.from_classification(severity, compass_direction, locale))
+    return condition
@@ -1,16 +1,29 @@
 import configparser
+import hashlib
+import itertools
 import logging
 import os
+import pickle
+import threading
 from pathlib import Path
 
 import pytz
 
+from rhasspy_weather.cache import answers
 from rhasspy_weather.data_types.error import ConfigError
 from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.utils.answer_template import compile_locale
+from rhasspy_weather.utils.locale_index import get_locale_index
 
 log = logging.getLogger(__name__)
 config_path = os.path.join(str(Path(__file__).parent.parent.parent), 'config.ini')
 
+# every WeatherConfig gets the next number, reports are cached per config (see weather.get_answer_key)
+generations = itertools.count(1)
+
+# snapshots of loaded configs, see load_snapshot
+snapshot_path = os.path.join(os.path.expanduser("~"), ".config", "rhasspy_weather", "snapshots")
+
 config_sections = {
     "General": "__parse_section_general",
     "Weather": "__parse_section_weather",
@@ -20,12 +33,21 @@ config_sections = {
 
 class WeatherConfig:
 
-    def __init__(self, current_config_path):
+    def __init__(self, current_config_path, snapshot: dict = None, apply_settings: bool = True):
+        """
+        Args:
+            current_config_path: path of the config file
+            snapshot: optional snapshot of the config file (see get_snapshot), it is used instead of reading the file
+            apply_settings: if False the settings of the api, output and cache modules are not applied (see
+                apply_settings), so creating the config has no effect on the modules
+        """
         log.info("Loading config")
 
+        self.generation = next(generations)
         self.__api = None
         self.__parser = None
         self.__output = None
+        self.__cache = None
         self.__output_template = None
         self.output_template_name = None
         self.units = None
@@ -39,13 +61,33 @@ class WeatherConfig:
         self.location = None
 
         self.__config_parser = configparser.ConfigParser(allow_no_value=True)
-        self.__config_parser.read(current_config_path)
-
-        for section, function_string in config_sections.items():
-            getattr(self, "_WeatherConfig" + function_string)(self.__config_parser[section])
+        if snapshot is not None:
+            self.__config_parser.read_dict(snapshot["sections"])
+            self.__load_snapshot(snapshot)
+        else:
+            self.__config_parser.read(current_config_path)
+            for section, function_string in config_sections.items():
+                getattr(self, "_WeatherConfig" + function_string)(self.__config_parser[section])
+        if apply_settings:
+            self.apply_settings()
 
         log.info("Config Loaded")
 
+    def apply_settings(self):
+        """
+        Passes the config to parse_config of the api, output and cache modules, which keep the options of their
+        sections in module globals and validate them.
+
+        Raises:
+            ConfigError: an option of one of the modules is invalid, the modules before it already use the new options
+        """
+        self.__api.parse_config(self)
+        for output_item in self.__output:
+            output_item.parse_config(self)
+        for cache_item in self.__cache:
+            cache_item.parse_config(self)
+        answers.parse_config(self)
+
     def __parse_section_general(self, section):
         if section is None:
             log.error(f"Required section {section} is missing. Please refer to 'config.default' for an example config.")
@@ -56,6 +98,7 @@ class WeatherConfig:
         self.parser = self.__get_option_with_default_value(section, "parser", "rhasspy_intent")
         self.output = self.__get_option_with_default_value(section, "output", "console_json").split(" ")
         self.output_template = self.__get_option_with_default_value(section, "output_template", "rhasspy.json")
+        self.cache = self.__get_option_with_default_value(section, "cache", "memory").split(" ")
         self.timezone = pytz.timezone(self.__get_option_with_default_value(section, "timezone", "Europe/Berlin"))
 
     def __parse_section_weather(self, section):
@@ -71,10 +114,51 @@ class WeatherConfig:
             log.error(f"Required section {section} is missing. Please refer to 'config.default' for an example config.")
         self.location = Location(self.__get_option_with_default_value(section, "city", "Berlin"), section.get("zipcode"), section.get("country_code"), section.get("lat"), section.get("lon"))
 
-    def get_external_section(self, section_name):
+    def __load_snapshot(self, snapshot: dict):
+        # the values were validated when the snapshot was created, only the modules are imported again
+        self.locale = snapshot["locale"]
+        self.units = snapshot["units"]
+        self.api = snapshot["api"]
+        self.parser = snapshot["parser"]
+        self.output = snapshot["output"]
+        self.__output_template = snapshot["output_template"]
+        self.output_template_name = snapshot["output_template_name"]
+        self.cache = snapshot["cache"]
+        self.timezone = pytz.timezone(snapshot["timezone"])
+        self.temperature_warm_from = snapshot["temperature_warm_from"]
+        self.temperature_cold_to = snapshot["temperature_cold_to"]
+        self.detail = snapshot["detail"]
+        self.location = Location(*snapshot["location"])
+
+    def get_snapshot(self) -> dict:
+        """
+        The resolved and validated values of the config, with the module names instead of the modules and the text
+        of the output template. A WeatherConfig created from it doesn't need to read the config file again.
+
+        Returns: dict that can be pickled
+        """
+        section = self.__config_parser["Location"]
+        return {
+            "sections": {name: dict(self.__config_parser.items(name, raw=True)) for name in self.__config_parser.sections()},
+            "locale": self.__module_name(self.locale),
+            "units": self.units,
+            "api": self.__module_name(self.api),
+            "parser": self.__module_name(self.parser),
+            "output": [self.__module_name(x) for x in self.output],
+            "output_template": self.output_template,
+            "output_template_name": self.output_template_name,
+            "cache": [self.__module_name(x) for x in self.cache],
+            "timezone": self.timezone.zone,
+            "temperature_warm_from": self.temperature_warm_from,
+            "temperature_cold_to": self.temperature_cold_to,
+            "detail": self.detail,
+            "location": (self.location.city, section.get("zipcode"), section.get("country_code"), section.get("lat"), section.get("lon"))
+        }
+
+    def get_external_section(self, section_name, required=True):
         if self.__config_parser.has_section(section_name):
             return self.__config_parser[section_name]
-        else:
+        elif required:
             log.error(f"The section {section_name} is missing but required.")
 
     @property
@@ -89,7 +173,6 @@ class WeatherConfig:
             self.__api = __import__("rhasspy_weather.api." + val, fromlist=[''])
         except ImportError:
             raise ConfigError("No api found", "There is no module in the api folder that matches the api name in your config.")
-        self.__api.parse_config(self)
 
     @property
     def parser(self):
@@ -117,8 +200,23 @@ class WeatherConfig:
                 log.error(f"Selected output '{output_module}' not found.")
         if len(self.__output) == 0:
             raise ConfigError("No output found", "There is no module in the output folder that matches one of the output names in your config.")
-        for output_item in self.__output:
-            output_item.parse_config(self)
+
+    @property
+    def cache(self):
+        return self.__cache
+
+    @cache.setter
+    def cache(self, val):
+        self.__cache = []
+        for cache_name in [x for x in val if x != ""]:
+            cache_module = "rhasspy_weather.cache." + cache_name
+            if cache_name == "answers":
+                log.error("'answers' caches answers, not forecasts, it is configured in [Cache].")
+                continue
+            try:
+                self.__cache.append(__import__(cache_module, fromlist=['']))
+            except ImportError:
+                log.error(f"Selected cache '{cache_module}' not found.")
 
     @property
     def output_template(self):
@@ -140,10 +238,16 @@ class WeatherConfig:
     @locale.setter
     def locale(self, val):
         try:
-            self.__locale = __import__("rhasspy_weather.languages." + val, fromlist=[''])
+            locale = compile_locale(__import__("rhasspy_weather.languages." + val, fromlist=['']))
+            get_locale_index(locale)
+            self.__locale = locale
         except ImportError:
             raise ConfigError("No locale found", "There is no module in the locale folder that matches the locale name in your config.")
 
+    @staticmethod
+    def __module_name(module) -> str:
+        return module.__name__.rsplit(".", 1)[-1]
+
     @staticmethod
     def __get_option_with_default_value(section: configparser.SectionProxy, option, default_value, data_type: str = ""):
         if section is not None and option in section:
@@ -168,31 +272,47 @@ class WeatherConfig:
 
 
 __config = None
+# key (see __get_snapshot_key) of the files the current config was loaded from
+__config_key = None
+__config_lock = threading.Lock()
+
+__watcher = None
+__watcher_stop = threading.Event()
 
 
 def get_config():
     global __config
     global config_path
     if __config is None:
-        rhasspy_weather_path = str(Path(__file__).parent.parent.parent)
-        home_path = os.path.join(os.path.expanduser("~"), ".config", "rhasspy_weather")
-        config_names = ["rhasspy_weather_config.ini", "config.ini", "rhasspy_weather.ini"]
-        if os.path.exists(config_path):
-            __config = WeatherConfig(config_path)
-        else:
-            log.warning(f"Config not found at '{config_path}'. Searching elsewhere.")
-            for loc in rhasspy_weather_path, home_path:
-                for config_name in config_names:
-                    tmp_config_path = os.path.join(loc, config_name)
-                    if os.path.exists(tmp_config_path):
-                        config_path = tmp_config_path
-                        __config = WeatherConfig(config_path)
-        if __config is None:
-            message = f"No config file found in '{rhasspy_weather_path}' or '{home_path}'. Please copy config.default into one of those paths and rename it to one of {str(config_names)}"
-            raise ConfigError("No config found", message)
+        with __config_lock:
+            if __config is None:
+                __config = __find_and_load_config()
     return __config
 
 
+def __find_and_load_config() -> WeatherConfig:
+    global config_path, __config_key
+    config = None
+    rhasspy_weather_path = str(Path(__file__).parent.parent.parent)
+    home_path = os.path.join(os.path.expanduser("~"), ".config", "rhasspy_weather")
+    config_names = ["rhasspy_weather_config.ini", "config.ini", "rhasspy_weather.ini"]
+    if os.path.exists(config_path):
+        config = load_config(config_path)
+    else:
+        log.warning(f"Config not found at '{config_path}'. Searching elsewhere.")
+        for loc in rhasspy_weather_path, home_path:
+            for config_name in config_names:
+                tmp_config_path = os.path.join(loc, config_name)
+                if os.path.exists(tmp_config_path):
+                    config_path = tmp_config_path
+                    config = load_config(config_path)
+    if config is None:
+        message = f"No config file found in '{rhasspy_weather_path}' or '{home_path}'. Please copy config.default into one of those paths and rename it to one of {str(config_names)}"
+        raise ConfigError("No config found", message)
+    __config_key = __get_snapshot_key(config_path, config.output_template_name)
+    return config
+
+
 def set_config_path(new_config_path: str):
     global config_path, __config
     if os.path.exists(new_config_path):
@@ -200,3 +320,194 @@ def set_config_path(new_config_path: str):
         __config = None
     else:
         log.warning(f"Config at {new_config_path} not found.")
+
+
+def reload_config() -> bool:
+    """
+    Loads the config file again if it or the output template changed since the current config was loaded and swaps
+    the new config in for all following requests. The new config is created without touching the module settings,
+    they are applied when it is swapped in. If the new config is invalid the current one is kept and its module
+    settings are applied again.
+
+    The entry points in weather.py create one WeatherContext per request and pass it down, requests that already
+    started keep using its config. Functions called without a context or config use the one that is current at
+    that moment.
+
+    Forecast caches are kept, their keys contain everything that changes a forecast. Cached reports are kept apart
+    by the generation of their config (see weather.get_answer_key), so reports that requests with the old config
+    add after the reload are never used for the new one. The reports of the old config are dropped to free memory.
+
+    Returns: True if a new config was swapped in
+
+    """
+    global __config, __config_key
+    with __config_lock:
+        if __config is None:
+            return False
+        path = config_path
+        try:
+            key = __get_snapshot_key(path, __config.output_template_name)
+        except OSError as e:
+            log.warning(f"Config '{path}' can't be checked: {e}")
+            return False
+        if key == __config_key:
+            return False
+        try:
+            config = load_config(path, apply_settings=False)
+            key = __get_snapshot_key(path, config.output_template_name)
+        except (ConfigError, KeyError, ValueError, OSError, configparser.Error) as e:
+            log.error(f"Config '{path}' changed but can't be loaded, keeping the current one: {e}")
+            __config_key = key
+            return False
+        __config_key = key
+        if config.get_snapshot() == __config.get_snapshot():
+            return False
+        try:
+            config.apply_settings()
+        except (ConfigError, KeyError, ValueError, OSError, configparser.Error) as e:
+            log.error(f"Config '{path}' changed but is invalid, keeping the current one: {e}")
+            __config.apply_settings()
+            return False
+        __config = config
+    # only frees memory, entries the old config adds afterwards are never hit again and drop out of the cache
+    answers.clear()
+    log.info(f"Config '{path}' reloaded")
+    return True
+
+
+def watch_config(interval: float = 5.0):
+    """
+    Starts a daemon thread that calls reload_config every interval seconds, for long running processes that should
+    pick up changes of the config file without a restart. Does nothing if the thread is already running.
+
+    Args:
+        interval: seconds between two checks of the config file
+
+    Returns: Nothing
+
+    """
+    global __watcher
+    if __watcher is not None and __watcher.is_alive():
+        return
+    __watcher_stop.clear()
+    __watcher = threading.Thread(target=__watch_config, args=(interval,), name="rhasspy_weather config watcher",
+                                 daemon=True)
+    __watcher.start()
+
+
+def stop_watching_config():
+    """Stops the thread started by watch_config and waits for it to end."""
+    global __watcher
+    __watcher_stop.set()
+    if __watcher is not None:
+        __watcher.join()
+        __watcher = None
+
+
+def __watch_config(interval: float):
+    while not __watcher_stop.wait(interval):
+        try:
+            reload_config()
+        except Exception:
+            log.exception("Config could not be reloaded")
+
+
+def load_config(path: str, apply_settings: bool = True) -> WeatherConfig:
+    """
+    Loads a config file, from its snapshot if the file hasn't changed since the snapshot was saved. Otherwise the file
+    is parsed and a new snapshot is saved, unless 'config_snapshot' in [Cache] is turned off.
+
+    Args:
+        path: path of the config file
+        apply_settings: if False the settings of the api, output and cache modules are left alone, see
+            WeatherConfig.apply_settings
+
+    Returns: WeatherConfig
+
+    """
+    snapshot = load_snapshot(path)
+    if snapshot is not None:
+        try:
+            return WeatherConfig(path, snapshot, apply_settings)
+        except (ConfigError, KeyError, OSError) as e:
+            log.warning(f"Config snapshot of '{path}' could not be used: {e}")
+    config = WeatherConfig(path, apply_settings=apply_settings)
+    section = config.get_external_section("Cache", required=False)
+    if section is None or section.get("config_snapshot", "True").strip().lower() not in ["false", "no", "off", "0"]:
+        save_snapshot(path, config)
+    else:
+        remove_snapshot(path)
+    return config
+
+
+def load_snapshot(path: str):
+    """
+    Reads the snapshot of a config file. It is only returned if the config file, the output template and this module
+    still have the size and modification time they had when it was saved, so an update of the package makes it
+    invalid.
+
+    Args:
+        path: path of the config file
+
+    Returns: the snapshot as dict or None
+
+    """
+    try:
+        with open(__get_snapshot_file(path), "rb") as snapshot_file:
+            key, snapshot = pickle.load(snapshot_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    try:
+        if key != __get_snapshot_key(path, snapshot["output_template_name"]):
+            log.info(f"Config '{path}' changed since its snapshot was saved")
+            return None
+    except (OSError, KeyError):
+        return None
+    return snapshot
+
+
+def save_snapshot(path: str, config: WeatherConfig):
+    """
+    Saves the snapshot of a loaded config file. The file is replaced atomically, so a process starting at the same
+    time reads either the old or the new snapshot.
+
+    Args:
+        path: path of the config file
+        config: the config loaded from it
+
+    Returns: Nothing
+
+    """
+    snapshot_file = __get_snapshot_file(path)
+    temporary_file = f"{snapshot_file}.{os.getpid()}"
+    try:
+        os.makedirs(snapshot_path, exist_ok=True)
+        with open(temporary_file, "wb") as output:
+            pickle.dump((__get_snapshot_key(path, config.output_template_name), config.get_snapshot()), output,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file, snapshot_file)
+    except OSError as e:
+        log.warning(f"Config snapshot could not be saved: {e}")
+
+
+def remove_snapshot(path: str):
+    try:
+        os.remove(__get_snapshot_file(path))
+    except OSError:
+        pass
+
+
+def __get_snapshot_file(path: str) -> str:
+    name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    return os.path.join(snapshot_path, name + ".pickle")
+
+
+def __get_snapshot_key(path: str, output_template_name: str) -> tuple:
+    # this module is part of the key, snapshots of another version of the package (other defaults, attributes or
+    # format of the snapshot) are not used
+    template_path = os.path.join(str(Path(__file__).parent.parent), "output_templates", output_template_name)
+    module_stat = os.stat(__file__)
+    config_stat = os.stat(path)
+    template_stat = os.stat(template_path)
+    return (module_stat.st_mtime_ns, module_stat.st_size, os.path.abspath(path), config_stat.st_mtime_ns,
+            config_stat.st_size, template_stat.st_mtime_ns, template_stat.st_size)
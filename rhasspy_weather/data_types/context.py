@@ -0,0 +1,67 @@
+import datetime
+import time
+
+from rhasspy_weather.cache import answers
+from rhasspy_weather.data_types.config import get_config
+
+
+class WeatherContext:
+    """
+    Everything one request is answered with: the config, the locale, the clock and the caches. It is created once
+    per request by the entry points in weather.py and passed down, so the pipeline doesn't look up the global config
+    again and several configs can be used side by side.
+
+    Options that are not set on the context are looked up in its config, so a context can be passed wherever a
+    config is expected.
+    Attributes:
+    config : WeatherConfig
+    locale : module
+        the locale module, the locale of the config unless another one was given
+    units : str
+    timezone : tzinfo
+    clock : callable
+        returns the current time as a unix timestamp, time.time unless another one was given
+    cache : list
+        forecast cache modules
+    answer_cache : module
+        cache of reports, the templates are filled per request
+    """
+    def __init__(self, config=None, locale=None, clock=None, cache=None, answer_cache=None):
+        if config is None:
+            config = get_config()
+        self.config = config
+        self.locale = locale if locale is not None else config.locale
+        self.units = config.units
+        self.timezone = config.timezone
+        self.clock = clock if clock is not None else time.time
+        self.cache = cache if cache is not None else config.cache
+        self.answer_cache = answer_cache if answer_cache is not None else answers
+
+    def __getattr__(self, name):
+        # only called for attributes the context doesn't have itself
+        if name == "config":
+            raise AttributeError(name)
+        return getattr(self.config, name)
+
+    def now(self) -> datetime.datetime:
+        """current time in the timezone of the config"""
+        return datetime.datetime.fromtimestamp(self.clock(), self.timezone)
+
+    def today(self) -> datetime.date:
+        """current date in the timezone of the config"""
+        return self.now().date()
+
+
+def get_context(context=None) -> WeatherContext:
+    """
+    Compatibility shim for functions with an optional context.
+
+    Args:
+        context: a WeatherContext, a config or None for the current config
+
+    Returns: the context itself or a new WeatherContext of the config
+
+    """
+    if isinstance(context, WeatherContext):
+        return context
+    return WeatherContext(context)
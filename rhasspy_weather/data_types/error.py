@@ -18,6 +18,7 @@ class ErrorCode(Enum):
     CONFIG_ERROR = "config_error"
     TIME_ERROR = "time_error"
     GENERAL_ERROR = "general_error"
+    ITEM_ERROR = "item_error"
     MQTT_CONNECTION_ERROR = "mqtt_error"
 
 
@@ -26,14 +27,35 @@ class Error(Exception):
 
 
 class WeatherError(Error):
-    def __init__(self, error_code: ErrorCode, description: str = ""):
-        from rhasspy_weather.data_types.config import get_config
-        locale = get_config().locale
+    def __init__(self, error_code: ErrorCode, description: str = "", locale=None):
         self.description = description
         self.error_code = error_code
-        self.message = random.choice(locale.status_response[error_code])
+        # without a locale the message is chosen when the answer is filled in, in the locale of the request
+        self.__message = None if locale is None else random.choice(locale.status_response[error_code])
         log.error(description)
 
+    @property
+    def message(self) -> str:
+        return self.get_message()
+
+    def get_message(self, locale=None) -> str:
+        """
+        The answer to the error, it is chosen once from the status responses of the locale.
+
+        Args:
+            locale: the locale module, the locale of the current config is used if it is None and the error was
+                created without one
+
+        Returns: the message
+
+        """
+        if self.__message is None:
+            if locale is None:
+                from rhasspy_weather.data_types.config import get_config
+                locale = get_config().locale
+            self.__message = random.choice(locale.status_response[self.error_code])
+        return self.__message
+
 
 class ConfigError(Error):
     def __init__(self, message: str, description: str = ""):
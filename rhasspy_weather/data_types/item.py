@@ -11,13 +11,16 @@ class NounType(Enum):
 
 
 class WeatherItem:
-    def __init__(self, name: str, noun_type: NounType = NounType.SINGULAR, article: str = "", weather_type_list: List[WeatherType] = None):
+    def __init__(self, name: str, noun_type: NounType = NounType.SINGULAR, article: str = "", weather_type_list: List[WeatherType] = None,
+                 variant_of: str = None):
         if weather_type_list is None:
             weather_type_list = []
         self.name = name
         self.noun_type = noun_type
         self.article = article
         self.weather_types = weather_type_list
+        # name of the item this is another wording of, like "pair of gloves" for "gloves"
+        self.variant_of = variant_of
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -35,8 +38,14 @@ class WeatherItem:
     def is_for_weather_type(self, weather_type: WeatherType):
         return weather_type in self.weather_types
 
-    def format_for_output(self, sentence="{article} {noun} {verb}"):
-        from rhasspy_weather.data_types.config import get_config
-        locale = get_config().locale
+    def format_for_output(self, sentence="{article} {noun} {verb}", locale=None):
+        from rhasspy_weather.utils.answer_template import compile_answer
 
-        return utils.remove_excessive_whitespaces(sentence.format(article=self.article, noun=self.name, verb=locale.grammar[self.noun_type], when="{when}", where="{where}", weather="{weather}"))
+        if locale is None:
+            from rhasspy_weather.data_types.config import get_config
+            locale = get_config().locale
+        return utils.remove_excessive_whitespaces(compile_answer(sentence).render(**self.get_template_values(locale)))
+
+    def get_template_values(self, locale) -> dict:
+        """values for the {article}, {noun} and {verb} placeholders of locale answers"""
+        return {"article": self.article, "noun": self.name, "verb": locale.grammar[self.noun_type]}
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Iterable
 
 from rhasspy_weather.data_types.item import WeatherItem, NounType
 from rhasspy_weather.data_types.weather_type import WeatherType
@@ -7,9 +7,16 @@ items = None
 
 
 class WeatherItemList:
+    """
+    Items of a locale in the order they were added, indexed by name and by weather type. The first item added with a
+    name wins, later ones with the same name are ignored. Items can be marked as another wording of an item (variant_of),
+    they can be asked for but are not listed by get_items_for_weather_types.
+    """
 
     def __init__(self):
         self.__items = []
+        self.__items_by_name = {}
+        self.__items_by_weather_type = {}
         global items
         items = self
 
@@ -25,33 +32,43 @@ class WeatherItemList:
 
     __repr__ = __str__
 
-    def add_item(self, name: str, noun_type: NounType, weather_list: List[WeatherType], article: str = ""):
-        item = WeatherItem(name, noun_type, article, weather_list)
-        if item not in self.__items:
-            self.__items.append(item)
+    def add_item(self, name: str, noun_type: NounType, weather_list: List[WeatherType], article: str = "", variant_of: str = None):
+        if name in self.__items_by_name:
+            return
+        item = WeatherItem(name, noun_type, article, weather_list, variant_of)
+        self.__items.append(item)
+        self.__items_by_name[name] = item
+        for weather_type in dict.fromkeys(weather_list):
+            self.__items_by_weather_type.setdefault(weather_type, []).append(item)
 
     def get_items_for_weather(self, weather_type: WeatherType):
-        output = []
-        for item in self.__items:
-            if item.is_for_weather_type(weather_type):
-                output.append(item)
-        return output
+        return list(self.__items_by_weather_type.get(weather_type, []))
 
     def get_item_names_for_weather(self, weather_type: WeatherType):
-        output = []
-        for item in self.__items:
-            if item.is_for_weather_type(weather_type):
-                output.append(item.name)
-        return output
+        return [item.name for item in self.__items_by_weather_type.get(weather_type, [])]
+
+    def get_items_for_weather_types(self, weather_types: Iterable[WeatherType]) -> List[WeatherItem]:
+        """
+        Items that are useful for at least one of the weather types, without the variants of other items
+
+        Args:
+            weather_types: the weather types, e.g. those of a forecast
+
+        Returns: the items in the order they were added, each item once
+
+        """
+        found = set()
+        for weather_type in weather_types:
+            found.update(item.name for item in self.__items_by_weather_type.get(weather_type, []) if item.variant_of is None)
+        if not found:
+            return []
+        return [item for item in self.__items if item.name in found]
 
     def is_in_list(self, item_name: str):
-        item = WeatherItem(item_name)
-        return item in self.__items
+        return item_name in self.__items_by_name
 
     def get_item(self, item_name: str):
-        if self.is_in_list(item_name):
-            item = WeatherItem(item_name)
-            return self.__items[self.__items.index(item)]
+        return self.__items_by_name.get(item_name)
 
     def get_all_item_names(self):
         return [i.name for i in self.__items]
@@ -1,32 +1,83 @@
+import datetime
+from typing import Iterable
+
+from rhasspy_weather.utils import solar
+
+
 class Location:
+    # True if the coordinates were looked up by the api instead of being given in the config or request
+    coordinates_resolved = False
+
     def __init__(self, city, zipcode=None, country_code=None, lat=None, lon=None):
         self.city = city
         self.name = city  # used for output only, intended for custom queries like how is the weather at grandmas (not implemented yet)
+        self.sunrise = None
+        self.sunset = None
         if lat and lon:
-            self.lat = lat
-            self.lon = lon
-            self.sunrise, self.sunset = self.calculate_sunrise_and_sunset(lat, lon)
+            self.set_lat_and_lon(lat, lon)
         if zipcode and country_code:
             self.zipcode = zipcode
             self.country_code = country_code
-        self.sunrise = None
-        self.sunset = None
 
     def set_lat_and_lon(self, lat, lon):
         self.lat = float(lat)
         self.lon = float(lon)
-        self.sunrise, self.sunset = self.calculate_sunrise_and_sunset(lat, lon)
+        self.sunrise, self.sunset = self.calculate_sunrise_and_sunset(self.lat, self.lon)
+        self.coordinates_resolved = False
+
+    def set_resolved_lat_and_lon(self, lat, lon):
+        """sets the coordinates the api found for the city or zipcode, requested_key stays the same"""
+        self.set_lat_and_lon(lat, lon)
+        self.coordinates_resolved = True
+
+    @property
+    def has_coordinates(self):
+        return hasattr(self, "lat") and hasattr(self, "lon")
+
+    def get_sunrise_and_sunset(self, date: datetime.date, timezone=None):
+        """
+        Sunrise and sunset of a date, looked up in the table of utils.solar.
+
+        Args:
+            date: the date
+            timezone: timezone of the returned times, the local timezone is used if it is None
+
+        Returns: tuple of sunrise and sunset as datetime.time, both are None if the coordinates are unknown
+
+        """
+        if not self.has_coordinates:
+            return None, None
+        return solar.get_sunrise_and_sunset(self.lat, self.lon, date, timezone)
+
+    def precalculate_sunrise_and_sunset(self, dates: Iterable[datetime.date], timezone=None):
+        """calculates sunrise and sunset for all dates at once, so later lookups are cheap"""
+        if self.has_coordinates:
+            solar.precalculate(self.lat, self.lon, dates, timezone)
 
     def set_zipcode(self, zipcode, country_code):
         self.zipcode = zipcode
         self.country_code = country_code
 
-    @staticmethod
-    def calculate_sunrise_and_sunset(lat, lon):
-        import suntime
+    @property
+    def cache_key(self):
+        """normalized string identifying the location, coordinates are preferred over zipcode over city"""
+        if self.has_coordinates:
+            return f"lat={round(float(self.lat), 4)},lon={round(float(self.lon), 4)}"
+        return self.__get_name_key()
+
+    @property
+    def requested_key(self):
+        """like cache_key, but coordinates are only used if they were given and not looked up by the api"""
+        if self.has_coordinates and not self.coordinates_resolved:
+            return self.cache_key
+        return self.__get_name_key()
 
-        sun = suntime.Sun(lat, lon)
-        sunrise = sun.get_local_sunrise_time().time()
-        sunset = sun.get_local_sunset_time().time()
+    def __get_name_key(self):
+        if hasattr(self, "zipcode") and hasattr(self, "country_code"):
+            return f"zip={str(self.zipcode).strip().lower()},{str(self.country_code).strip().lower()}"
+        return f"q={str(self.city).strip().lower()}"
 
-        return sunrise, sunset
+    @staticmethod
+    def calculate_sunrise_and_sunset(lat, lon):
+        """sunrise and sunset of today in local time"""
+        return solar.get_sunrise_and_sunset(lat, lon, datetime.date.today())
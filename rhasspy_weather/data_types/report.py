@@ -3,30 +3,92 @@ import math
 import random
 from typing import Tuple, List
 
-from rhasspy_weather.data_types import item_list
 from rhasspy_weather.data_types.condition import ConditionType
-from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import get_context
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.data_types.fixed_times import FixedTimes
 from rhasspy_weather.data_types.request import DateType, Grain, ForecastType, WeatherRequest
 from rhasspy_weather.data_types.temperature import TemperatureType
 from rhasspy_weather.data_types.weather import Weather
 from rhasspy_weather.utils import utils
+from rhasspy_weather.utils.answer_template import AnswerTemplate, compile_answer
+from rhasspy_weather.utils.locale_index import get_locale_index
+
+
+class LazySpeech(dict):
+    """
+    Dict of the answers of a WeatherReport by ForecastType that calls render on the first access of a missing answer.
+    """
+    def __init__(self, render):
+        super().__init__()
+        self.__render = render
+
+    def __missing__(self, key):
+        render = self.__render
+        if render is None:
+            raise KeyError(key)
+        self.__render = None  # only once, also stops render from calling itself
+        try:
+            render()
+        except Exception:
+            # the next access renders again and raises the same error instead of a KeyError
+            self.__render = render
+            raise
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def is_rendered(self):
+        return self.__render is None
+
+
+class WeatherReportSegment:
+    """
+    Part of a WeatherReport, like the morning of the requested day or one day of several.
+    """
+    def __init__(self, interval: Tuple[datetime.time, datetime.time], name: str, aggregate, date: datetime.date = None):
+        self.interval = interval
+        self.date = date
+        self.name = name
+        self.min_temperature = aggregate.min_temperature
+        self.max_temperature = aggregate.max_temperature
+        self.min_pressure = aggregate.min_pressure
+        self.max_pressure = aggregate.max_pressure
+        self.min_humidity = aggregate.min_humidity
+        self.max_humidity = aggregate.max_humidity
+        self.weather_condition_list = aggregate.conditions
+        self.condition_counts = aggregate.condition_counts
+        self.speech = ""
+
+    def __str__(self):
+        return f"[{self.name}, min_temp: {self.min_temperature}, max_temp: {self.max_temperature}]"
 
 
 class WeatherReport:
     """
     Class containing information about the weather for a specific WeatherRequest, as well as the answers formulated for TTS.
     """
-    def __init__(self, request: WeatherRequest, weather_information: Weather, interval: Tuple[datetime.time, datetime.time] = None):
-        if not (request.grain == Grain.DAY or request.grain == Grain.HOUR):
-            raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR)
+    def __init__(self, request: WeatherRequest, weather_information: Weather, interval: Tuple[datetime.time, datetime.time] = None,
+                 context=None):
+        # WeatherContext, works like the config
+        self.config = get_context(context)
 
-        self.config = get_config()
+        if not (request.grain == Grain.DAY or request.grain == Grain.HOUR or request.grain == Grain.WEEK):
+            raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR, locale=self.config.locale)
 
         self.request = request
 
-        self.__weather = []
-        self.speech = {}
+        self.__weather = None
+        self.__weather_information = weather_information
+        self.speech = LazySpeech(self.report)
         self.min_temperature = math.inf
         self.max_temperature = -math.inf
         self.min_pressure = math.inf
@@ -36,6 +98,7 @@ class WeatherReport:
         self.weather_condition_list = []
         self.__change_count = 0
         self.__condition_counts = {}
+        self.segments = []
 
         if interval:
             self.interval = interval
@@ -46,62 +109,138 @@ class WeatherReport:
                 elif request.grain == Grain.HOUR:
                     self.interval = (request.start_time, request.start_time)
                 else:
-                    raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR)
+                    raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR, locale=self.config.locale)
             elif request.date_type == DateType.INTERVAL:
                 if request.grain == Grain.HOUR:
                     self.interval = (request.start_time, request.end_time)
+                elif request.grain == Grain.WEEK:
+                    self.interval = (datetime.time.min, datetime.time.max)
                 else:
-                    raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR)
-
-        self.__weather = self.__weather + weather_information.get_weather_at_interval(request.request_date, self.interval)
-
-        if not self.__weather:
-            raise WeatherError(ErrorCode.NO_WEATHER_FOR_DAY_ERROR)
+                    raise WeatherError(ErrorCode.NOT_IMPLEMENTED_ERROR, locale=self.config.locale)
 
-        self.__apply_weather()
-        self.report()
+        if request.grain == Grain.WEEK and request.end_date is not None:
+            self.__slot_range = weather_information.get_date_range(request.request_date, request.end_date)
+        else:
+            self.__slot_range = weather_information.get_slot_range(request.request_date, self.interval)
+        if self.__slot_range[0] == self.__slot_range[1]:
+            raise WeatherError(ErrorCode.NO_WEATHER_FOR_DAY_ERROR, locale=self.config.locale)
+
+        start, end = self.__slot_range
+        self.__change_count = end - start
+        for key, value in weather_information.get_extremes(start, end, self.config).items():
+            setattr(self, key, value)
+        if request.grain == Grain.HOUR:
+            # values at the requested time instead of those of the whole slots around it
+            for key, value in self.__get_interpolated_extremes(weather_information).items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+        self.__condition_counts = weather_information.count_condition_types(start, end, self.config)
+        if not interval and self.__has_segments():
+            # the range and its parts are summarized together
+            aggregate = self.__create_segments()
+        else:
+            aggregate = weather_information.get_aggregate(start, end, self.config)
+        self.weather_condition_list = list(aggregate.conditions)
 
     def __str__(self):
         return f"[count: {self.__change_count}, min_temp: {self.min_temperature}, max_temp: {self.max_temperature}]"
 
     def report(self):
-        """Method that turns the weather information into text according to the WeatherRequest"""
+        """
+        Method that turns the weather information into text according to the WeatherRequest. It is called on the
+        first access of speech, reports that are only used for their values never create the text.
+        """
+        values = {"when": self.get_output_date_and_time(), "where": self.get_output_location()}
+        if self.segments and self.report_detailed(values):
+            return
         if self.request.forecast_type == ForecastType.TEMPERATURE:
-            self.report_temperature()
+            self.report_temperature(values)
         elif self.request.forecast_type == ForecastType.CONDITION:
-            self.report_condition()
+            self.report_condition(values)
         elif self.request.forecast_type == ForecastType.FULL:
-            self.report_temperature()
-            self.report_condition()
+            # the temperature is the second sentence, when and where are only said once
+            self.report_temperature({"when": "", "where": ""})
+            self.report_condition(values)
             self.report_full()
         elif self.request.forecast_type == ForecastType.ITEM:
-            self.report_item()
+            self.report_item(values)
+
+    def report_detailed(self, values: dict = None) -> bool:
+        """
+        Method that turns the segments into text, one sentence per segment after an introduction with when and where.
+        All segments were summarized together when the report was created.
+
+        Args:
+            values: values for {when} and {where}, the output date and location if None
+
+        Returns:
+            False if the locale has no answers for detailed reports, True otherwise
+
+        """
+        if values is None:
+            values = {"when": self.get_output_date_and_time(), "where": self.get_output_location()}
+        locale = self.config.locale
+        if not all(x in locale.general_answers for x in ["detailed_full", "detailed_temperature", "detailed_condition"]):
+            return False
+        if self.request.forecast_type == ForecastType.TEMPERATURE:
+            forecast_types = [ForecastType.TEMPERATURE]
+        elif self.request.forecast_type == ForecastType.CONDITION:
+            forecast_types = [ForecastType.CONDITION]
+        else:
+            forecast_types = [ForecastType.TEMPERATURE, ForecastType.CONDITION, ForecastType.FULL]
+        for forecast_type in forecast_types:
+            if forecast_type == ForecastType.TEMPERATURE:
+                introduction = random.choice(locale.temperature_answers["general_temperature_full"])
+                answer = random.choice(locale.general_answers["detailed_temperature"])
+            elif forecast_type == ForecastType.CONDITION:
+                introduction = random.choice(locale.condition_answers["general_weather_full"])
+                answer = random.choice(locale.general_answers["detailed_condition"])
+            else:
+                introduction = random.choice(locale.condition_answers["general_weather_full"])
+                answer = random.choice(locale.general_answers["detailed_full"])
+            sentences = [self.render_answer(introduction, values).rstrip()]
+            for segment in self.segments:
+                segment.speech = utils.format_string(self.render_answer(answer, {
+                    "time": segment.name,
+                    "weather": locale.combine_conditions([x.description for x in segment.weather_condition_list if x.description]),
+                    "temperature": locale.format_temperature_output(segment.min_temperature, segment.max_temperature)
+                }))
+                sentences.append(segment.speech)
+            self.speech[forecast_type] = utils.format_string(" ".join(sentences))
+        return True
+
+    def report_temperature(self, values: dict = None):
+        """
+        Method that turns temperature information into text
 
-        self.speech[self.request.forecast_type] = self.format_when_and_where(self.speech[self.request.forecast_type], self.get_output_date_and_time(), self.get_output_location())
+        Args:
+            values: values for {when} and {where}, the output date and location if None
 
-    def report_temperature(self):
-        """Method that turns temperature information into text"""
+        """
+        if values is None:
+            values = {"when": self.get_output_date_and_time(), "where": self.get_output_location()}
+        values = {**values, "temperature": self.config.locale.format_temperature_output(self.min_temperature, self.max_temperature)}
         general_answer = random.choice(self.config.locale.temperature_answers[TemperatureType.GENERAL])
         if self.request.forecast_type == ForecastType.TEMPERATURE and type(self.request.requested) == TemperatureType:
             temperature_type = self.request.requested
-            response_type = "false"
-            if temperature_type == TemperatureType.COLD:
-                if self.min_temperature <= self.config.temperature_cold_to:
-                    response_type = "true"
-            elif temperature_type == TemperatureType.WARM:
-                if self.min_temperature >= self.config.temperature_warm_from:
-                    response_type = "true"
-            self.speech[ForecastType.TEMPERATURE] = random.choice(self.config.locale.temperature_answers[temperature_type][response_type]) + " "
-            general_answer = self.format_when_and_where(general_answer)
+            response_type = "true" if self.is_temperature_type(temperature_type) else "false"
+            answer = self.render_answer(random.choice(self.config.locale.temperature_answers[temperature_type][response_type]), values) + " " + \
+                utils.format_string(self.render_answer(general_answer, values, when="", where=""))
         else:
-            self.speech[ForecastType.TEMPERATURE] = ""
+            answer = self.render_answer(general_answer, values)
+        self.speech[ForecastType.TEMPERATURE] = utils.format_string(answer)
+
+    def report_condition(self, values: dict = None):
+        """
+        Method that turns condition information into text
 
-        temperature_output = self.config.locale.format_temperature_output(self.min_temperature, self.max_temperature)
-        temperature_answer = general_answer.format(temperature=temperature_output, when="{when}", where="{where}")
-        self.speech[ForecastType.TEMPERATURE] = self.speech[ForecastType.TEMPERATURE] + temperature_answer
+        Args:
+            values: values for {when} and {where}, the output date and location if None
 
-    def report_condition(self):
-        """Method that turns condition information into text"""
+        """
+        if values is None:
+            values = {"when": self.get_output_date_and_time(), "where": self.get_output_location()}
+        values = {**values, "weather": self.format_conditions()}
         if self.request.forecast_type == ForecastType.CONDITION and type(self.request.requested) == ConditionType:
             condition_type = self.request.requested
             response_type = "false"
@@ -111,35 +250,90 @@ class WeatherReport:
                 prefix = random.choice(self.config.locale.general_answers["affirmative"])
             else:
                 prefix = random.choice(self.config.locale.general_answers["negative"])
-                additional_information = " " + random.choice(self.config.locale.general_answers["weather"])
-            self.speech[ForecastType.CONDITION] = prefix + ", " + random.choice(self.config.locale.condition_answers[condition_type][response_type]) + additional_information
+                additional_information = " " + self.render_answer(random.choice(self.config.locale.general_answers["weather"]), values)
+            answer = prefix + ", " + self.render_answer(random.choice(self.config.locale.condition_answers[condition_type][response_type]), values) + additional_information
         else:
-            self.speech[ForecastType.CONDITION] = random.choice(self.config.locale.condition_answers[ConditionType.GENERAL])
-
-        self.speech[ForecastType.CONDITION] = self.speech[ForecastType.CONDITION].format(weather=self.format_conditions(), when="{when}", where="{where}")
+            answer = self.render_answer(random.choice(self.config.locale.condition_answers[ConditionType.GENERAL]), values)
+        self.speech[ForecastType.CONDITION] = utils.format_string(answer)
 
     def report_full(self):
-        self.speech[ForecastType.FULL] = self.speech[ForecastType.CONDITION] + " " + self.format_when_and_where(self.speech[ForecastType.TEMPERATURE])
-        self.speech[ForecastType.FULL] = self.speech[ForecastType.FULL].format(weather=self.format_conditions(), when="{when}", where="{where}")
-
-    def report_item(self):
-        """Method that turns item information into text"""
-        requested_item = item_list.items.get_item(self.request.requested)
-        true_conditions = []
-        false_conditions = []
-        for condition in self.weather_condition_list:
-            if condition.condition_type in requested_item.weather_types:
-                true_conditions.append(condition)
-            else:
-                false_conditions.append(condition)
+        """Method that combines the condition and the temperature text, both have to be created first"""
+        self.speech[ForecastType.FULL] = utils.format_string(self.speech[ForecastType.CONDITION] + " " + self.speech[ForecastType.TEMPERATURE])
+
+    def report_item(self, values: dict = None):
+        """
+        Method that turns item information into text, requests without an item are answered by report_useful_items
+
+        Args:
+            values: values for {when} and {where}, the output date and location if None
 
-        if true_conditions:
-            self.speech[ForecastType.ITEM] = random.choice(self.config.locale.general_answers["affirmative"]) + ", " + requested_item.format_for_output(random.choice(self.config.locale.general_answers["item_needed"])) + ". "
+        Raises:
+            WeatherError: the requested item is not in the item list of the locale
+
+        """
+        if values is None:
+            values = {"when": self.get_output_date_and_time(), "where": self.get_output_location()}
+        locale = self.config.locale
+        # requested is empty if the intent had no item slot
+        if not self.request.requested:
+            self.report_useful_items(values)
+            return
+        # any spelling of the name, like the fingerprint of the request
+        requested = self.request.requested.strip()
+        requested_item = locale.items.get_item(get_locale_index(locale).items.get(requested.casefold(), requested))
+        if requested_item is None:
+            raise WeatherError(ErrorCode.ITEM_ERROR, f"Unknown item '{self.request.requested}'", locale)
+        values = {**values, **requested_item.get_template_values(locale), "weather": self.format_conditions()}
+        weather_types = self.get_weather_types()
+
+        if any(weather_type in weather_types for weather_type in requested_item.weather_types):
+            answer = random.choice(self.config.locale.general_answers["affirmative"]) + ", " + self.render_answer(random.choice(self.config.locale.general_answers["item_needed"]), values) + ". "
         else:
-            self.speech[ForecastType.ITEM] = random.choice(self.config.locale.general_answers["negative"]) + ", " + requested_item.format_for_output(random.choice(self.config.locale.general_answers["item_not_needed"])) + ". "
+            answer = random.choice(self.config.locale.general_answers["negative"]) + ", " + self.render_answer(random.choice(self.config.locale.general_answers["item_not_needed"]), values) + ". "
 
-        self.speech[ForecastType.ITEM] = self.speech[ForecastType.ITEM] + random.choice(self.config.locale.general_answers["weather"])
-        self.speech[ForecastType.ITEM] = self.speech[ForecastType.ITEM].format(weather=self.format_conditions(), when="{when}", where="{where}")
+        answer = answer + self.render_answer(random.choice(self.config.locale.general_answers["weather"]), values)
+        self.speech[ForecastType.ITEM] = utils.format_string(answer)
+
+    def report_useful_items(self, values: dict = None):
+        """
+        Method that turns the items that are useful for the weather into text, it answers item requests without an
+        item ("what should I bring")
+
+        Args:
+            values: values for {when} and {where}, the output date and location if None
+
+        """
+        if values is None:
+            values = {"when": self.get_output_date_and_time(), "where": self.get_output_location()}
+        locale = self.config.locale
+        useful_items = self.get_useful_items()
+        if useful_items:
+            item_names = [item.format_for_output("{article} {noun}", locale) for item in useful_items]
+            answer = random.choice(locale.general_answers["items_needed"])
+            values = {**values, "items": locale.combine_conditions(item_names)}
+        else:
+            answer = random.choice(locale.general_answers["no_items_needed"])
+        answer = self.render_answer(answer, values) + ". " + \
+            self.render_answer(random.choice(locale.general_answers["weather"]), {**values, "weather": self.format_conditions()})
+        self.speech[ForecastType.ITEM] = utils.format_string(answer)
+
+    @staticmethod
+    def render_answer(answer: str, values: dict, **additional_values) -> str:
+        """
+        Fills the placeholders of a locale answer in one pass, see utils.answer_template
+
+        Args:
+            answer: the answer, usually already compiled by the locale
+            values: values by placeholder name
+            **additional_values: values that replace those in values
+
+        Returns:
+            The filled answer, placeholders without a value are left in
+
+        """
+        if additional_values:
+            values = {**values, **additional_values}
+        return compile_answer(answer).render(**values)
 
     @staticmethod
     def format_when_and_where(answer: str, when: str = "", where: str = "") -> str:
@@ -155,9 +349,8 @@ class WeatherReport:
             The formatted string
 
         """
-        answer = answer.format(when=when, where=where, temperature="{temperature}", weather="{weather}")
-        answer = utils.format_string(answer)
-        return answer
+        template = answer if isinstance(answer, AnswerTemplate) else AnswerTemplate(answer)
+        return utils.format_string(template.render(when=when, where=where))
 
     def format_conditions(self) -> str:
         """
@@ -169,39 +362,44 @@ class WeatherReport:
         """
         return self.config.locale.combine_conditions(self.get_output_condition_list())
 
-    def __apply_weather(self):
-        for weather_at_time in self.__weather:
-            self.__change_count = self.__change_count + 1
-            if weather_at_time.temperature > self.max_temperature:
-                self.max_temperature = weather_at_time.temperature
-            if weather_at_time.temperature < self.min_temperature:
-                self.min_temperature = weather_at_time.temperature
-            if weather_at_time.pressure > self.max_pressure:
-                self.max_pressure = weather_at_time.pressure
-            if weather_at_time.pressure < self.min_pressure:
-                self.min_pressure = weather_at_time.pressure
-            if weather_at_time.humidity > self.max_humidity:
-                self.max_humidity = weather_at_time.humidity
-            if weather_at_time.humidity < self.min_humidity:
-                self.min_humidity = weather_at_time.humidity
-
-            # TODO: maybe do something about the order
-            for condition in [weather_at_time.main_condition] + weather_at_time.other_conditions:
-                condition_type_list = [x.condition_type for x in self.weather_condition_list]
-                if condition.condition_type not in condition_type_list:
-                    self.weather_condition_list.append(condition)
-                else:
-                    condition_in_list = next(x for x in self.weather_condition_list if x.condition_type == condition.condition_type)
-                    if condition.severity > condition_in_list.severity:
-                        self.weather_condition_list.remove(condition_in_list)
-                        self.weather_condition_list.append(condition)
-                self.__increase_counter(condition.condition_type)
-
-    def __increase_counter(self, condition_type: ConditionType):
-        """counts how many occurrences of a certain weather type there are"""
-        if condition_type not in self.__condition_counts:
-            self.__condition_counts[condition_type] = 0
-        self.__condition_counts[condition_type] = self.__condition_counts[condition_type] + 1
+    def is_temperature_type(self, temperature_type: TemperatureType) -> bool:
+        """
+        Checks if the temperature is cold or warm according to the config
+
+        Args:
+            temperature_type: TemperatureType.COLD or TemperatureType.WARM
+
+        Returns:
+            True if the temperature is of that type, else False
+
+        """
+        if temperature_type == TemperatureType.COLD:
+            return self.min_temperature <= self.config.temperature_cold_to
+        if temperature_type == TemperatureType.WARM:
+            return self.min_temperature >= self.config.temperature_warm_from
+        return False
+
+    def get_weather_types(self) -> set:
+        """
+        Weather types of the report, the types of all conditions that can occur and cold or warm if the temperature is
+
+        Returns:
+            set of ConditionType and TemperatureType
+
+        """
+        weather_types = {condition.condition_type for condition in self.weather_condition_list}
+        weather_types.update(x for x in (TemperatureType.COLD, TemperatureType.WARM) if self.is_temperature_type(x))
+        return weather_types
+
+    def get_useful_items(self) -> list:
+        """
+        Items of the locale that are useful for at least one of the weather types of the report
+
+        Returns:
+            list of WeatherItem in the order of the locale
+
+        """
+        return self.config.locale.items.get_items_for_weather_types(self.get_weather_types())
 
     def is_weather_chance(self, condition_type: ConditionType) -> bool:
         """
@@ -233,7 +431,7 @@ class WeatherReport:
         if len(self.weather_condition_list) == 1:
             return [self.weather_condition_list[0].description]
 
-        selected = []
+        selected = {}
         for x in self.weather_condition_list:
             if clouds_and_clear_exclusive:
                 if x.condition_type == ConditionType.CLOUDS:
@@ -245,10 +443,7 @@ class WeatherReport:
             else:
                 self.__add_element_to_condition_list(x, selected)
 
-        conditions = []
-        for x in selected:
-            conditions.append(x.description)
-        return conditions
+        return [x.description for x in selected.values()]
 
     def get_output_date_and_time(self) -> str:
         """
@@ -260,6 +455,8 @@ class WeatherReport:
         """
         if self.request.date_specified != "":
             date = self.request.date_specified
+        elif self.request.grain == Grain.WEEK:
+            date = self.config.locale.format_output_date_range(self.request)
         else:
             date = self.config.locale.format_output_date(self.request)
         if self.request.time_specified != "":
@@ -277,25 +474,72 @@ class WeatherReport:
     def get_output_location(self):
         return self.config.locale.format_output_location(self.request.location.name) if self.request.location_specified else ""
 
-    @staticmethod
-    def __add_element_to_condition_list(element, condition_list):
-        """makes sure that only one element of a condition type is in the list (the most severe one)"""
-        if len(condition_list) == 0:
-            condition_list.append(element)
+    def __get_interpolated_extremes(self, weather_information: Weather) -> dict:
+        """minimum and maximum of the interpolated values in the interval, empty if it is not covered by the forecast"""
+        start = datetime.datetime.combine(self.request.request_date, self.interval[0])
+        end = datetime.datetime.combine(self.request.request_date, self.interval[1])
+        if self.interval[1] < self.interval[0]:
+            end = end + datetime.timedelta(days=1)
+        return weather_information.get_interpolated_extremes(start, end)
+
+    def __has_segments(self) -> bool:
+        """
+        a report is split into segments for requests of several days (one per day) and detailed requests of a whole
+        day (one per time of the day), as long as they don't ask for something specific
+        """
+        if isinstance(self.request.requested, (TemperatureType, ConditionType)) or self.request.forecast_type == ForecastType.ITEM:
+            return False
+        if self.request.grain == Grain.WEEK:
+            return len(self.request.dates) > 1
+        return self.request.detail and self.request.grain == Grain.DAY and len(self.request.times) > 1
+
+    def __create_segments(self):
+        """
+        creates the segments of all days or times of the request, their summaries and that of the whole report are
+        calculated in one pass
+
+        Returns: the WeatherAggregate of the whole report
+        """
+        slot_ranges = []
+        intervals = []
+        names = []
+        if self.request.grain == Grain.WEEK:
+            dates = self.request.dates
+            for date in dates:
+                slot_ranges.append(self.__weather_information.get_slot_range(date, self.interval))
+                intervals.append(self.interval)
+                names.append(self.config.locale.weekday_names[date.weekday()])
         else:
-            if element.condition_type in [x.condition_type for x in condition_list]:
-                for x in condition_list[:]:
-                    if x.condition_type == element.condition_type:
-                        if element.severity > x.severity:
-                            condition_list.remove(x)
-                            condition_list.append(element)
-            else:
-                condition_list.append(element)
+            fixed_times = {x.value: x for x in FixedTimes}
+            dates = [self.request.request_date] * len(self.request.times)
+            for interval in self.request.times:
+                slot_ranges.append(self.__weather_information.get_slot_range(self.request.request_date, interval))
+                intervals.append(interval)
+                if interval in fixed_times:
+                    names.append(self.config.locale.fixed_times[fixed_times[interval]])
+                else:
+                    names.append(f"{interval[0].strftime('%H:%M')} - {interval[1].strftime('%H:%M')}")
+        aggregates = self.__weather_information.get_aggregates([self.__slot_range] + [x for x in slot_ranges if x[0] < x[1]], self.config)
+        segment_aggregates = iter(aggregates[1:])
+        for slot_range, interval, name, date in zip(slot_ranges, intervals, names, dates):
+            if slot_range[0] < slot_range[1]:
+                self.segments.append(WeatherReportSegment(interval, name, next(segment_aggregates), date))
+        return aggregates[0]
+
+    @staticmethod
+    def __add_element_to_condition_list(element, conditions: dict):
+        """makes sure that only one element of a condition type is in the dict (the most severe one)"""
+        kept = conditions.get(element.condition_type)
+        if kept is None or element.severity > kept.severity:
+            conditions[element.condition_type] = element
 
     @property
     def weather(self):
+        """WeatherAtTime objects of the requested slots, only created when needed"""
+        if self.__weather is None:
+            self.__weather = self.__weather_information.get_slots(*self.__slot_range, self.config)
         return self.__weather
 
     def set_weather(self, key, value):
         if value is not None:
-            self.__weather[key] = value
+            self.weather[key] = value
@@ -1,10 +1,12 @@
 import datetime
 import logging
 from enum import Enum
+from typing import NamedTuple, Optional, Tuple, Union
 
-from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import get_context
 from rhasspy_weather.data_types.error import ErrorCode, WeatherError
 from rhasspy_weather.data_types.fixed_times import FixedTimes
+from rhasspy_weather.utils.locale_index import get_locale_index
 
 log = logging.getLogger(__name__)
 
@@ -18,9 +20,13 @@ class WeatherRequest:
     date_type : DateType
         Is the request for a fixed time or an interval
     grain : Grain
-        How specific should the request be, days, hours
+        How specific should the request be, days, hours, several days (WEEK)
     request_date : datetime.date
-        For when is the request
+        For when is the request, the first day for several days
+    end_date : datetime.date
+        last day of a request for several days, None otherwise
+    dates : list of datetime.date
+        all days of the request
     location : Location
         Object containing location information
     requested : str
@@ -35,6 +41,8 @@ class WeatherRequest:
         Type of request, full, temperature, condition or item
     start_time : datetime.time
     end_time : datetime.time
+    times : list of (datetime.time, datetime.time)
+        intervals the answer is about, several for a detailed request
     weekday : str
     string_date :str
     readable_date : str
@@ -43,24 +51,28 @@ class WeatherRequest:
     string_end_time : str
     readable_end_time : str
     time_difference : int
+    fingerprint : RequestFingerprint
+        canonical immutable key of the request, see RequestFingerprint
     """
 
-    def __init__(self, date_type, grain, request_date, forecast_type):
+    def __init__(self, date_type, grain, request_date, forecast_type, context=None):
         """
         Parameters:
         date_type : DateType
         grain : Grain
         request_date : datetime.date
         forecast_type : ForecastType
+        context : WeatherContext, optional, the current config is used if it is None
         """
 
-        config = get_config()
+        config = get_context(context)
 
         self.__location = config.location
         self.date_type = date_type
         self.grain = grain
         self.request_date = request_date
         self.requested = ""
+        self.end_date = None
         self.start_time = None
         self.end_time = None
         self.time_specified = ""
@@ -68,12 +80,12 @@ class WeatherRequest:
         self.location_specified = False
         self.forecast_type = forecast_type
         self.detail = config.detail
-        self.__timezone = config.timezone
+        self.__context = config
         self.__locale = config.locale
-        self.times = []
+        self.__times = []
 
         # weather apis don't have weather for the past, so no no need checking
-        if self.request_date < datetime.datetime.now(self.__timezone).date():
+        if self.request_date < self.__context.now().date():
             raise WeatherError(ErrorCode.PAST_WEATHER_ERROR)
 
     def __str__(self):
@@ -81,19 +93,6 @@ class WeatherRequest:
                str(self.grain) + ", " + self.string_date + ", " + str(self.start_time) + \
                ", " + str(self.end_time) + ", " + self.location.name + ", " + self.requested + ", " + str(self.detail) + ")"
 
-    def __update_times(self):
-        if self.detail and self.forecast_type is not ForecastType.ITEM:
-            if not self.times:
-                for fixed_time in [FixedTimes.MORNING, FixedTimes.AFTERNOON, FixedTimes.EVENING]:
-                    self.times.append(fixed_time.value)
-        else:
-            if self.grain == Grain.HOUR:
-                self.times = []
-                self.times.append((self.start_time, self.end_time))
-            elif self.grain == Grain.DAY:
-                self.times = []
-                self.times.append((datetime.time.min, datetime.time.max))
-
     def __get_valid_time(self, val):
         time = None
 
@@ -110,13 +109,33 @@ class WeatherRequest:
             if self.grain == Grain.HOUR and time == datetime.time.min:
                 self.request_date = self.request_date + datetime.timedelta(days=1)
             # if the request was for today and the time has already passed I assume it meant the time +12h (PM instead of AM)
-            elif self.grain == Grain.HOUR and self.request_date == datetime.datetime.now(self.__timezone).date() and \
-                    datetime.datetime.now(self.__timezone).time() > time and time < datetime.time(12, 0):
+            elif self.grain == Grain.HOUR and self.request_date == self.__context.now().date() and \
+                    self.__context.now().time() > time and time < datetime.time(12, 0):
                 return time.replace(hour=time.hour + 12)
             return time
         raise WeatherError(ErrorCode.TIME_ERROR)
 
+    def set_date(self, date, str_date):
+        """
+        Sets the date of the request, a tuple of first and last date makes it a request for several days.
+        """
+        if isinstance(date, tuple):
+            self.request_date = date[0]
+            if date[1] < date[0]:
+                raise WeatherError(ErrorCode.DATE_ERROR)
+            if date[1] > date[0]:
+                self.grain = Grain.WEEK
+                self.date_type = DateType.INTERVAL
+                self.end_date = date[1]
+        else:
+            self.request_date = date
+        self.date_specified = str_date
+
     def set_time(self, time, str_time):
+        if self.grain == Grain.WEEK:
+            # a time is only asked for on one day, that is the first day of the range
+            self.date_type = DateType.FIXED
+            self.end_date = None
         self.grain = Grain.HOUR
         if isinstance(time, tuple):
             self.date_type = DateType.INTERVAL
@@ -126,10 +145,52 @@ class WeatherRequest:
             self.start_time = self.__get_valid_time(time)
         self.time_specified = str_time
 
-        if self.request_date == datetime.datetime.now(self.__timezone).date() and self.start_time < datetime.datetime.now(self.__timezone).time():
+        if self.request_date == self.__context.now().date() and self.start_time < self.__context.now().time():
             raise WeatherError(ErrorCode.PAST_WEATHER_ERROR)
 
-        self.__update_times()
+    @property
+    def times(self):
+        """
+        Intervals of the request date the answer is about. For a detailed request of a whole day these are the
+        FixedTimes (morning, afternoon and evening), unless times were set explicitly.
+        """
+        if self.__times:
+            return self.__times
+        if self.grain == Grain.DAY:
+            if self.detail and self.forecast_type is not ForecastType.ITEM:
+                return [fixed_time.value for fixed_time in [FixedTimes.MORNING, FixedTimes.AFTERNOON, FixedTimes.EVENING]]
+            return [(datetime.time.min, datetime.time.max)]
+        elif self.grain == Grain.HOUR:
+            return [(self.start_time, self.end_time if self.end_time is not None else self.start_time)]
+        return []
+
+    @times.setter
+    def times(self, val):
+        self.__times = list(val)
+
+    @property
+    def dates(self):
+        if self.end_date is None:
+            return [self.request_date]
+        return [self.request_date + datetime.timedelta(x) for x in range((self.end_date - self.request_date).days + 1)]
+
+    @property
+    def fingerprint(self):
+        """
+        Canonical immutable key of the request with all relative inputs resolved, so it stays the same when the
+        request is modified afterwards or "now" moves on. Requests asking for the same thing get the same key,
+        regardless of how the date, time, item or location were phrased. Items are keyed by their name in the item
+        list of the locale, the report looks them up the same way. The location is the one that was asked for, it
+        doesn't change when the api looks up its coordinates.
+        """
+        times = tuple((start.replace(second=0, microsecond=0), end.replace(second=0, microsecond=0)) for start, end in self.times)
+        requested = self.requested
+        if isinstance(requested, str):
+            requested = requested.strip()
+            requested = get_locale_index(self.__locale).items.get(requested.casefold(), requested) or None
+        return RequestFingerprint(self.request_date, self.end_date or self.request_date, self.grain, times,
+                                  self.forecast_type, requested,
+                                  self.location.requested_key if self.location is not None else None, self.detail)
 
     @property
     def location(self):
@@ -218,12 +279,26 @@ class WeatherRequest:
 
     @property
     def time_difference(self):
-        time_difference = (self.request_date - datetime.datetime.now(self.__timezone).date()).days
+        time_difference = (self.request_date - self.__context.now().date()).days
         if self.grain == Grain.HOUR and self.start_time == datetime.time(0, 0, 0):
             return time_difference - 1
         return time_difference
 
 
+class RequestFingerprint(NamedTuple):
+    """
+    Hashable key of a WeatherRequest, used by caches of reports and answers. Build it with WeatherRequest.fingerprint.
+    """
+    first_date: datetime.date
+    last_date: datetime.date
+    grain: "Grain"
+    times: Tuple[Tuple[datetime.time, datetime.time], ...]
+    forecast_type: "ForecastType"
+    requested: Optional[Union[str, Enum]]
+    location: Optional[str]
+    detail: bool
+
+
 # WeatherRequest for a fixed time or an interval?
 class DateType(Enum):
     FIXED = "fixed"
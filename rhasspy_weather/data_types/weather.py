@@ -1,26 +1,362 @@
+import bisect
 import datetime
-from typing import Tuple
+import time
+from array import array
+from collections import Counter
+from typing import List, Tuple
 
+from rhasspy_weather.data_types.aggregate import WeatherAggregate
+from rhasspy_weather.data_types.condition import ConditionType, WeatherCondition, get_condition, classify_wind_batch, \
+    compass_directions, get_classified_wind_condition
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.fixed_times import FixedTimes
 from rhasspy_weather.data_types.weather_at_time import WeatherAtTime
+from rhasspy_weather.utils.interpolation import Interpolation
+from rhasspy_weather.utils.range_query import SparseTable, PrefixCounts
+
+condition_types = list(ConditionType)
 
 
 class Weather:
-    def __init__(self):
-        self.__weather = {}
+    """
+    Forecast for one location, saved column wise in compact arrays sorted by time. Every index across the columns
+    is one forecast slot. WeatherAtTime objects are only created when slots are requested.
+    """
+    # increase whenever the attributes change, pickled forecasts with another version are not loaded
+    format_version = 7
+
+    def __init__(self, location=None, interval: int = 3, timezone=None):
+        self.fetch_time = time.time()
+        self.location = location
+        self.interval = interval
+        self.timezone = timezone
+
+        self.timestamps = array("d")
+        self.temperatures = array("d")
+        self.pressures = array("d")
+        self.humidities = array("d")
+        self.wind_speeds = array("d")
+        self.wind_directions = array("d")
+        self.condition_types = array("b")
+        self.severities = array("b")
+        self.description_ids = array("H")
+        self.descriptions = []
+
+        # WeatherAggregate for every day and FixedTimes of a day, by slot range
+        self.__aggregates = None
+        # units, wind severities and compass indices of all slots
+        self.__wind = None
+        # sparse tables of temperature, pressure and humidity and prefix counts of the condition types of all slots
+        self.__range_index = None
+        # Interpolation of the columns by step in seconds
+        self.__interpolations = {}
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def add(self, timestamp: float, temperature: float, condition: WeatherCondition, pressure: float, humidity: float, wind_speed: float, wind_direction: float):
+        """
+        Adds a forecast slot. The columns stay sorted by time, so adding out of order is possible but slower.
+
+        Args:
+            timestamp: unix timestamp of the start of the slot
+            temperature: temperature
+            condition: the main WeatherCondition of the slot
+            pressure: air pressure
+            humidity: humidity
+            wind_speed: wind speed in the unit set in the config
+            wind_direction: wind direction in degrees
+
+        Returns: Nothing
+
+        """
+        self.__aggregates = None
+        self.__wind = None
+        self.__range_index = None
+        self.__interpolations = {}
+        if condition.description not in self.descriptions:
+            self.descriptions.append(condition.description)
+        values = (timestamp, temperature, pressure, humidity, wind_speed, wind_direction,
+                  condition_types.index(condition.condition_type), condition.severity, self.descriptions.index(condition.description))
+        columns = (self.timestamps, self.temperatures, self.pressures, self.humidities, self.wind_speeds, self.wind_directions,
+                   self.condition_types, self.severities, self.description_ids)
+        if not self.timestamps or timestamp >= self.timestamps[-1]:
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            index = bisect.bisect_right(self.timestamps, timestamp)
+            for column, value in zip(columns, values):
+                column.insert(index, value)
 
     def add_weather(self, date: datetime.date, weather_at_time: WeatherAtTime):
-        self.__weather[date] = self.__weather.get(date, [])
-        self.__weather[date].append(weather_at_time)
+        if self.location is None:
+            self.location = weather_at_time.location
+        self.interval = weather_at_time.interval
+        self.add(self.__to_timestamp(datetime.datetime.combine(date, weather_at_time.time)), weather_at_time.temperature, weather_at_time.main_condition,
+                 weather_at_time.pressure, weather_at_time.humidity, weather_at_time.wind_speed, weather_at_time.wind_direction)
+
+    def get_weather_for_date(self, date: datetime.date, config=None):
+        return self.get_weather_at_interval(date, (datetime.time.min, datetime.time.max), config)
+
+    def get_weather_at_time(self, date: datetime.date, time: datetime.time, config=None):
+        return self.get_weather_at_interval(date, (time, time), config)
+
+    def get_weather_at_interval(self, date: datetime.date, interval: Tuple[datetime.time, datetime.time], config=None):
+        start, end = self.get_slot_range(date, interval)
+        return self.get_slots(start, end, config)
+
+    def get_weather_in_range(self, start: datetime.datetime, end: datetime.datetime, config=None):
+        """Creates WeatherAtTime objects for all slots overlapping the time between start and end (excluded)"""
+        return self.get_slots(*self.get_range(start, end), config)
+
+    def get_slot_range(self, date: datetime.date, interval: Tuple[datetime.time, datetime.time]) -> Tuple[int, int]:
+        """
+        Finds the slots overlapping with an interval of a date. If the end of the interval is before its start,
+        the interval ends on the next day (like a night from 22:00 to 06:00). A whole day (datetime.time.min to
+        datetime.time.max) contains the slots starting on that day.
+
+        Args:
+            date: the date
+            interval: tuple of start and end time
+
+        Returns: start and end index of the slots, the end is excluded
+
+        """
+        start = datetime.datetime.combine(date, interval[0])
+        if interval == (datetime.time.min, datetime.time.max):
+            return self.get_range(start, start + datetime.timedelta(days=1), False)
+        end = datetime.datetime.combine(date, interval[1])
+        if interval[1] < interval[0]:
+            end = end + datetime.timedelta(days=1)
+        return self.get_range(start, end)
+
+    def get_date_range(self, first: datetime.date, last: datetime.date) -> Tuple[int, int]:
+        """
+        Finds the slots starting on the days from first to last (included).
+
+        Args:
+            first: the first day
+            last: the last day
+
+        Returns: start and end index of the slots, the end is excluded
+
+        """
+        start = datetime.datetime.combine(first, datetime.time.min)
+        end = datetime.datetime.combine(last + datetime.timedelta(days=1), datetime.time.min)
+        return self.get_range(start, end, False)
+
+    def get_range(self, start: datetime.datetime, end: datetime.datetime, overlapping: bool = True) -> Tuple[int, int]:
+        """
+        Finds the slots between two points in time with a binary search, so the range can span several days.
+        Every slot lasts interval hours from its timestamp. If start and end are the same, the slot containing that
+        point in time is found. Times without timezone are in the timezone of the forecast.
+
+        Args:
+            start: start of the range
+            end: end of the range (excluded)
+            overlapping: if True slots that started before start but last into the range are included
+
+        Returns: start and end index of the slots, the end is excluded
+
+        """
+        start_timestamp = self.__to_timestamp(start)
+        end_timestamp = self.__to_timestamp(end)
+        if overlapping:
+            first = bisect.bisect_right(self.timestamps, start_timestamp - self.interval * 3600)
+        else:
+            first = bisect.bisect_left(self.timestamps, start_timestamp)
+        if end_timestamp == start_timestamp:
+            last = bisect.bisect_right(self.timestamps, end_timestamp)
+        else:
+            last = bisect.bisect_left(self.timestamps, end_timestamp)
+        if last <= first:
+            return 0, 0
+        return first, last
+
+    def get_slots(self, start: int, end: int, config=None):
+        """Creates WeatherAtTime objects for the slots from start to end (excluded)"""
+        if config is None:
+            config = get_config()
+        return [self.get_slot(index, config) for index in range(start, end)]
+
+    def get_slot(self, index: int, config=None) -> WeatherAtTime:
+        if config is None:
+            config = get_config()
+        date_time = self.__to_datetime(self.timestamps[index])
+        condition = get_condition(self.severities[index], self.descriptions[self.description_ids[index]], condition_types[self.condition_types[index]], config.locale)
+        wind_severities, compass_indices = self.get_wind_classification(config.units)
+        wind_condition = get_classified_wind_condition(wind_severities[index], compass_directions[compass_indices[index]], config.locale)
+        return WeatherAtTime(date_time.date(), date_time.time(), self.temperatures[index], condition, self.pressures[index],
+                             self.humidities[index], self.wind_speeds[index], self.wind_directions[index], self.interval, self.location, config,
+                             wind_condition)
+
+    def get_wind_classification(self, units: str = "metric"):
+        """
+        Wind severities (beaufort) and compass indices of all slots, classified in one batch and kept until a slot is added.
+
+        Args:
+            units: the units the wind speeds are in
+
+        Returns: tuple of two arrays, severities and indices of condition.compass_directions
+
+        """
+        if self.__wind is None or self.__wind[0] != units:
+            self.__wind = (units,) + classify_wind_batch(self.wind_speeds, self.wind_directions, units)
+        return self.__wind[1], self.__wind[2]
+
+    def get_extremes(self, start: int, end: int, config=None) -> dict:
+        """
+        Minimum and maximum of temperature, pressure and humidity of the slots from start to end (excluded),
+        looked up in constant time.
+
+        Returns: dict with the keys min_temperature, max_temperature, min_pressure, max_pressure, min_humidity and max_humidity
+
+        """
+        range_index = self.__get_range_index(config)
+        extremes = {}
+        for name in ["temperature", "pressure", "humidity"]:
+            extremes["min_" + name], extremes["max_" + name] = range_index[name].query(start, end)
+        return extremes
+
+    def get_aggregate(self, start: int, end: int, config=None) -> WeatherAggregate:
+        """
+        Summary of the slots from start to end (excluded). Summaries of whole days and of the FixedTimes of every day
+        are looked up, all other ranges are calculated. The returned object is shared and must not be changed.
+
+        Returns: WeatherAggregate
+
+        """
+        return self.get_aggregates([(start, end)], config)[0]
+
+    def get_aggregates(self, slot_ranges: List[Tuple[int, int]], config=None) -> List[WeatherAggregate]:
+        """
+        Summaries of several slot ranges, like the parts of a detailed report. Precomputed summaries are looked up,
+        the others are calculated together in one pass over their slots.
+
+        Args:
+            slot_ranges: list of start and end (excluded) of the slots
+            config: config or WeatherContext for units and locale, the current config is used if it is None
+
+        Returns: list of WeatherAggregate in the order of slot_ranges
+
+        """
+        if self.__aggregates is None:
+            self.build_aggregates(config)
+        aggregates = [self.__aggregates.get(slot_range) for slot_range in slot_ranges]
+        missing = [slot_range for slot_range, aggregate in zip(slot_ranges, aggregates) if aggregate is None]
+        if missing:
+            created = self.__create_aggregates(missing, config)
+            aggregates = [created[slot_range] if aggregate is None else aggregate for slot_range, aggregate in zip(slot_ranges, aggregates)]
+        return aggregates
+
+    def build_aggregates(self, config=None):
+        """
+        Calculates the summaries of every day and the FixedTimes of every day. Adding a slot discards them,
+        they are calculated again on the next call of get_aggregate.
+        """
+        if config is None:
+            config = get_config()
+        dates = sorted(set(self.__to_datetime(timestamp).date() for timestamp in self.timestamps))
+        if self.location is not None:
+            self.location.precalculate_sunrise_and_sunset(dates, self.timezone)
+        self.__get_range_index(config)
+        slot_ranges = []
+        for date in dates:
+            for interval in [(datetime.time.min, datetime.time.max)] + [x.value for x in FixedTimes]:
+                slot_ranges.append(self.get_slot_range(date, interval))
+        self.__aggregates = self.__create_aggregates([x for x in slot_ranges if x[0] < x[1]], config)
+
+    def __create_aggregates(self, slot_ranges: List[Tuple[int, int]], config=None) -> dict:
+        """calculates the summaries of all slot ranges, every slot object is only created once"""
+        aggregates = {}
+        for slot_range in slot_ranges:
+            aggregate = WeatherAggregate()
+            if slot_range[0] < slot_range[1]:
+                for key, value in self.get_extremes(*slot_range, config).items():
+                    setattr(aggregate, key, value)
+            aggregates[slot_range] = aggregate
+        if aggregates:
+            start = min(x[0] for x in aggregates)
+            end = max(x[1] for x in aggregates)
+            for index, weather_at_time in enumerate(self.get_slots(start, end, config), start):
+                for slot_range, aggregate in aggregates.items():
+                    if slot_range[0] <= index < slot_range[1]:
+                        aggregate.add_conditions(weather_at_time)
+        return aggregates
+
+    def get_interpolation(self, step: int = 3600) -> Interpolation:
+        """
+        Temperature, pressure, humidity and wind speed resampled to step seconds, calculated once and kept
+        (and cached with the forecast) until a slot is added.
+
+        Args:
+            step: seconds between two samples, default is one hour
+
+        Returns: Interpolation
+
+        """
+        interpolation = self.__interpolations.get(step)
+        if interpolation is None:
+            interpolation = Interpolation(self.timestamps, {"temperature": self.temperatures, "pressure": self.pressures,
+                                                            "humidity": self.humidities, "wind_speed": self.wind_speeds},
+                                          step, self.interval)
+            self.__interpolations[step] = interpolation
+        return interpolation
+
+    def get_values_at(self, date_time: datetime.datetime) -> dict:
+        """
+        Interpolated temperature, pressure, humidity and wind speed at a point in time, instead of the values of the
+        slot it falls into. Times without timezone are in the timezone of the forecast.
+
+        Returns: dict with the keys temperature, pressure, humidity and wind_speed, empty outside of the forecast
+
+        """
+        interpolation = self.get_interpolation()
+        timestamp = self.__to_timestamp(date_time)
+        if timestamp not in interpolation:
+            return {}
+        return interpolation.at(timestamp)
+
+    def get_interpolated_extremes(self, start: datetime.datetime, end: datetime.datetime) -> dict:
+        """
+        Minimum and maximum of the interpolated temperature, pressure, humidity and wind speed between two points
+        in time, like get_extremes but without the parts of slots outside of start and end.
+
+        Returns: dict with the keys min_temperature, max_temperature, ..., empty if start or end is outside of the forecast
+
+        """
+        interpolation = self.get_interpolation()
+        start = self.__to_timestamp(start)
+        end = self.__to_timestamp(end)
+        if start not in interpolation or end not in interpolation:
+            return {}
+        return interpolation.extremes(start, end)
+
+    def count_condition_types(self, start: int, end: int, config=None) -> Counter:
+        """
+        Counts how often each condition type occurs in the slots from start to end (excluded), including wind,
+        sun and stars, in constant time per condition type.
+        """
+        return self.__get_range_index(config)["conditions"].counts(start, end)
 
-    def get_weather_for_date(self, date: datetime.date):
-        return self.__weather.get(date, [])
+    def __get_range_index(self, config=None) -> dict:
+        if self.__range_index is None:
+            conditions = [[x.condition_type for x in [slot.main_condition] + slot.other_conditions] for slot in self.get_slots(0, len(self), config)]
+            self.__range_index = {
+                "temperature": SparseTable(self.temperatures),
+                "pressure": SparseTable(self.pressures),
+                "humidity": SparseTable(self.humidities),
+                "conditions": PrefixCounts(conditions)
+            }
+        return self.__range_index
 
-    def get_weather_at_time(self, date: datetime.date, time: datetime.time):
-        return self.get_weather_at_interval(date, (time, time))
+    def __to_timestamp(self, date_time: datetime.datetime) -> float:
+        if self.timezone is not None and date_time.tzinfo is None:
+            if hasattr(self.timezone, "localize"):
+                date_time = self.timezone.localize(date_time)
+            else:
+                date_time = date_time.replace(tzinfo=self.timezone)
+        return date_time.timestamp()
 
-    def get_weather_at_interval(self, date: datetime.date, interval: Tuple[datetime.time, datetime.time]):
-        output = []
-        for weather_at_time in self.__weather.get(date, []):
-            if interval[0] <= weather_at_time.time < interval[1] or weather_at_time.time <= interval[1] <= weather_at_time.end_time:
-                output.append(weather_at_time)
-        return output
+    def __to_datetime(self, timestamp: float) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(timestamp, self.timezone)
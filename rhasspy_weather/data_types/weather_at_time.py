@@ -1,25 +1,33 @@
 import datetime
 
-from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType, WindCondition
+from rhasspy_weather.data_types.condition import ConditionType, get_condition, get_wind_condition
+from rhasspy_weather.data_types.config import get_config
 
 
 class WeatherAtTime:
     def __init__(self, date, time, temperature, main_condition, pressure, humidity, wind_speed, wind_direction, interval,
-                 location):
+                 location, config=None, wind_condition=None):
+        if config is None:
+            config = get_config()
         self.interval = interval
         self.date = date
         self.time = time
         self.temperature = temperature
         self.main_condition = main_condition
-        self.other_conditions = [WindCondition(wind_speed, wind_direction)]
+        self.wind_speed = wind_speed
+        self.wind_direction = wind_direction
+        if wind_condition is None:
+            wind_condition = get_wind_condition(wind_speed, wind_direction, config)
+        self.other_conditions = [wind_condition]
         self.pressure = pressure
         self.humidity = humidity
         self.location = location
+        self.timezone = config.timezone
         if self.main_condition.condition_type == ConditionType.CLEAR:
             if self.is_during_day:
-                self.other_conditions.append(WeatherCondition(0, "", ConditionType.SUN))
+                self.other_conditions.append(get_condition(0, "", ConditionType.SUN, config.locale))
             if self.is_during_night:
-                self.other_conditions.append(WeatherCondition(0, "", ConditionType.STARS))
+                self.other_conditions.append(get_condition(0, "", ConditionType.STARS, config.locale))
 
     def __str__(self):
         return "[" + str(self.string_time) + ", " + str(self.temperature) + ", " + str(self.weather_condition) + \
@@ -59,10 +67,19 @@ class WeatherAtTime:
     def string_time(self):
         return self.__time.strftime("%H:%M:%S")
 
+    @property
+    def sunrise_and_sunset(self):
+        """sunrise and sunset of the date of this forecast, None if unknown"""
+        if self.location is None:
+            return None, None
+        return self.location.get_sunrise_and_sunset(self.date, self.timezone)
+
     @property
     def is_during_day(self):
-        return self.location.sunrise <= self.time <= self.location.sunset
+        sunrise, sunset = self.sunrise_and_sunset
+        return sunrise is not None and sunrise <= self.time <= sunset
 
     @property
     def is_during_night(self):
-        return self.location.sunset <= self.time <= self.location.sunrise
+        sunrise, sunset = self.sunrise_and_sunset
+        return sunrise is not None and not sunrise <= self.time <= sunset
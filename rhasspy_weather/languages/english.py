@@ -18,6 +18,11 @@ month_names = ["January", "February", "March", "April", "May", "June", "July", "
                "November", "December"]
 named_days = {"today": 0, "tomorrow": 1, "the day after tomorrow": 2}
 named_days_synonyms = {}
+# several days, either (days from today, number of days) or (weekday, number of days)
+named_ranges = {"over the weekend": ("Saturday", 2), "over the next three days": (0, 3), "over the next days": (0, 5)}
+named_ranges_synonyms = {"the weekend": "over the weekend", "this weekend": "over the weekend", "weekend": "over the weekend",
+                         "the next three days": "over the next three days", "next three days": "over the next three days",
+                         "the next days": "over the next days"}
 named_times = {
     "morning": (datetime.time(6, 0), datetime.time(12, 0)),
     "midday": datetime.time(12, 0),
@@ -116,7 +121,8 @@ status_response = {
     ErrorCode.CONFIG_ERROR: ["There seems to be something wrong with the configuration file."],
     ErrorCode.TIME_ERROR: ["Something is wrong with the time."],
     ErrorCode.MQTT_CONNECTION_ERROR: ["I can't contact the mqtt broker."],
-    ErrorCode.GENERAL_ERROR: ["Something went wrong."]
+    ErrorCode.GENERAL_ERROR: ["Something went wrong."],
+    ErrorCode.ITEM_ERROR: ["I don't know that item."]
 }
 
 
@@ -142,6 +148,10 @@ def format_output_date(request):
     return date
 
 
+def format_output_date_range(request):
+    return "from " + request.weekday + " to " + weekday_names[request.end_date.weekday()]
+
+
 def format_output_time(request):
     return "at " + request.readable_start_time + " o'clock"
 
@@ -220,7 +230,12 @@ general_answers = {
     "negative": ["No"],
     "item_needed": ["{article} {noun} sounds useful", "{article} {noun} could help", "{article} {noun} {verb} a good idea"],
     "item_not_needed": ["{article} {noun} {verb} {when} {where} useless"],
-    "weather": ["The weather will be: {weather}", "The Weather: {weather}"]
+    "items_needed": ["{items} could be useful {when} {where}", "You might need {items} {when} {where}"],
+    "no_items_needed": ["You won't need anything special {when} {where}"],
+    "weather": ["The weather will be: {weather}", "The Weather: {weather}"],
+    "detailed_full": ["{time}: {weather}, {temperature}."],
+    "detailed_temperature": ["{time}: {temperature}."],
+    "detailed_condition": ["{time}: {weather}."]
 }
 
 
@@ -247,9 +262,9 @@ grammar = {
 items = WeatherItemList()
 items.add_item("umbrella", NounType.SINGULAR, article="an", weather_list=[ConditionType.RAIN, ConditionType.SNOW])
 items.add_item("raincoat", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN, ConditionType.WIND])
-items.add_item("rain coat", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN, ConditionType.WIND])
+items.add_item("rain coat", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN, ConditionType.WIND], variant_of="raincoat")
 items.add_item("rubber boots", NounType.PLURAL, weather_list=[ConditionType.RAIN])
-items.add_item("pair of rubber boots", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN])
+items.add_item("pair of rubber boots", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN], variant_of="rubber boots")
 items.add_item("sandals", NounType.PLURAL, weather_list=[TemperatureType.WARM, ConditionType.SUN])
 items.add_item("sunglasses", NounType.PLURAL, weather_list=[ConditionType.SUN])
 items.add_item("sunscreen", NounType.SINGULAR, weather_list=[ConditionType.SUN])
@@ -262,14 +277,12 @@ items.add_item("hoodie", NounType.SINGULAR, article="a", weather_list=[Temperatu
 items.add_item("sun hat", NounType.SINGULAR, article="a", weather_list=[ConditionType.SUN])
 items.add_item("cap", NounType.SINGULAR, article="a", weather_list=[ConditionType.SUN])
 items.add_item("parasol", NounType.SINGULAR, article="a", weather_list=[ConditionType.SUN])
-items.add_item("boots", NounType.PLURAL, weather_list=[ConditionType.RAIN, TemperatureType.COLD, ConditionType.WIND])
-items.add_item("pair of boots", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN, TemperatureType.COLD, ConditionType.WIND])
-items.add_item("sun screen", NounType.SINGULAR, weather_list=[ConditionType.SUN])
-items.add_item("pair of gloves", NounType.SINGULAR, article="a", weather_list=[TemperatureType.COLD])
+items.add_item("pair of boots", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN, TemperatureType.COLD, ConditionType.WIND], variant_of="boots")
+items.add_item("sun screen", NounType.SINGULAR, weather_list=[ConditionType.SUN], variant_of="sunscreen")
+items.add_item("pair of gloves", NounType.SINGULAR, article="a", weather_list=[TemperatureType.COLD], variant_of="gloves")
 items.add_item("sneakers", NounType.PLURAL, weather_list=[TemperatureType.COLD, ConditionType.WIND])
 items.add_item("winter boots", NounType.PLURAL, weather_list=[TemperatureType.COLD, ConditionType.SNOW])
-items.add_item("pair of winter boots", NounType.SINGULAR, article="a", weather_list=[TemperatureType.COLD, ConditionType.SNOW])
+items.add_item("pair of winter boots", NounType.SINGULAR, article="a", weather_list=[TemperatureType.COLD, ConditionType.SNOW], variant_of="winter boots")
 items.add_item("winter coat", NounType.SINGULAR, article="a", weather_list=[TemperatureType.COLD, ConditionType.SNOW])
-items.add_item("sandals", NounType.PLURAL, weather_list=[TemperatureType.WARM, ConditionType.SUN])
-items.add_item("pair of sandals", NounType.SINGULAR, article="a", weather_list=[TemperatureType.WARM, ConditionType.SUN])
+items.add_item("pair of sandals", NounType.SINGULAR, article="a", weather_list=[TemperatureType.WARM, ConditionType.SUN], variant_of="sandals")
 
@@ -17,6 +17,10 @@ month_names = ["Januar", "Februar", "März", "April", "Mai", "Juni", "Juli", "Au
                "November", "Dezember"]
 named_days = {"heute": 0, "morgen": 1, "übermorgen": 2, "weihnachten": (24, 12)}
 named_days_synonyms = {"heilig abend": "weihnachten"}
+# several days, either (days from today, number of days) or (weekday, number of days)
+named_ranges = {"am Wochenende": ("Samstag", 2), "in den nächsten drei Tagen": (0, 3), "in den nächsten Tagen": (0, 5)}
+named_ranges_synonyms = {"wochenende": "am Wochenende", "dieses wochenende": "am Wochenende",
+                         "die nächsten drei tage": "in den nächsten drei Tagen", "die nächsten tage": "in den nächsten Tagen"}
 named_times = {
     "Morgen": (datetime.time(6, 0), datetime.time(10, 0)),
     "Vormittag": (datetime.time(10, 0), datetime.time(12, 0)),
@@ -119,7 +123,8 @@ status_response = {
     ErrorCode.CONFIG_ERROR: ["Es gab ein Problem beim Laden der Konfigurationsdatei."],
     ErrorCode.TIME_ERROR: ["Irgendwas stimmt mit der angegebenen Zeit nicht."],
     ErrorCode.MQTT_CONNECTION_ERROR: ["Ich kann keine Verbindung zum MQTT Broker herstellen."],
-    ErrorCode.GENERAL_ERROR: ["Es ist ein Fehler aufgetreten.", "Hier ist ein Fehler aufgetreten."]
+    ErrorCode.GENERAL_ERROR: ["Es ist ein Fehler aufgetreten.", "Hier ist ein Fehler aufgetreten."],
+    ErrorCode.ITEM_ERROR: ["Diesen Gegenstand kenne ich nicht."]
 }
 
 
@@ -145,6 +150,10 @@ def format_output_date(request):
     return date
 
 
+def format_output_date_range(request):
+    return "von " + request.weekday + " bis " + weekday_names[request.end_date.weekday()]
+
+
 def format_output_time(request):
     return "um " + request.readable_start_time + " Uhr"
 
@@ -248,7 +257,12 @@ general_answers = {
     "item_not_needed": ["{article} {noun} {verb} {when} {where} unnötig",
                         "{article} {noun} {verb} {when} {where} sinnlos",
                         "{article} {noun} macht {when} {where} keinen Sinn"],
-    "weather": ["Das Wetter ist: {weather}", "Das Wetter: {weather}"]
+    "items_needed": ["Das könnte {when} {where} praktisch sein: {items}", "Praktisch {when} {where}: {items}"],
+    "no_items_needed": ["Du brauchst {when} {where} nichts Besonderes"],
+    "weather": ["Das Wetter ist: {weather}", "Das Wetter: {weather}"],
+    "detailed_full": ["{time}: {weather}, {temperature}."],
+    "detailed_temperature": ["{time}: {temperature}."],
+    "detailed_condition": ["{time}: {weather}."]
 }
 
 
@@ -281,7 +295,7 @@ items.add_item("Halbschuhe", NounType.PLURAL,
 items.add_item("Kaputze", NounType.SINGULAR, article="eine", weather_list=[ConditionType.RAIN])
 items.add_item("Hut", NounType.SINGULAR, article="ein",
                weather_list=[ConditionType.RAIN, ConditionType.SUN, ConditionType.SNOW])
-items.add_item("Regenschirm", NounType.SINGULAR, article="ein", weather_list=[ConditionType.RAIN, ConditionType.SNOW])
+items.add_item("Regenschirm", NounType.SINGULAR, article="ein", weather_list=[ConditionType.RAIN, ConditionType.SNOW], variant_of="Schirm")
 items.add_item("T-Shirt", NounType.SINGULAR, article="ein", weather_list=[TemperatureType.WARM, ConditionType.SUN])
 items.add_item("Sandalen", NounType.PLURAL, weather_list=[TemperatureType.WARM, ConditionType.SUN])
 items.add_item("kurze Hosen", NounType.PLURAL, weather_list=[TemperatureType.WARM, ConditionType.SUN])
@@ -305,18 +319,18 @@ items.add_item("Sonnenschirm", NounType.SINGULAR, article="ein", weather_list=[C
 items.add_item("Kappe", NounType.SINGULAR, article="eine", weather_list=[ConditionType.SUN])
 items.add_item("Sonnenbrille", NounType.SINGULAR, article="eine", weather_list=[ConditionType.SUN])
 items.add_item("Sonnencreme", NounType.SINGULAR, weather_list=[ConditionType.SUN])
-items.add_item("paar Gummistiefel", NounType.SINGULAR, article="ein", weather_list=[ConditionType.RAIN])
+items.add_item("paar Gummistiefel", NounType.SINGULAR, article="ein", weather_list=[ConditionType.RAIN], variant_of="Gummistiefel")
 items.add_item("paar lange Unterhosen", NounType.SINGULAR, article="ein",
-               weather_list=[TemperatureType.COLD, ConditionType.SNOW])
+               weather_list=[TemperatureType.COLD, ConditionType.SNOW], variant_of="lange Unterhosen")
 items.add_item("paar Handschuhe", NounType.SINGULAR, article="ein",
-               weather_list=[TemperatureType.COLD, ConditionType.SNOW])
+               weather_list=[TemperatureType.COLD, ConditionType.SNOW], variant_of="Handschuhe")
 items.add_item("paar Stiefel", NounType.SINGULAR, article="ein",
                weather_list=[ConditionType.RAIN, TemperatureType.COLD, ConditionType.SNOW, ConditionType.WIND,
-                             ConditionType.THUNDERSTORM])
+                             ConditionType.THUNDERSTORM], variant_of="Stiefel")
 items.add_item("paar Sandalen", NounType.SINGULAR, article="ein",
-               weather_list=[TemperatureType.WARM, ConditionType.SUN])
+               weather_list=[TemperatureType.WARM, ConditionType.SUN], variant_of="Sandalen")
 items.add_item("paar Winterstiefel", NounType.SINGULAR, article="ein",
-               weather_list=[TemperatureType.COLD, ConditionType.SNOW])
+               weather_list=[TemperatureType.COLD, ConditionType.SNOW], variant_of="Winterstiefel")
 items.add_item("Winterjacke", NounType.SINGULAR, article="eine",
                weather_list=[TemperatureType.COLD, ConditionType.SNOW])
 items.add_item("Teleskop", NounType.SINGULAR, article="ein", weather_list=[ConditionType.STARS])
@@ -1,7 +1,5 @@
 import logging
 
-import paho.mqtt.client as mqtt
-
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode, ConfigError
 
 log = logging.getLogger(__name__)
@@ -14,6 +12,8 @@ mqtt_topic = "rhasspy_weather/response"
 
 
 def output_response(output):
+    import paho.mqtt.client as mqtt
+
     log.debug("Selected output: mqtt")
     if mqtt_address is None or mqtt_address is "":
         raise ConfigError("No mqtt broker address found", "No mqtt address set. This is required for rhasspy weather to work.")
@@ -1,7 +1,7 @@
 import logging
-import requests
 
-from rhasspy_weather.data_types.error import ConfigError
+from rhasspy_weather.data_types.error import ConfigError, WeatherError, ErrorCode
+from rhasspy_weather.utils import http_client
 
 log = logging.getLogger(__name__)
 
@@ -9,12 +9,17 @@ rhasspy_url = None
 
 
 def output_response(output):
+    import requests
+
     log.debug("Selected output: rhasspy_tts")
     if rhasspy_url is None:
         raise ConfigError("No URL found", "No rhasspy server url found.")
     headers = {"Content-Type": "text/plain"}
     url = rhasspy_url + "/api/text-to-speech?play=true"
-    response = requests.post(url, data=output.encode(), headers=headers)
+    try:
+        http_client.post(url, data=output.encode(), headers=headers)
+    except requests.exceptions.RequestException as e:
+        raise WeatherError(ErrorCode.NO_NETWORK_ERROR, f"Rhasspy could not be reached: {e}")
 
 
 def parse_config(config):
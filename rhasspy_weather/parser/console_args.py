@@ -1,75 +1,79 @@
-import datetime
 import json
 import logging
 
 from rhasspy_weather.data_types.request import WeatherRequest, DateType, ForecastType, Grain
-from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import get_context
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
 from rhasspy_weather.utils.parser import parse_date, parse_time, parse_condition, parse_item, parse_temperature, parse_location
 
 log = logging.getLogger(__name__)
 
 
-def parse_intent_message(args: json) -> WeatherRequest:
+def parse_intent_message(args: json, context=None) -> WeatherRequest:
     """
     Parses any of the rhasspy weather intents.
 
     Args:
         args: dict containing the arguments
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
     if hasattr(args, "condition") and args.condition is not None:
-        return parse_condition_intent(args)
+        return parse_condition_intent(args, context)
     elif hasattr(args, "item") and args.item is not None:
-        return parse_item_intent(args)
+        return parse_item_intent(args, context)
     elif hasattr(args, "temperature") and args.temperature is not None:
-        return parse_temperature_intent(args)
+        return parse_temperature_intent(args, context)
 
-    return parse_general_intent(args)
+    return parse_general_intent(args, context)
 
 
-def parse_general_intent(args: json) -> WeatherRequest:
+def parse_general_intent(args: json, context=None) -> WeatherRequest:
     """
     Parses general rhasspy weather intents.
 
     Args:
         args: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    config = get_config()
-    today = datetime.datetime.now(config.timezone).date()
+    context = get_context(context)
+    today = context.today()
 
     # define default request
-    new_request = WeatherRequest(DateType.FIXED, Grain.DAY, today, ForecastType.FULL)
+    new_request = WeatherRequest(DateType.FIXED, Grain.DAY, today, ForecastType.FULL, context)
 
     if hasattr(args, "day") and args.day is not None:
-        new_request.request_date, new_request.date_specified = parse_date(args.day, config.locale)
+        new_request.set_date(*parse_date(args.day, context.locale, context))
 
     if hasattr(args, "time") and args.time is not None:
-        time, str_time = parse_time(args.time, config.locale)
+        time, str_time = parse_time(args.time, context.locale, context)
         new_request.set_time(time, str_time)
 
     if hasattr(args, "location") and args.location is not None:
-        new_request.location = parse_location(args.location, config.locale)
+        new_request.location = parse_location(args.location, context.locale)
 
     return new_request
 
 
-def parse_condition_intent(args: json) -> WeatherRequest:
+def parse_condition_intent(args: json, context=None) -> WeatherRequest:
     """
     Parses rhasspy condition weather intent.
 
     Args:
         args: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    locale = get_config().locale
-    new_request = parse_general_intent(args)
+    context = get_context(context)
+    locale = context.locale
+    new_request = parse_general_intent(args, context)
 
     new_request.forecast_type = ForecastType.CONDITION
     arg_condition = args.condition
@@ -78,38 +82,47 @@ def parse_condition_intent(args: json) -> WeatherRequest:
     return new_request
 
 
-def parse_item_intent(args: json) -> WeatherRequest:
+def parse_item_intent(args: json, context=None) -> WeatherRequest:
     """
     Parses rhasspy item weather intent
 
     Args:
         args: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
+    Raises:
+        WeatherError: the item is not in the item list of the locale
+
     """
-    locale = get_config().locale
-    new_request = parse_general_intent(args)
+    context = get_context(context)
+    locale = context.locale
+    new_request = parse_general_intent(args, context)
 
     new_request.forecast_type = ForecastType.ITEM
     arg_item = args.item
     if arg_item is not None:
         new_request.requested = parse_item(arg_item, locale)
+        if new_request.requested is None:
+            raise WeatherError(ErrorCode.ITEM_ERROR, f"Unknown item '{arg_item}'", locale)
     return new_request
 
 
-def parse_temperature_intent(args: json) -> WeatherRequest:
+def parse_temperature_intent(args: json, context=None) -> WeatherRequest:
     """
     Parses rhasspy temperature weather intent
 
     Args:
         args: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    locale = get_config().locale
-    new_request = parse_general_intent(args)
+    context = get_context(context)
+    locale = context.locale
+    new_request = parse_general_intent(args, context)
 
     new_request.forecast_type = ForecastType.TEMPERATURE
     arg_temperature = args.temperature
@@ -118,13 +131,8 @@ def parse_temperature_intent(args: json) -> WeatherRequest:
     return new_request
 
 
-__template_values = None
-
-
 def get_template_values(intent_message) -> dict:
-    global __template_values
-    if __template_values is None:
-        __template_values = {}
-        for key, value in vars(intent_message).items():
-            __template_values["intent_" + key] = value
-    return __template_values
+    template_values = {}
+    for key, value in vars(intent_message).items():
+        template_values["intent_" + key] = value
+    return template_values
@@ -7,17 +7,18 @@ from rhasspyhermes.nlu import NluIntent
 log = logging.getLogger(__name__)
 
 
-def parse_intent_message(intent_message: NluIntent) -> WeatherRequest:
+def parse_intent_message(intent_message: NluIntent, context=None) -> WeatherRequest:
     """
     Parses any of the rhasspy weather intents.
 
     Args:
         intent_message: a Hermes NluIntent
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    return rhasspy_intent.parse_intent_message(intent_message.to_rhasspy_dict())
+    return rhasspy_intent.parse_intent_message(intent_message.to_rhasspy_dict(), context)
 
 
 def get_template_values(intent_message: NluIntent) -> dict:
@@ -1,8 +1,8 @@
-import datetime
 import logging
 
 from rhasspy_weather.data_types.request import WeatherRequest, DateType, ForecastType, Grain
-from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import get_context
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
 from rhasspy_weather.utils.parser import parse_date, parse_time, parse_condition, parse_temperature, parse_item, \
     parse_location
 
@@ -19,69 +19,73 @@ slot_names = {
 }
 
 
-def parse_intent_message(intent_message: dict) -> WeatherRequest:
+def parse_intent_message(intent_message: dict, context=None) -> WeatherRequest:
     """
     Parses any of the rhasspy weather intents.
 
     Args:
         intent_message: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
     if "GetWeatherForecastCondition" == intent_message["intent"]["name"]:
-        return parse_condition_intent(intent_message)
+        return parse_condition_intent(intent_message, context)
     elif "GetWeatherForecastItem" == intent_message["intent"]["name"]:
-        return parse_item_intent(intent_message)
+        return parse_item_intent(intent_message, context)
     elif "GetWeatherForecastTemperature" == intent_message["intent"]["name"]:
-        return parse_temperature_intent(intent_message)
+        return parse_temperature_intent(intent_message, context)
 
-    return parse_general_intent(intent_message)
+    return parse_general_intent(intent_message, context)
 
 
-def parse_general_intent(intent_message: dict) -> WeatherRequest:
+def parse_general_intent(intent_message: dict, context=None) -> WeatherRequest:
     """
     Parses general rhasspy weather intents.
 
     Args:
         intent_message: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    config = get_config()
-    today = datetime.datetime.now(config.timezone).date()
+    context = get_context(context)
+    today = context.today()
 
     # define default request
-    new_request = WeatherRequest(DateType.FIXED, Grain.DAY, today, ForecastType.FULL)
+    new_request = WeatherRequest(DateType.FIXED, Grain.DAY, today, ForecastType.FULL, context)
 
     slots = intent_message["slots"]
 
     if slot_names["day"] in slots and slots[slot_names["day"]] != "":
-        new_request.request_date, new_request.date_specified = parse_date(slots[slot_names["day"]], config.locale)
+        new_request.set_date(*parse_date(slots[slot_names["day"]], context.locale, context))
 
     if slot_names["time"] in slots and slots[slot_names["time"]] != "":
-        time, str_time = parse_time(slots[slot_names["time"]], config.locale)
+        time, str_time = parse_time(slots[slot_names["time"]], context.locale, context)
         new_request.set_time(time, str_time)
 
     if slot_names["location"] in slots and slots[slot_names["location"]] != "":
-        new_request.location = parse_location(slots[slot_names["location"]], config.locale)
+        new_request.location = parse_location(slots[slot_names["location"]], context.locale)
 
     return new_request
 
 
-def parse_condition_intent(intent_message: dict) -> WeatherRequest:
+def parse_condition_intent(intent_message: dict, context=None) -> WeatherRequest:
     """
     Parses rhasspy condition weather intent.
 
     Args:
         intent_message: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    locale = get_config().locale
-    new_request = parse_general_intent(intent_message)
+    context = get_context(context)
+    locale = context.locale
+    new_request = parse_general_intent(intent_message, context)
 
     slots = intent_message["slots"]
     new_request.forecast_type = ForecastType.CONDITION
@@ -90,38 +94,47 @@ def parse_condition_intent(intent_message: dict) -> WeatherRequest:
     return new_request
 
 
-def parse_item_intent(intent_message: dict) -> WeatherRequest:
+def parse_item_intent(intent_message: dict, context=None) -> WeatherRequest:
     """
-    Parses rhasspy item weather intent
+    Parses rhasspy item weather intent, without an item slot it asks for all useful items
 
     Args:
         intent_message: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
+    Raises:
+        WeatherError: the item is not in the item list of the locale
+
     """
-    locale = get_config().locale
-    new_request = parse_general_intent(intent_message)
+    context = get_context(context)
+    locale = context.locale
+    new_request = parse_general_intent(intent_message, context)
 
     slots = intent_message["slots"]
     new_request.forecast_type = ForecastType.ITEM
-    if slot_names["item"] in slots:
+    if slot_names["item"] in slots and slots[slot_names["item"]] != "":
         new_request.requested = parse_item(slots[slot_names["item"]], locale)
+        if new_request.requested is None:
+            raise WeatherError(ErrorCode.ITEM_ERROR, f"Unknown item '{slots[slot_names['item']]}'", locale)
     return new_request
 
 
-def parse_temperature_intent(intent_message: dict) -> WeatherRequest:
+def parse_temperature_intent(intent_message: dict, context=None) -> WeatherRequest:
     """
     Parses rhasspy temperature weather intent
 
     Args:
         intent_message: the rhasspy intent message
+        context: WeatherContext, the current config is used if it is None
 
     Returns: WeatherRequest object
 
     """
-    locale = get_config().locale
-    new_request = parse_general_intent(intent_message)
+    context = get_context(context)
+    locale = context.locale
+    new_request = parse_general_intent(intent_message, context)
 
     slots = intent_message["slots"]
     new_request.forecast_type = ForecastType.TEMPERATURE
@@ -130,17 +143,12 @@ def parse_temperature_intent(intent_message: dict) -> WeatherRequest:
     return new_request
 
 
-__template_values = None
-
-
 def get_template_values(intent_message) -> dict:
-    global __template_values
-    if __template_values is None:
-        __template_values = {}
-        for key, value in intent_message.items():
-            if key == "intent":
-                for i_key, i_value in value.items():
-                    __template_values["intent_" + i_key] = i_value
-            else:
-                __template_values["intent_" + key] = value
-    return __template_values
+    template_values = {}
+    for key, value in intent_message.items():
+        if key == "intent":
+            for i_key, i_value in value.items():
+                template_values["intent_" + i_key] = i_value
+        else:
+            template_values["intent_" + key] = value
+    return template_values
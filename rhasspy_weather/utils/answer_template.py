@@ -0,0 +1,95 @@
+import functools
+import re
+import string
+
+# number of texts compile_answer keeps, enough for the answers of the locales and the sentences built from them
+compile_cache_size = 1024
+
+# names of the answer dicts of a locale that are compiled
+answer_names = ["temperature_answers", "condition_answers", "general_answers"]
+
+
+class AnswerTemplate(str):
+    """
+    Answer of a locale like "The weather {when} {where}: {weather}.", parsed once into literal text and field names.
+    It is still a str, so locales and code that use str.format keep working.
+    """
+    __formatter = string.Formatter()
+    __whitespace = re.compile(r" {2,}")
+
+    def __new__(cls, text: str):
+        template = super().__new__(cls, text)
+        parts = []
+        for literal, field, format_spec, conversion in cls.__formatter.parse(text):
+            parts.append((cls.__whitespace.sub(" ", literal), field, format_spec, conversion))
+        template.parts = tuple(parts)
+        template.fields = frozenset(x[1] for x in parts if x[1] is not None)
+        return template
+
+    def render(self, **values) -> str:
+        """
+        Fills the fields in one pass like str.format, including conversions and format specs. Fields without
+        a value keep their placeholder, so the result can be combined with other answers and rendered again.
+
+        Args:
+            **values: values of the fields, by field name
+
+        Returns: the rendered text
+
+        """
+        result = []
+        for literal, field, format_spec, conversion in self.parts:
+            result.append(literal)
+            if field is None:
+                continue
+            value = values.get(field)
+            if value is None:
+                result.append("{" + field + ("!" + conversion if conversion else "")
+                              + (":" + format_spec if format_spec else "") + "}")
+            elif format_spec or conversion:
+                value = self.__formatter.convert_field(value, conversion)
+                result.append(self.__formatter.format_field(value, format_spec))
+            else:
+                result.append(str(value))
+        return "".join(result)
+
+
+def compile_answer(text: str) -> AnswerTemplate:
+    """returns the AnswerTemplate for a text, texts are only parsed the first time"""
+    if isinstance(text, AnswerTemplate):
+        return text
+    return _compile(text)
+
+
+@functools.lru_cache(maxsize=compile_cache_size)
+def _compile(text: str) -> AnswerTemplate:
+    return AnswerTemplate(text)
+
+
+def compile_answers(answers):
+    """turns all strings in nested dicts and lists of answers into AnswerTemplates"""
+    if isinstance(answers, dict):
+        return {key: compile_answers(value) for key, value in answers.items()}
+    if isinstance(answers, list):
+        return [compile_answers(x) for x in answers]
+    if isinstance(answers, str):
+        return compile_answer(answers)
+    return answers
+
+
+def compile_locale(locale):
+    """
+    Compiles the answers of a locale module in place, modules that are already compiled are left alone.
+
+    Args:
+        locale: the locale module
+
+    Returns: the locale module
+
+    """
+    if not getattr(locale, "answers_compiled", False):
+        for name in answer_names:
+            if hasattr(locale, name):
+                setattr(locale, name, compile_answers(getattr(locale, name)))
+        locale.answers_compiled = True
+    return locale
@@ -2,15 +2,14 @@ import datetime
 import logging
 from typing import Union, Tuple
 
-from dateutil.relativedelta import relativedelta
-
-from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import get_context
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.utils.locale_index import get_locale_index
 
 log = logging.getLogger(__name__)
 
 
-def get_date_with_year(day: int, month: int, can_be_past_date: bool = False) -> datetime.date:
+def get_date_with_year(day: int, month: int, can_be_past_date: bool = False, context=None) -> datetime.date:
     """
     Takes a day and a month without a year and outputs a datetime.date with the year. The year is
     the current year unless the date has already passed, then the boolean switch decides. If that is True
@@ -23,10 +22,13 @@ def get_date_with_year(day: int, month: int, can_be_past_date: bool = False) ->
         day: number of day - int
         month: number of month - int
         can_be_past_date: True if dates before today should be in the past, else False (default)
+        context: WeatherContext, the current config is used if it is None
 
     Returns: date as datetime.date
     """
-    today = datetime.datetime.now(get_config().timezone).date()
+    from dateutil.relativedelta import relativedelta
+
+    today = get_context(context).today()
     delta_days = day - today.day
     delta_month = month - today.month
     delta_year = 0
@@ -37,59 +39,108 @@ def get_date_with_year(day: int, month: int, can_be_past_date: bool = False) ->
     return today + relativedelta(years=delta_year, months=delta_month, days=delta_days)
 
 
-def named_day_to_date(named_day: str) -> datetime.date:
+def named_day_to_date(named_day: str, context=None) -> datetime.date:
     """
     Parses a string containing a named day to the date.
 
     Args:
         named_day: string containing a valid named day (locale.named_days and locale.named_days_synonyms)
+        context: WeatherContext, the current config is used if it is None
 
     Returns: the date of the named_day
     """
-    locale = get_config().locale
-    named_days_lowercase = [x.lower() for x in locale.named_days]
-    named_days_synonyms_lowercase = [x.lower() for x in locale.named_days_synonyms]
-    value = None
-    if named_day.lower() in named_days_synonyms_lowercase:
-        index = named_days_synonyms_lowercase.index(named_day.lower())
-        name = list(locale.named_days_synonyms.keys())[index]
-        value = locale.named_days[locale.named_days_synonyms[name]]
-    elif named_day.lower() in named_days_lowercase:
-        index = named_days_lowercase.index(named_day.lower())
-        value = list(locale.named_days.values())[index]
+    value = get_locale_index(get_context(context).locale).named_days.get(named_day.casefold(), (None, None))[1]
     if isinstance(value, Tuple):
-        return get_date_with_year(value[0], value[1])
+        return get_date_with_year(value[0], value[1], context=context)
     elif isinstance(value, int):
-        return datetime.date.today() + datetime.timedelta(value)
+        return get_context(context).today() + datetime.timedelta(value)
     else:
         log.error("Invalid datatype specified in locale.named_days or locale.named_days_synonyms")
         raise WeatherError(ErrorCode.DATE_ERROR)
 
 
-def named_day_to_str(named_day: str) -> str:
+def named_day_to_str(named_day: str, context=None) -> str:
     """
     Takes a named day and formats it for output.
     If named day is not in locale, returns the input
 
     Args:
         named_day: string containing a valid named day (locale.named_days and locale.named_days_synonyms)
+        context: WeatherContext, the current config is used if it is None
 
     Returns: named_day formatted for output
     """
-    locale = get_config().locale
-    named_days_lowercase = [x.lower() for x in locale.named_days]
-    named_days_synonyms_lowercase = [x.lower() for x in locale.named_days_synonyms]
-    if named_day.lower() in named_days_synonyms_lowercase:
-        index = named_days_synonyms_lowercase.index(named_day.lower())
-        return list(locale.named_days_synonyms.keys())[index]
-    elif named_day.lower() in named_days_lowercase:
-        index = named_days_lowercase.index(named_day.lower())
-        return list(locale.named_days.keys())[index]
+    return get_locale_index(get_context(context).locale).named_days.get(named_day.casefold(), (named_day,))[0]
+
+
+def __find_named_range(named_range: str, context=None):
+    """returns the name of a named range in locale.named_ranges and its value, synonyms are resolved"""
+    return get_locale_index(get_context(context).locale).named_ranges.get(named_range.casefold(), (None, None))
+
+
+def is_named_range(named_range: str, context=None) -> bool:
+    """
+    Checks if a string is a named range of several days (locale.named_ranges and locale.named_ranges_synonyms).
 
-    return named_day
+    Args:
+        named_range: string to check
+        context: WeatherContext, the current config is used if it is None
 
+    Returns: True if it is a named range, else False
+    """
+    return __find_named_range(named_range, context)[0] is not None
+
+
+def named_range_to_dates(named_range: str, context=None) -> Tuple[datetime.date, datetime.date]:
+    """
+    Parses a string containing a named range of several days to its first and last date.
+
+    A range is specified in the locale either as (days from today, number of days) or as (weekday, number of days).
+    Ranges starting on a weekday start today if today is one of the days of the range, so "the weekend" on a
+    Sunday is only that Sunday.
+
+    Args:
+        named_range: string containing a valid named range (locale.named_ranges and locale.named_ranges_synonyms)
+        context: WeatherContext, the current config is used if it is None
 
-def weekday_to_date(weekday: str, next_week: bool = False) -> datetime.date:
+    Returns: tuple of the first and the last date of the range
+    """
+    config = get_context(context)
+    today = config.today()
+    name, value = __find_named_range(named_range, context)
+    if not isinstance(value, tuple) or len(value) != 2 or not isinstance(value[1], int) or value[1] < 1:
+        log.error("Invalid range specified in locale.named_ranges or locale.named_ranges_synonyms")
+        raise WeatherError(ErrorCode.DATE_ERROR)
+    start, days = value
+    if isinstance(start, int):
+        first = today + datetime.timedelta(start)
+        return first, first + datetime.timedelta(days - 1)
+    elif isinstance(start, str) and start.casefold() in get_locale_index(config.locale).weekdays:
+        weekday_number = get_locale_index(config.locale).weekdays[start.casefold()]
+        days_since_start = (today.weekday() - weekday_number) % 7
+        if days_since_start < days:
+            return today, today + datetime.timedelta(days - 1 - days_since_start)
+        first = weekday_to_date(start, context=context)
+        return first, first + datetime.timedelta(days - 1)
+    log.error("Invalid range specified in locale.named_ranges or locale.named_ranges_synonyms")
+    raise WeatherError(ErrorCode.DATE_ERROR)
+
+
+def named_range_to_str(named_range: str, context=None) -> str:
+    """
+    Takes a named range and formats it for output. If the named range is not in locale, it returns the input.
+
+    Args:
+        named_range: string containing a valid named range (locale.named_ranges and locale.named_ranges_synonyms)
+        context: WeatherContext, the current config is used if it is None
+
+    Returns: named_range formatted for output
+    """
+    name = __find_named_range(named_range, context)[0]
+    return named_range if name is None else name
+
+
+def weekday_to_date(weekday: str, next_week: bool = False, context=None) -> datetime.date:
     """
     Takes a string containing a valid weekday (in weekday_names of locale) and returns the date based on today.
 
@@ -106,21 +157,24 @@ def weekday_to_date(weekday: str, next_week: bool = False) -> datetime.date:
     Args:
         weekday: string containing the weekday to parse
         next_week: (optional) boolean controlling of a date of the next week will be enforced, default is False
+        context: WeatherContext, the current config is used if it is None
 
     Returns: the date of the requested weekday
 
     """
-    config = get_config()
-    today = datetime.datetime.now(config.timezone).date()
-    weekdays_lowercase = [x.lower() for x in config.locale.weekday_names]
-    weekday_number = weekdays_lowercase.index(weekday.lower())
+    config = get_context(context)
+    today = config.today()
+    weekday_number = get_locale_index(config.locale).weekdays.get(weekday.casefold())
+    if weekday_number is None:
+        log.error(f"'{weekday}' is not in locale.weekday_names")
+        raise WeatherError(ErrorCode.DATE_ERROR)
     offset = weekday_number - today.weekday()
     if next_week or today.weekday() >= weekday_number:
         offset = offset + 7
     return today + datetime.timedelta(offset)
 
 
-def date_string_to_str(input_string: str, separator: str = " ") -> str:
+def date_string_to_str(input_string: str, separator: str = " ", context=None) -> str:
     """
     Takes strings in format 'day[separator]month' and formats them for output depending on how day and month are specified.
     If the month is specified as a month name it will output 'day. month', if month is numeric it will output 'day.month'.
@@ -131,22 +185,23 @@ def date_string_to_str(input_string: str, separator: str = " ") -> str:
     Args:
         input_string: string to be formatted for output
         separator: an (optional) separator between day and month, default is ' '
+        context: WeatherContext, the current config is used if it is None
 
     Returns: formatted output or the input string
     """
-    locale = get_config().locale
+    locale = get_context(context).locale
     day, month = input_string.split(separator)
-    months_lowercase = [x.lower() for x in locale.month_names]
+    month_number = get_locale_index(locale).months.get(month.casefold())
 
-    if month.lower() in months_lowercase:
-        return day + ". " + locale.month_names[months_lowercase.index(month.lower())]
+    if month_number is not None:
+        return day + ". " + locale.month_names[month_number - 1]
     elif month.isnumeric():
         return day + "." + month
 
     return input_string
 
 
-def date_string_to_date(input_string: str, separator: str = " ") -> datetime.date:
+def date_string_to_date(input_string: str, separator: str = " ", context=None) -> datetime.date:
     """
     Takes strings in format 'day[separator]month' and parses them as a date. If the input can't be parsed
     into a date a WeatherError occurs.
@@ -154,22 +209,21 @@ def date_string_to_date(input_string: str, separator: str = " ") -> datetime.dat
     Args:
         input_string: string to be parsed
         separator: an (optional) separator between day and month, default is ' '
+        context: WeatherContext, the current config is used if it is None
 
     Returns: date in the form of datetime.date
 
     """
-    locale = get_config().locale
+    locale = get_context(context).locale
     try:
         day, month = input_string.split(separator)
     except ValueError:
         raise WeatherError(ErrorCode.DATE_ERROR, "Unknown format for day")
 
-    months_lowercase = [x.lower() for x in locale.month_names]
-    if month.lower() in months_lowercase:
-        month_number = months_lowercase.index(month.lower()) + 1
-    elif month.isnumeric():
+    month_number = get_locale_index(locale).months.get(month.casefold())
+    if month_number is None and month.isnumeric():
         month_number = int(month)
-    else:
+    elif month_number is None:
         log.error("Unknown format for month")
         raise WeatherError(ErrorCode.DATE_ERROR)
 
@@ -184,29 +238,20 @@ def date_string_to_date(input_string: str, separator: str = " ") -> datetime.dat
     else:
         log.error("Unknown format for day")
         raise WeatherError(ErrorCode.DATE_ERROR, "Unknown format for day")
-    return get_date_with_year(day_number, month_number)
+    return get_date_with_year(day_number, month_number, context=context)
 
 
-def named_time_to_time(named_time: str) -> Union[datetime.time, Tuple[datetime.time, datetime.time]]:
+def named_time_to_time(named_time: str, context=None) -> Union[datetime.time, Tuple[datetime.time, datetime.time]]:
     """
     Parsed a string containing a named time into the time.
 
     Args:
         named_time: a valid named time(locale.named_times or locale.named_times_synonyms)
+        context: WeatherContext, the current config is used if it is None
 
     Returns: either a time or a tuple containing start and end time of an interval
     """
-    locale = get_config().locale
-    named_times_lowercase = [x.lower() for x in locale.named_times.keys()]
-    named_times_synonyms_lowercase = [x.lower() for x in locale.named_times_synonyms.keys()]
-    value = None
-    if named_time.lower() in named_times_synonyms_lowercase:
-        index = named_times_synonyms_lowercase.index(named_time.lower())
-        name = list(locale.named_times_synonyms.keys())[index]
-        value = locale.named_times[locale.named_times_synonyms[name]]
-    elif named_time.lower() in named_times_lowercase:
-        index = named_times_lowercase.index(named_time.lower())
-        value = list(locale.named_times.values())[index]
+    value = get_locale_index(get_context(context).locale).named_times.get(named_time.casefold(), (None, None))[1]
     if isinstance(value, datetime.time) or isinstance(value, tuple):
         return value
     else:
@@ -214,24 +259,14 @@ def named_time_to_time(named_time: str) -> Union[datetime.time, Tuple[datetime.t
         raise WeatherError(ErrorCode.TIME_ERROR, "Invalid time specified in locale.named_times or locale.named_times_synonyms")
 
 
-def named_time_to_str(named_time: str) -> str:
+def named_time_to_str(named_time: str, context=None) -> str:
     """
     Takes a named_time and formats it for output. If named time not in locale, it returns the input.
     Args:
         named_time: a valid named time(locale.named_times or locale.named_times_synonyms)
+        context: WeatherContext, the current config is used if it is None
 
     Returns: the formatted string
 
     """
-    locale = get_config().locale
-    named_times_lowercase = [x.lower() for x in locale.named_times.keys()]
-    named_times_synonyms_lowercase = [x.lower() for x in locale.named_times_synonyms.keys()]
-
-    if named_time.lower() in named_times_synonyms_lowercase:
-        index = named_times_synonyms_lowercase.index(named_time.lower())
-        return list(locale.named_times_synonyms.keys())[index]
-    elif named_time.lower() in named_times_lowercase:
-        index = named_times_lowercase.index(named_time.lower())
-        return list(locale.named_times.keys())[index]
-
-    return named_time
+    return get_locale_index(get_context(context).locale).named_times.get(named_time.casefold(), (named_time,))[0]
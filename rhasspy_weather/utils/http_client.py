@@ -0,0 +1,121 @@
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+log = logging.getLogger(__name__)
+
+# defaults, can be overwritten by parse_config
+connect_timeout = 3.05
+read_timeout = 10
+retries = 2
+backoff_factor = 0.3
+pool_size = 4
+
+__session = None
+
+
+def get_session() -> "requests.Session":
+    """
+    Returns the shared session used for all http requests of this library. The session is created on first use and
+    keeps its connections alive, so only the first request to a host pays for DNS lookup and TCP/TLS handshake.
+    requests is imported here and not with the module, answers from a cached forecast never need it.
+
+    Returns: requests.Session
+
+    """
+    global __session
+    if __session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        log.debug("creating http session")
+        retry = Retry(total=retries, connect=retries, read=retries, backoff_factor=backoff_factor,
+                      status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        __session = session
+    return __session
+
+
+def close_session():
+    """Closes the shared session and all pooled connections. The next request will open a new one."""
+    global __session
+    if __session is not None:
+        __session.close()
+        __session = None
+
+
+def get(url: str, params: dict = None, **kwargs) -> "requests.Response":
+    """
+    Sends a GET request over the shared session using the configured timeouts.
+
+    Args:
+        url: the url to request
+        params: (optional) dict with query parameters
+        **kwargs: passed through to requests
+
+    Returns: requests.Response
+
+    """
+    kwargs.setdefault("timeout", (connect_timeout, read_timeout))
+    return get_session().get(url, params=params, **kwargs)
+
+
+def post(url: str, data=None, **kwargs) -> "requests.Response":
+    """
+    Sends a POST request over the shared session using the configured timeouts.
+
+    Args:
+        url: the url to request
+        data: (optional) request body
+        **kwargs: passed through to requests
+
+    Returns: requests.Response
+
+    """
+    kwargs.setdefault("timeout", (connect_timeout, read_timeout))
+    return get_session().post(url, data=data, **kwargs)
+
+
+def parse_config(section):
+    """
+    Reads the http client options from a config section. Missing options keep their default.
+    Changing the options closes the current session so the next request uses the new settings.
+
+    Args:
+        section: config section (or dict) containing the options
+
+    Returns: Nothing
+
+    """
+    global connect_timeout, read_timeout, retries, backoff_factor, pool_size
+    if section is None:
+        return
+
+    new_values = (
+        __get_number(section, "connect_timeout", connect_timeout, float),
+        __get_number(section, "read_timeout", read_timeout, float),
+        __get_number(section, "retries", retries, int),
+        __get_number(section, "backoff_factor", backoff_factor, float),
+        __get_number(section, "pool_size", pool_size, int)
+    )
+    if new_values != (connect_timeout, read_timeout, retries, backoff_factor, pool_size):
+        connect_timeout, read_timeout, retries, backoff_factor, pool_size = new_values
+        close_session()
+
+
+def __get_number(section, option, default_value, data_type):
+    value = section.get(option)
+    if value is None or value == "":
+        return default_value
+    try:
+        return data_type(value)
+    except ValueError:
+        log.warning(f"Setting '{option}' has to be a number, using default '{default_value}'.")
+        return default_value
@@ -0,0 +1,94 @@
+import math
+from array import array
+from typing import Dict, Iterable, Sequence
+
+
+class Interpolation:
+    """
+    Columns of a forecast resampled to a fixed step (like one value per hour) by linear interpolation between the
+    values at the start of the slots. The resampled series is calculated once, values at any point in time are then
+    interpolated between the two neighbouring samples in constant time.
+    """
+    def __init__(self, timestamps: Sequence[float], columns: Dict[str, Iterable[float]], step: int = 3600, interval: int = 3):
+        """
+        Args:
+            timestamps: sorted unix timestamps of the start of the slots
+            columns: values of every slot by column name
+            step: seconds between two samples
+            interval: hours every slot lasts, the value of the last slot is kept until its end
+        """
+        if step <= 0:
+            raise ValueError("step has to be positive")
+        self.step = step
+        self.columns = {}
+        if not timestamps:
+            self.start = self.end = 0.0
+            for name in columns:
+                self.columns[name] = array("d")
+            return
+        self.start = timestamps[0]
+        self.end = timestamps[-1] + interval * 3600
+        count = int((self.end - self.start) // step) + 1
+        # slot index left of every sample and its weight, shared by all columns
+        lefts = array("I")
+        weights = array("d")
+        index = 0
+        last = len(timestamps) - 1
+        for sample in range(count):
+            timestamp = self.start + sample * step
+            while index < last and timestamps[index + 1] <= timestamp:
+                index = index + 1
+            lefts.append(index)
+            if index < last:
+                weights.append((timestamp - timestamps[index]) / (timestamps[index + 1] - timestamps[index]))
+            else:
+                weights.append(0.0)
+        for name, values in columns.items():
+            values = array("d", values)
+            self.columns[name] = array("d", [values[left] + (values[min(left + 1, last)] - values[left]) * weight
+                                             for left, weight in zip(lefts, weights)])
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __contains__(self, timestamp: float):
+        return len(self) > 0 and self.start <= timestamp <= self.end
+
+    def at(self, timestamp: float) -> Dict[str, float]:
+        """
+        Values of all columns at a point in time.
+
+        Args:
+            timestamp: unix timestamp, has to be between start and end of the forecast
+
+        Returns: dict of the values by column name
+
+        """
+        if timestamp not in self:
+            raise ValueError("timestamp outside of the forecast")
+        position = (timestamp - self.start) / self.step
+        left = min(int(position), len(self) - 1)
+        right = min(left + 1, len(self) - 1)
+        weight = position - left
+        return {name: values[left] + (values[right] - values[left]) * weight for name, values in self.columns.items()}
+
+    def extremes(self, start: float, end: float) -> Dict[str, float]:
+        """
+        Minimum and maximum of all columns between two points in time, from the samples in between and the values
+        at start and end.
+
+        Returns: dict with the keys min_<column> and max_<column>
+
+        """
+        if end < start:
+            raise ValueError("end before start")
+        first = self.at(start)
+        last = self.at(end)
+        left = int(math.ceil((start - self.start) / self.step))
+        right = int((end - self.start) // self.step) + 1
+        extremes = {}
+        for name, values in self.columns.items():
+            samples = values[left:right].tolist() + [first[name], last[name]]
+            extremes["min_" + name] = min(samples)
+            extremes["max_" + name] = max(samples)
+        return extremes
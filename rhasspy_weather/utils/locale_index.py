@@ -0,0 +1,78 @@
+import threading
+
+from rhasspy_weather.data_types import item_list
+
+__lock = threading.Lock()
+
+
+class LocaleIndex:
+    """
+    Case-folded lookup tables of everything the parsers look up in a locale, built once per locale module. Synonyms
+    are resolved while the index is built, so every lookup is a single dict access.
+
+    Attributes:
+    named_days : dict
+        name or synonym -> (the name or synonym as written in the locale, value in locale.named_days)
+    named_ranges : dict
+        name or synonym -> (name in locale.named_ranges, its value)
+    named_times : dict
+        name or synonym -> (the name or synonym as written in the locale, value in locale.named_times)
+    weekdays : dict
+        weekday name -> number of the weekday (Monday is 0)
+    months : dict
+        month name -> number of the month (January is 1)
+    conditions : dict
+        condition or synonym -> ConditionType
+    temperatures : dict
+        temperature or synonym -> TemperatureType
+    items : dict
+        item name -> item name as written in the item list of the locale
+    """
+    def __init__(self, locale):
+        # synonyms of named days and times are checked first, their own spelling is used for output
+        self.named_days = {name.casefold(): (name, value) for name, value in locale.named_days.items()}
+        self.named_days.update({synonym.casefold(): (synonym, locale.named_days.get(name))
+                                for synonym, name in locale.named_days_synonyms.items()})
+        self.named_times = {name.casefold(): (name, value) for name, value in locale.named_times.items()}
+        self.named_times.update({synonym.casefold(): (synonym, locale.named_times.get(name))
+                                 for synonym, name in locale.named_times_synonyms.items()})
+
+        named_ranges = getattr(locale, "named_ranges", {})
+        self.named_ranges = {name.casefold(): (name, value) for name, value in named_ranges.items()}
+        self.named_ranges.update({synonym.casefold(): (name, named_ranges.get(name))
+                                  for synonym, name in getattr(locale, "named_ranges_synonyms", {}).items()})
+
+        self.weekdays = {name.casefold(): number for number, name in enumerate(locale.weekday_names)}
+        self.months = {name.casefold(): number for number, name in enumerate(locale.month_names, 1)}
+
+        # the types themselves win over synonyms with the same spelling
+        self.conditions = {synonym.casefold(): locale.condition_types[name]
+                           for synonym, name in locale.condition_synonyms.items()}
+        self.conditions.update({name.casefold(): value for name, value in locale.condition_types.items()})
+        self.temperatures = {synonym.casefold(): locale.temperature_types[name]
+                             for synonym, name in locale.temperature_synonyms.items()}
+        self.temperatures.update({name.casefold(): value for name, value in locale.temperature_types.items()})
+
+        items = getattr(locale, "items", None) or item_list.items
+        self.items = {} if items is None else {name.casefold(): name for name in items.get_all_item_names()}
+
+
+def get_locale_index(locale) -> LocaleIndex:
+    """
+    Returns the index of a locale module, it is built on first use and kept in the module.
+
+    Args:
+        locale: the locale module
+
+    Returns: LocaleIndex
+
+    """
+    try:
+        return locale.index
+    except AttributeError:
+        with __lock:
+            index = getattr(locale, "index", None)
+            if index is None:
+                index = LocaleIndex(locale)
+                locale.index = index
+        return index
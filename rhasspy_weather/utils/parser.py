@@ -1,11 +1,11 @@
 import datetime
 from typing import TypeVar
 
-from rhasspy_weather.data_types import item_list
 from rhasspy_weather.data_types.condition import ConditionType
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode
 from rhasspy_weather.data_types.location import Location
 from rhasspy_weather.utils import dt_utils
+from rhasspy_weather.utils.locale_index import get_locale_index
 import logging
 
 log = logging.getLogger(__name__)
@@ -13,45 +13,45 @@ log = logging.getLogger(__name__)
 InputTime = TypeVar("InputTime", str, int)
 
 
-def parse_date(date: str, locale):
+def parse_date(date: str, locale, context=None):
     log.debug(f"parse date - {date}")
+    index = get_locale_index(locale)
 
-    named_days_lowercase = [x.lower() for x in locale.named_days.keys()]
-    named_days_synonyms_lowercase = [x.lower() for x in locale.named_days_synonyms.keys()]
     # is it a named day (tomorrow, etc.)?
-    if date.lower() in named_days_lowercase + named_days_synonyms_lowercase:
+    if date.casefold() in index.named_days:
         log.debug("date is specified by name")
-        return dt_utils.named_day_to_date(date), dt_utils.named_day_to_str(date)
+        return dt_utils.named_day_to_date(date, context=context), dt_utils.named_day_to_str(date, context=context)
+
+    # is it a range of several days (the weekend, etc.)?
+    if dt_utils.is_named_range(date, context=context):
+        log.debug("date is a named range of days")
+        return dt_utils.named_range_to_dates(date, context=context), dt_utils.named_range_to_str(date, context=context)
 
     # is a weekday named?
-    weekdays_lowercase = [x.lower() for x in locale.weekday_names]
-    if date.lower() in weekdays_lowercase:
+    if date.casefold() in index.weekdays:
         log.debug("date is specified by weekday name")
-        new_date = dt_utils.weekday_to_date(date.lower())
-        return new_date, weekdays_lowercase[new_date.weekday()]
+        new_date = dt_utils.weekday_to_date(date, context=context)
+        return new_date, locale.weekday_names[new_date.weekday()].lower()
 
     # was a date specified (specified by rhasspy as "daynumber monthname")?
     if ' ' in date:
         log.debug("date was specified in form 'day month'")
-        return dt_utils.date_string_to_date(date), dt_utils.date_string_to_str(date)
+        return dt_utils.date_string_to_date(date, context=context), dt_utils.date_string_to_str(date, context=context)
 
     log.error("Unknown date format")
     raise WeatherError(ErrorCode.DATE_ERROR)
 
 
-def parse_time(time: InputTime, locale):
+def parse_time(time: InputTime, locale, context=None):
     log.debug(f"parse time - {time}")
     if time != "":
         log.debug("intent contains a specified time")
 
         if isinstance(time, str):
-            named_times_lowercase = [x.lower() for x in locale.named_times.keys()]
-            named_times_synonyms_lowercase = [x.lower() for x in locale.named_times_synonyms.keys()]
-
             # was something like midday specified (listed in locale.named_times or in locale.named_times_synonyms)?
-            if time.lower() in named_times_lowercase + named_times_synonyms_lowercase:
+            if time.casefold() in get_locale_index(locale).named_times:
                 log.debug("time is specified by name")
-                return dt_utils.named_time_to_time(time), dt_utils.named_day_to_str(time)
+                return dt_utils.named_time_to_time(time, context=context), dt_utils.named_time_to_str(time, context=context)
 
             # was it hours and minutes (specified as "HH MM" by rhasspy intent)?
             if ' ' in time:
@@ -78,26 +78,14 @@ def parse_location(location: str, locale):
 
 def parse_condition(condition: str, locale):
     log.debug(f"parse condition - {condition}")
-    condition = condition.lower()
-    if condition in locale.condition_types:
-        return locale.condition_types[condition]
-    elif condition in locale.condition_synonyms:
-        return locale.condition_types[locale.condition_synonyms[condition]]
-    else:
-        return ConditionType.UNKNOWN
+    return get_locale_index(locale).conditions.get(condition.casefold(), ConditionType.UNKNOWN)
 
 
 def parse_item(item: str, locale):
     log.debug(f"parse item - {item}")
-    items = item_list.items.get_all_item_names()
-    items_lowercase = [x.lower() for x in items]
-    if item.lower() in items_lowercase:
-        return items[items_lowercase.index(item.lower())]
+    return get_locale_index(locale).items.get(item.casefold())
 
 
 def parse_temperature(temperature: str, locale):
     log.debug(f"parse temperature - {temperature}")
-    if temperature in locale.temperature_types:
-        return locale.temperature_types[temperature]
-    elif temperature in locale.temperature_synonyms:
-        return locale.temperature_types[locale.temperature_synonyms[temperature]]
+    return get_locale_index(locale).temperatures.get(temperature.casefold())
@@ -0,0 +1,81 @@
+from array import array
+from collections import Counter
+from typing import Hashable, Iterable, Tuple
+
+
+class SparseTable:
+    """
+    Minimum and maximum of any range of a sequence in constant time, after building tables of the minimum and
+    maximum of all ranges with a length that is a power of two (O(n log n)).
+    """
+    def __init__(self, values: Iterable[float]):
+        self.__minimums = [array("d", values)]
+        self.__maximums = [array("d", self.__minimums[0])]
+        length = 1
+        while length * 2 <= len(self.__minimums[0]):
+            minimums = self.__minimums[-1]
+            maximums = self.__maximums[-1]
+            count = len(minimums) - length
+            self.__minimums.append(array("d", [min(minimums[x], minimums[x + length]) for x in range(count)]))
+            self.__maximums.append(array("d", [max(maximums[x], maximums[x + length]) for x in range(count)]))
+            length = length * 2
+
+    def __len__(self):
+        return len(self.__minimums[0])
+
+    def query(self, start: int, end: int) -> Tuple[float, float]:
+        """
+        Minimum and maximum of the values from start to end (excluded).
+
+        Args:
+            start: index of the first value
+            end: index after the last value
+
+        Returns: tuple of minimum and maximum
+
+        """
+        if end <= start:
+            raise ValueError("empty range")
+        level = (end - start).bit_length() - 1
+        second = end - (1 << level)
+        return (min(self.__minimums[level][start], self.__minimums[level][second]),
+                max(self.__maximums[level][start], self.__maximums[level][second]))
+
+
+class PrefixCounts:
+    """
+    Number of occurrences of every key in any range of a sequence of key collections in constant time per key,
+    from the cumulative counts of each key.
+    """
+    def __init__(self, rows: Iterable[Iterable[Hashable]]):
+        rows = [Counter(x) for x in rows]
+        self.__length = len(rows)
+        self.__prefixes = {}
+        for key in set(key for row in rows for key in row):
+            prefix = array("I", [0])
+            total = 0
+            for row in rows:
+                total = total + row[key]
+                prefix.append(total)
+            self.__prefixes[key] = prefix
+
+    def __len__(self):
+        return self.__length
+
+    def count(self, key: Hashable, start: int, end: int) -> int:
+        """number of occurrences of key in the rows from start to end (excluded)"""
+        prefix = self.__prefixes.get(key)
+        if prefix is None or end <= start:
+            return 0
+        return prefix[end] - prefix[start]
+
+    def counts(self, start: int, end: int) -> Counter:
+        """occurrences of all keys that occur in the rows from start to end (excluded)"""
+        counts = Counter()
+        if end <= start:
+            return counts
+        for key, prefix in self.__prefixes.items():
+            count = prefix[end] - prefix[start]
+            if count:
+                counts[key] = count
+        return counts
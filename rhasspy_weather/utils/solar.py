@@ -0,0 +1,83 @@
+import datetime
+import logging
+import threading
+from typing import Iterable, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# decimals the coordinates are rounded to, two decimals (about 1 km) change sunrise and sunset by seconds
+precision = 2
+
+# (lat, lon, date, timezone) -> (sunrise, sunset) as datetime.time in the timezone
+__times = {}
+__lock = threading.Lock()
+
+
+def get_sunrise_and_sunset(lat: float, lon: float, date: datetime.date, timezone=None) -> Tuple[Optional[datetime.time], Optional[datetime.time]]:
+    """
+    Sunrise and sunset of a date at a location. They are calculated on first use and looked up afterwards.
+
+    Args:
+        lat: latitude
+        lon: longitude
+        date: the date
+        timezone: timezone of the returned times, the local timezone is used if it is None
+
+    Returns: tuple of sunrise and sunset, both are None if the sun does not rise or set that day
+
+    """
+    key = __get_key(lat, lon, date, timezone)
+    times = __times.get(key)
+    if times is None:
+        precalculate(lat, lon, [date], timezone)
+        times = __times[key]
+    return times
+
+
+def precalculate(lat: float, lon: float, dates: Iterable[datetime.date], timezone=None):
+    """
+    Calculates sunrise and sunset for all dates at a location at once, like for all days of a forecast.
+    Times of dates before yesterday are removed at the same time.
+
+    Args:
+        lat: latitude
+        lon: longitude
+        dates: the dates
+        timezone: timezone of the times, the local timezone is used if it is None
+
+    Returns: Nothing
+
+    """
+    import suntime
+
+    sun = None
+    calculated = {}
+    for date in dates:
+        key = __get_key(lat, lon, date, timezone)
+        if key in __times or key in calculated:
+            continue
+        if sun is None:
+            sun = suntime.Sun(key[0], key[1])
+        try:
+            sunrise = sun.get_sunrise_time(date).astimezone(timezone).time()
+            sunset = sun.get_sunset_time(date).astimezone(timezone).time()
+            calculated[key] = (sunrise, sunset)
+        except suntime.SunTimeException as e:
+            log.debug(f"No sunrise or sunset on {date}: {e}")
+            calculated[key] = (None, None)
+
+    if calculated:
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        with __lock:
+            for key in [x for x in __times if x[2] < yesterday]:
+                del __times[key]
+            __times.update(calculated)
+
+
+def clear():
+    with __lock:
+        __times.clear()
+
+
+def __get_key(lat, lon, date, timezone):
+    return round(float(lat), precision), round(float(lon), precision), date, str(timezone)
@@ -1,7 +1,8 @@
 # -*- encoding: utf-8 -*-
 import logging
-from typing import Union
+from typing import List, Union
 
+from rhasspy_weather.data_types.context import WeatherContext
 from rhasspy_weather.data_types.report import WeatherReport
 import rhasspy_weather.data_types.config as cf
 from rhasspy_weather.data_types.error import WeatherError, ConfigError
@@ -13,41 +14,71 @@ log = logging.getLogger(__name__)
 
 
 # TODO: find a better name for this file
-# TODO: write something that replaced detail since that doesn't work with the current system
-# maybe similar to get_weather_forecast but with a separate request for morning, afternoon and night
-# that or just remove that logic completely
 
 
-def get_weather_forecast(weather_input, config_path: str = None):
+def get_weather_forecast(weather_input, config_path: str = None, context: WeatherContext = None):
     """
     Function that takes any valid input format (see parser for what is supported) and answers.
 
     Args:
         weather_input: anything that a parser exists for
         config_path: optional path to a config file
+        context: optional WeatherContext, one is created from the config if it is None and passed to every step
 
     Returns:
         output, unless one of the selected outputs has a specified return value. If there is one, it will return that instead
 
     """
+    context = get_context(config_path, context)
     try:
-        request = get_request(weather_input, config_path)
-        forecast = get_weather(request, config_path)
-        output = get_report(request, forecast)
+        request = get_request(weather_input, context=context)
+        forecast = get_weather(request, context=context)
+        key = get_answer_key(request, context)
+        output = context.answer_cache.get(key, forecast.fetch_time)
+        cached = output is not None
+        if cached:
+            log.info("Using cached report")
+        else:
+            output = get_report(request, forecast, context=context)
+        # the templates contain values of the input message (session, site, timings) and are filled for every request,
+        # the speech is created with them, so a WeatherError of the speech is answered like the other errors
+        rendered = render_answer(weather_input, output, context)
+        if not cached:
+            context.answer_cache.put(key, forecast.fetch_time, output)
     except WeatherError as error:
-        output = error
+        return answer(weather_input, error, context=context)
 
-    answer_value = answer(weather_input, output, config_path)
+    answer_value = answer(weather_input, output, rendered=rendered, context=context)
 
     return answer_value
 
 
-def get_request(weather_input, config_path: str = None) -> WeatherRequest:
+def get_context(config_path: str = None, context: WeatherContext = None) -> WeatherContext:
+    """
+    Function that returns the context a request is answered with
+
+    Args:
+        config_path: optional path to a config file
+        context: optional WeatherContext, it is returned as it is
+
+    Returns:
+        the given WeatherContext or a new one of the config
+
+    """
+    if context is not None:
+        return context
+    if config_path is not None and cf.config_path is not config_path:
+        cf.set_config_path(config_path)
+    return WeatherContext(cf.get_config())
+
+
+def get_request(weather_input, config_path: str = None, context: WeatherContext = None) -> WeatherRequest:
     """
     Function that takes any valid input (see parsers for what can be used here) and returns a WeatherRequest
     Args:
         weather_input: anything that a parser exists for
         config_path: optional path to a config file
+        context: optional WeatherContext, config_path is ignored if it is given
 
     Returns:
         WeatherRequest containing the information from weather_input
@@ -56,23 +87,21 @@ def get_request(weather_input, config_path: str = None) -> WeatherRequest:
         WeatherError: the universal error for this library, more information about what went wrong can be found in the log or inside the error object
 
     """
-    if config_path is not None and cf.config_path is not config_path:
-        cf.set_config_path(config_path)
-
-    config = cf.get_config()
+    context = get_context(config_path, context)
     log.info("Parsing input")
-    request = config.parser.parse_intent_message(weather_input)
+    request = context.parser.parse_intent_message(weather_input, context)
 
     return request
 
 
-def get_weather(request: WeatherRequest, config_path: str = None) -> Weather:
+def get_weather(request: WeatherRequest, config_path: str = None, context: WeatherContext = None) -> Weather:
     """
     Function taking a WeatherRequest and returning the weather information for the time around the request
 
     Args:
         request: WeatherRequest object
         config_path: optional path to a config file
+        context: optional WeatherContext, config_path is ignored if it is given
 
     Returns:
         Weather object
@@ -81,17 +110,68 @@ def get_weather(request: WeatherRequest, config_path: str = None) -> Weather:
         WeatherError: the universal error for this library, more information about what went wrong can be found in the log or inside the error object
 
     """
-    if config_path is not None and cf.config_path is not config_path:
-        cf.set_config_path(config_path)
+    context = get_context(config_path, context)
+    key = get_cache_key(request.location, context)
+    for index, cache in enumerate(context.cache):
+        forecast = cache.get(key)
+        if forecast is not None:
+            log.info("Using cached weather")
+            for faster_cache in context.cache[:index]:
+                faster_cache.put(key, forecast)
+            return forecast
 
-    config = cf.get_config()
     log.info("Requesting weather")
-    forecast = config.api.get_weather(request.location)
+    forecast = context.api.get_weather(request.location, context)
+
+    resolved_key = get_cache_key(request.location, context)
+    for cache in context.cache:
+        cache.put(key, forecast)
+        if resolved_key != key:
+            cache.put(resolved_key, forecast)
 
     return forecast
 
 
-def get_report(request: WeatherRequest, weather_information: Weather, config_path: str = None) -> WeatherReport:
+def get_cache_key(location, context: WeatherContext = None) -> str:
+    """
+    Builds the key forecasts are cached under. Besides the location it contains the api and everything else that
+    changes its answer, so forecasts can be kept when the config is reloaded.
+
+    Args:
+        location: Location object
+        context: optional WeatherContext
+
+    Returns:
+        the key as a string
+
+    """
+    context = get_context(context=context)
+    api_name = context.api.__name__.rsplit(".", 1)[-1]
+    return f"{api_name}|{location.cache_key}|{context.units}|{context.locale.language_code}"
+
+
+def get_answer_key(request: WeatherRequest, context: WeatherContext = None) -> tuple:
+    """
+    Builds the key reports are cached under. Besides the fingerprint of the request it contains the phrasing used
+    in the speech of the report and the generation of the config, so contexts of different configs never share
+    reports. Values of the input message are left out, they only end up in the filled templates. The forecast
+    version is checked by the cache itself.
+
+    Args:
+        request: WeatherRequest object
+        context: optional WeatherContext
+
+    Returns:
+        the key as a tuple
+
+    """
+    context = get_context(context=context)
+    location_name = request.location.name if request.location is not None else ""
+    return (request.fingerprint, request.date_specified, request.time_specified, request.location_specified, location_name,
+            context.config.generation, context.locale.language_code, context.units)
+
+
+def get_report(request: WeatherRequest, weather_information: Weather, config_path: str = None, context: WeatherContext = None) -> WeatherReport:
     """
     Function that takes a WeatherRequest and a Weather object and turns those into a finished WeatherReport
 
@@ -99,6 +179,7 @@ def get_report(request: WeatherRequest, weather_information: Weather, config_pat
         request: WeatherRequest object
         weather_information: WeatherForecast object
         config_path: optional path to a config file
+        context: optional WeatherContext, config_path is ignored if it is given
 
     Returns:
         WeatherReport object containing the answer to the request as well as all the relevant weather information
@@ -107,15 +188,13 @@ def get_report(request: WeatherRequest, weather_information: Weather, config_pat
         WeatherError: something along the way goes wrong, check error object or log to see what
 
     """
-    if config_path is not None and cf.config_path is not config_path:
-        cf.set_config_path(config_path)
-
+    context = get_context(config_path, context)
     log.info("Formulating answer")
-    report = WeatherReport(request, weather_information)
+    report = WeatherReport(request, weather_information, context=context)
     return report
 
 
-def answer(weather_input, output, config_path: str = None) -> Union[WeatherReport, WeatherError]:
+def answer(weather_input, output, config_path: str = None, rendered: List[str] = None, context: WeatherContext = None) -> Union[WeatherReport, WeatherError]:
     """
     Function that combines information into the form specified in config and outputs them to where is should go
 
@@ -123,22 +202,62 @@ def answer(weather_input, output, config_path: str = None) -> Union[WeatherRepor
         weather_input: anything that a parser exists for
         output: either a WeatherReport or a WeatherError that contains information
         config_path: optional path to a config file
+        rendered: filled templates of all outputs (see render_answer), they are filled here if None
+        context: optional WeatherContext, config_path is ignored if it is given
 
     Returns:
-        output, unless one of the selected outputs has a specified return value. If there is one, it will return that instead
+        output or the WeatherError the speech of the report couldn't be created with, unless one of the selected
+        outputs has a specified return value. If there is one, it will return that instead
 
     """
-    if config_path is not None and cf.config_path is not config_path:
-        cf.set_config_path(config_path)
-
-    config = cf.get_config()
+    context = get_context(config_path, context)
+    if rendered is None:
+        try:
+            rendered = render_answer(weather_input, output, context)
+        except WeatherError as error:
+            output = error
+            rendered = render_answer(weather_input, error, context)
     log.info("Answering")
     return_value = output
-    for output_item in config.output:
+    for output_item, filled_template in zip(context.output, rendered):
+        if filled_template is None:
+            continue
         try:
-            filled_template = fill_template(weather_input, output, output_item.get_template())
             return_value = output_item.output_response(filled_template)
         except (WeatherError, ConfigError) as e:
             log.error(f"Can't output response on {output_item.__name__}: {e.description}")
 
     return return_value
+
+
+def render_answer(weather_input, output, context: WeatherContext = None) -> List[str]:
+    """
+    Function that fills the templates of all outputs selected in config
+
+    Args:
+        weather_input: anything that a parser exists for
+        output: either a WeatherReport or a WeatherError that contains information
+        context: optional WeatherContext
+
+    Returns:
+        the filled templates in the order of the outputs, None for outputs whose template could not be filled
+
+    Raises:
+        WeatherError: the speech of the report can't be created, for example because the requested item is unknown
+
+    """
+    context = get_context(context=context)
+    rendered = []
+    for output_item in context.output:
+        try:
+            rendered.append(fill_template(weather_input, output, output_item.get_template(), context=context))
+        except WeatherError as e:
+            if isinstance(output, WeatherReport):
+                # the speech is created on the first use, the request has to be answered with its error
+                raise
+            log.error(f"Can't output response on {output_item.__name__}: {e.description}")
+            rendered.append(None)
+        except ConfigError as e:
+            log.error(f"Can't output response on {output_item.__name__}: {e.description}")
+            rendered.append(None)
+    return rendered
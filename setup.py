@@ -5,7 +5,7 @@ setuptools.setup(
     author='Daenara',
     version='0.0.1',
     url='https://github.com/Daenara/rhasspy_weather',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*"]),
     py_modules=["rhasspy_weather", "templates", "utils", "api", "data_types", "languages", "output"],
     python_requires='>=3.7',
     install_requires=["requests", "pytz", "paho-mqtt", "suntime", "python-dateutil"],
@@ -31,6 +31,10 @@ class MockConfig:
         name = "rhasspy_weather.api." + "openweathermap"
         return __import__(name, fromlist=[''])
 
+    @property
+    def cache(self):
+        return [__import__("rhasspy_weather.cache.memory", fromlist=[''])]
+
     @property
     def parser(self):
         return self.__parser
@@ -76,6 +80,12 @@ class MockConfig:
         return False
 
 
+@pytest.fixture(autouse=True)
+def config_snapshot_path(monkeypatch, tmp_path):
+    """keeps the snapshots of configs loaded by tests out of the home directory"""
+    monkeypatch.setattr("rhasspy_weather.data_types.config.snapshot_path", str(tmp_path / "snapshots"))
+
+
 @pytest.fixture
 def mock_config_detail_true(monkeypatch):
     def mock_get_config():
@@ -100,7 +110,7 @@ def mock_request_401(monkeypatch):
         return MockResponse("response_401")
 
     import requests
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
 
 @pytest.fixture
@@ -109,7 +119,7 @@ def mock_request_404(monkeypatch):
         return MockResponse("response_404")
 
     import requests
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
 
 @pytest.fixture
@@ -123,8 +133,8 @@ def mock_request_200(monkeypatch):
             {"temp": 15, "f_temp": 18, "min_temp": 14, "max_temp": 17, "pressure": 1020, "humidity": 33, "weather_id": 800},
             {"temp": 18, "f_temp": 16, "min_temp": 17, "max_temp": 18, "pressure": 1019, "humidity": 35, "weather_id": 803}
         ]
-        return MockResponse("response_404", data_input)
+        return MockResponse("response_200", data_input)
 
     import requests
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
@@ -62,7 +62,7 @@ weather_conditions = {
 weather_data = {
     "response_401": '{"cod":401, "message": "Invalid API key. Please see http://openweathermap.org/faq#error401 for more info."}',
     "response_404": '{"cod":"404","message":"city not found"}',
-    "response_200": '{"cod":"200","message":0,"cnt":{cnt}},"city":{city},list:{list}}',
+    "response_200": '{"cod":"200","message":0,"cnt":{cnt},"city":{city},"list":{list}}',
     "city": {
         "frankfurt": '{"id":2925533,"name":"Frankfurt am Main","coord":{"lat":50.1167,"lon":8.6833},"country":"DE","population":650000,"timezone":7200,"sunrise":1597810874,"sunset":1597862205}',
     },
@@ -103,8 +103,8 @@ class MockResponse:
 
             output_list = build_weather_list(data_input, start_date, start_time)
             response = weather_data["response_200"]
-            response = response.replace("{city}", city)
-            response = response.replace("{list}", str(output_list))
+            response = response.replace("{city}", weather_data["city"][city])
+            response = response.replace("{list}", "[" + ",".join(output_list) + "]")
             response = response.replace("{cnt}", str(len(output_list)))
             self.__response = response
         else:
@@ -0,0 +1,42 @@
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.temperature import TemperatureType
+from rhasspy_weather.languages import english
+from rhasspy_weather.utils.answer_template import AnswerTemplate, _compile, compile_answer, compile_cache_size, compile_locale
+
+
+def test_render():
+    template = AnswerTemplate("The weather {when}  {where}: {weather}.")
+    assert template.fields == {"when", "where", "weather"}
+    assert template.render(when="tomorrow", where="in Berlin", weather="rain") == "The weather tomorrow in Berlin: rain."
+    # fields without a value keep their placeholder
+    assert template.render(weather="rain") == "The weather {when} {where}: rain."
+    assert template.format(when="a", where="b", weather="c") == "The weather a  b: c."
+
+
+def test_render_keeps_conversion_and_format_spec():
+    template = AnswerTemplate("{temperature:.1f} degrees, {name!r}")
+    assert template.render(temperature=21.456, name="Berlin") == "21.5 degrees, 'Berlin'"
+    assert template.render(temperature=21.456, name="Berlin") == template.format(temperature=21.456, name="Berlin")
+    assert template.render(name="Berlin") == "{temperature:.1f} degrees, 'Berlin'"
+    assert AnswerTemplate(template.render()).render(temperature=3) == "3.0 degrees, {name!r}"
+
+
+def test_compile_answer_is_shared():
+    assert compile_answer("{when} it rains") is compile_answer("{when} it rains")
+    template = AnswerTemplate("{noun}")
+    assert compile_answer(template) is template
+
+
+def test_compile_answer_cache_is_bounded():
+    for i in range(compile_cache_size + 10):
+        compile_answer(f"answer number {i} {{when}}")
+    assert _compile.cache_info().currsize <= compile_cache_size
+
+
+def test_compile_locale():
+    compile_locale(english)
+    assert isinstance(english.temperature_answers[TemperatureType.GENERAL][0], AnswerTemplate)
+    assert isinstance(english.condition_answers[ConditionType.RAIN]["true"][0], AnswerTemplate)
+    assert isinstance(english.general_answers["weather"][0], AnswerTemplate)
+    answers = english.condition_answers
+    assert compile_locale(english).condition_answers is answers
@@ -0,0 +1,216 @@
+import datetime
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import rhasspy_weather.data_types.config as cf
+from rhasspy_weather import weather
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.cache import answers, memory
+from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType
+from rhasspy_weather.data_types.context import WeatherContext
+from rhasspy_weather.data_types.error import ErrorCode, WeatherError
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+from rhasspy_weather.output import console
+from tests.data.openweathermap_weather import MockResponse
+
+test_config_path = os.path.join(str(Path(__file__).parent), "test_config_parser_rhasspy.ini")
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    monkeypatch.setattr(memory, "ttl", 3600)
+    monkeypatch.setattr(memory, "max_entries", 2)
+    memory.clear()
+    yield memory
+    memory.clear()
+
+
+@pytest.fixture
+def answer_cache(monkeypatch):
+    monkeypatch.setattr(answers, "enabled", True)
+    monkeypatch.setattr(answers, "variants", 2)
+    monkeypatch.setattr(answers, "max_entries", 2)
+    answers.clear()
+    yield answers
+    answers.clear()
+
+
+class FakeRequest:
+    def __init__(self, location):
+        self.location = location
+
+
+def test_memory_cache_ttl(memory_cache):
+    forecast = Weather()
+    memory_cache.put("berlin", forecast)
+    assert memory_cache.get("berlin") is forecast
+    assert memory_cache.get("london") is None
+
+    forecast.fetch_time = time.time() - 3601
+    assert memory_cache.get("berlin") is None
+    assert memory_cache.get_statistics() == {"hits": 1, "misses": 2, "entries": 0}
+
+
+def test_memory_cache_lru(memory_cache):
+    memory_cache.put("a", Weather())
+    memory_cache.put("b", Weather())
+    memory_cache.get("a")
+    memory_cache.put("c", Weather())
+    assert memory_cache.get("b") is None
+    assert memory_cache.get("a") is not None
+    assert memory_cache.get("c") is not None
+
+
+def test_answer_cache_variants(answer_cache):
+    assert answer_cache.get("today", 1.0) is None
+    answer_cache.put("today", 1.0, "sunny")
+    # until there are enough variants new ones are rendered
+    assert answer_cache.get("today", 1.0) is None
+    answer_cache.put("today", 1.0, "clear sky")
+    answer_cache.put("today", 1.0, "no clouds")
+    assert {answer_cache.get("today", 1.0) for _ in range(50)} == {"sunny", "clear sky"}
+
+
+def test_answer_cache_forecast_version(answer_cache):
+    answer_cache.put("today", 1.0, "sunny")
+    answer_cache.put("today", 1.0, "clear sky")
+    assert answer_cache.get("today", 1.0) is not None
+    # a refreshed forecast makes the answers invalid
+    assert answer_cache.get("today", 2.0) is None
+    assert answer_cache.get_statistics()["entries"] == 0
+    answer_cache.put("today", 2.0, "rainy")
+    answer_cache.put("tomorrow", 2.0, "rainy")
+    answer_cache.put("friday", 2.0, "rainy")
+    assert answer_cache.get_statistics()["entries"] == 2
+
+
+def test_answer_cache_ignores_input_message_values(answer_cache, memory_cache, monkeypatch, capsys):
+    context = WeatherContext(cf.load_config(test_config_path))
+    data = [{"temp": 20, "f_temp": 19, "min_temp": 18, "max_temp": 21, "pressure": 1009, "humidity": 50, "weather_id": 800}] * 16
+    response = MockResponse("response_200", data, start_date=datetime.date.today(), start_time=datetime.time(0, 0)).json()
+
+    def mock_api(location, context=None):
+        return openweathermap.parse_forecast(response, location, context.timezone, context=context)
+
+    monkeypatch.setattr(answer_cache, "variants", 1)
+    monkeypatch.setattr(openweathermap, "get_weather", mock_api)
+    monkeypatch.setattr(console, "get_template", lambda: '{"session": "$intent_sessionId", "text": "$speech"}')
+    intent = {"intent": {"name": "GetWeatherForecast"}, "slots": {"when_day": "morgen"}, "text": "wie wird das wetter morgen",
+              "siteId": "default"}
+    weather.get_weather_forecast({**intent, "recognize_seconds": 0.12, "sessionId": "first"}, context=context)
+    weather.get_weather_forecast({**intent, "recognize_seconds": 0.34, "sessionId": "second"}, context=context)
+
+    assert answer_cache.get_statistics() == {"hits": 1, "misses": 1, "entries": 1}
+    # the templates are still filled with the values of each message
+    answers_printed = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [x["session"] for x in answers_printed] == ["first", "second"]
+    assert answers_printed[0]["text"] == answers_printed[1]["text"]
+
+
+def test_answer_cache_is_per_config(answer_cache, memory_cache, monkeypatch, capsys, tmp_path):
+    warm_path = tmp_path / "warm.ini"
+    with open(test_config_path) as config_file:
+        warm_path.write_text(config_file.read().replace("temp_warm=20", "temp_warm=30"))
+    data = [{"temp": 25, "f_temp": 25, "min_temp": 24, "max_temp": 26, "pressure": 1009, "humidity": 50, "weather_id": 800}] * 16
+    response = MockResponse("response_200", data, start_date=datetime.date.today(), start_time=datetime.time(0, 0)).json()
+
+    def mock_api(location, context=None):
+        return openweathermap.parse_forecast(response, location, context.timezone, context=context)
+
+    monkeypatch.setattr(answer_cache, "variants", 1)
+    monkeypatch.setattr(openweathermap, "get_weather", mock_api)
+    monkeypatch.setattr(console, "get_template", lambda: '{"text": "$speech"}')
+    intent = {"intent": {"name": "GetWeatherForecastTemperature"}, "slots": {"when_day": "morgen", "temperature": "warm"},
+              "text": "wird es morgen warm"}
+    configs = [cf.load_config(test_config_path), cf.load_config(str(warm_path))]
+    for config in configs + configs:
+        weather.get_weather_forecast(intent, context=WeatherContext(config))
+
+    texts = [json.loads(line)["text"] for line in capsys.readouterr().out.splitlines()]
+    # the second config doesn't get the cached report of the first one
+    assert texts[0].startswith("Ja") and texts[1].startswith("Nein")
+    assert texts[2:] == texts[:2]
+    assert answer_cache.get_statistics() == {"hits": 2, "misses": 2, "entries": 2}
+
+
+def test_error_of_the_speech_is_answered(answer_cache, memory_cache, monkeypatch, capsys):
+    context = WeatherContext(cf.load_config(test_config_path))
+    data = [{"temp": 20, "f_temp": 19, "min_temp": 18, "max_temp": 21, "pressure": 1009, "humidity": 50, "weather_id": 800}] * 16
+    response = MockResponse("response_200", data, start_date=datetime.date.today(), start_time=datetime.time(0, 0)).json()
+
+    def mock_api(location, context=None):
+        return openweathermap.parse_forecast(response, location, context.timezone, context=context)
+
+    monkeypatch.setattr(openweathermap, "get_weather", mock_api)
+    monkeypatch.setattr(console, "get_template", lambda: '{"text": "$speech"}')
+    # a parser that doesn't check the item, the report finds out when its speech is created
+    monkeypatch.setattr("rhasspy_weather.parser.rhasspy_intent.parse_item", lambda item, locale: item)
+    intent = {"intent": {"name": "GetWeatherForecastItem"}, "slots": {"when_day": "morgen", "item": "Zauberstab"}}
+    weather.get_weather_forecast(intent, context=context)
+
+    assert json.loads(capsys.readouterr().out)["text"] == WeatherError(ErrorCode.ITEM_ERROR).get_message(context.locale)
+    assert answer_cache.get_statistics()["entries"] == 0
+
+
+def test_location_cache_key():
+    assert Location("Berlin").cache_key == Location(" berlin").cache_key
+    assert Location("Berlin", "10115", "DE").cache_key == "zip=10115,de"
+    location = Location("Berlin")
+    location.lat, location.lon = 52.520008, "13.404954"
+    assert location.cache_key == "lat=52.52,lon=13.405"
+
+
+def test_get_weather_uses_cache(mock_config_detail_false, memory_cache, monkeypatch):
+    calls = []
+
+    def mock_api(location, context=None):
+        calls.append(location)
+        return Weather()
+
+    monkeypatch.setattr("rhasspy_weather.api.openweathermap.get_weather", mock_api)
+    first = weather.get_weather(FakeRequest(Location("Berlin")))
+    second = weather.get_weather(FakeRequest(Location("berlin")))
+    weather.get_weather(FakeRequest(Location("London")))
+    assert first is second
+    assert len(calls) == 2
+    assert memory_cache.get_statistics()["hits"] == 1
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path):
+    from rhasspy_weather.cache import disk
+    disk.close()
+    monkeypatch.setattr(disk, "path", str(tmp_path / "forecast_cache.sqlite"))
+    monkeypatch.setattr(disk, "ttl", 3600)
+    yield disk
+    disk.close()
+
+
+def test_disk_cache(disk_cache):
+    forecast = Weather()
+    forecast.add(1597881600, 20.5, WeatherCondition(1, "Regen", ConditionType.RAIN), 1009, 50, 1.6, 168)
+    disk_cache.put("berlin", forecast)
+    disk_cache.close()
+
+    cached = disk_cache.get("berlin")
+    assert cached is not forecast
+    assert cached.fetch_time == forecast.fetch_time
+    assert list(cached.temperatures) == [20.5]
+    assert cached.descriptions == ["Regen"]
+    assert disk_cache.get("london") is None
+
+    forecast.fetch_time = time.time() - 3601
+    disk_cache.put("old", forecast)
+    assert disk_cache.get("old") is None
+    assert disk_cache.get_statistics() == {"hits": 1, "misses": 2, "entries": 1}
+
+
+def test_disk_cache_format_version(disk_cache, monkeypatch):
+    disk_cache.put("berlin", Weather())
+    monkeypatch.setattr(Weather, "format_version", Weather.format_version + 1)
+    assert disk_cache.get("berlin") is None
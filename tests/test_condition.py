@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.condition import ConditionType, WeatherCondition, WindCondition, get_condition, get_wind_condition, \
+    classify_wind, classify_wind_batch, compass_directions
+
+
+def test_get_condition_is_shared(mock_config_detail_false):
+    condition = get_condition(1, "Regen", ConditionType.RAIN)
+    assert condition is get_condition(1, "Regen", ConditionType.RAIN)
+    assert condition is not get_condition(2, "Regen", ConditionType.RAIN)
+    assert condition == WeatherCondition(1, "Regen", ConditionType.RAIN)
+    assert hash(condition) == hash(WeatherCondition(1, "Regen", ConditionType.RAIN))
+
+
+def test_condition_is_immutable(mock_config_detail_false):
+    condition = get_condition(1, "Regen", ConditionType.RAIN)
+    with pytest.raises(AttributeError):
+        condition.severity = 3
+    with pytest.raises(AttributeError):
+        condition.temperature = 3
+
+
+def test_description_from_locale(mock_config_detail_false):
+    locale = get_config().locale
+    assert get_condition(3, "", ConditionType.WIND, locale).description == locale.conditions[ConditionType.WIND][3]
+    assert get_condition(3, "", ConditionType.WIND, locale) is get_condition(3, "", ConditionType.WIND, locale)
+    assert get_condition(0, "", ConditionType.SUN, locale).description == ""
+
+
+def test_wind_condition(mock_config_detail_false):
+    config = get_config()
+    wind = get_wind_condition(5, 90, config)
+    assert isinstance(wind, WindCondition)
+    assert (wind.condition_type, wind.severity, wind.wind_direction) == (ConditionType.WIND, 4, "E")
+    # slightly different values that are classified the same share one instance
+    assert wind is get_wind_condition(5.1, 95, config)
+    assert wind is not get_wind_condition(5, 180, config)
+
+
+def test_pickle(mock_config_detail_false):
+    config = get_config()
+    wind = get_wind_condition(5, 90, config)
+    restored = pickle.loads(pickle.dumps(wind, protocol=pickle.HIGHEST_PROTOCOL))
+    assert (restored.severity, restored.description, restored.wind_direction) == (wind.severity, wind.description, wind.wind_direction)
+
+
+def test_classify_wind_batch():
+    wind_speeds = [0, 0.5, 5, 12.3, 30]
+    wind_directions = [0, 22.5, 90, 200, 350]
+    for units in ["metric", "imperial"]:
+        severities, compass_indices = classify_wind_batch(wind_speeds, wind_directions, units)
+        assert [(severity, compass_directions[index]) for severity, index in zip(severities, compass_indices)] == \
+               [classify_wind(speed, direction, units) for speed, direction in zip(wind_speeds, wind_directions)]
+    assert classify_wind(5, 90) == (4, "E")
+    assert classify_wind(5, 350, "imperial") == (2, "N")
@@ -0,0 +1,187 @@
+import os
+import shutil
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import pytz
+
+import rhasspy_weather.data_types.config as cf
+from rhasspy_weather import weather
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.cache import answers, memory
+from rhasspy_weather.data_types.config import WeatherConfig
+from rhasspy_weather.data_types.context import WeatherContext
+
+test_config_path = os.path.join(str(Path(__file__).parent), "test_config_parser_rhasspy.ini")
+
+
+def copy_config(tmp_path) -> str:
+    path = str(tmp_path / "config.ini")
+    shutil.copy(test_config_path, path)
+    return path
+
+
+def change_config(path, old, new):
+    with open(path) as config_file:
+        text = config_file.read().replace(old, new)
+    with open(path, "w") as config_file:
+        config_file.write(text)
+    # the modification time alone might not change within the resolution of the file system
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+
+@pytest.fixture
+def current_config(tmp_path, monkeypatch):
+    """a copy of the test config as current config, the previous one is restored afterwards"""
+    path = copy_config(tmp_path)
+    monkeypatch.setattr(cf, "config_path", path)
+    monkeypatch.setattr(cf, "__config", None)
+    yield path
+    cf.stop_watching_config()
+
+
+def test_load_config_from_snapshot(tmp_path, monkeypatch):
+    path = copy_config(tmp_path)
+    config = cf.load_config(path)
+
+    def parse_file(*args):
+        raise AssertionError("config file parsed again")
+
+    monkeypatch.setattr(WeatherConfig, "_WeatherConfig__parse_section_general", parse_file)
+    snapshot_config = cf.load_config(path)
+
+    assert snapshot_config.get_snapshot() == config.get_snapshot()
+    assert snapshot_config.locale is config.locale
+    assert snapshot_config.output == config.output
+    assert snapshot_config.output_template == config.output_template
+    assert snapshot_config.location.cache_key == config.location.cache_key
+    assert snapshot_config.get_external_section("OpenWeatherMap")["api_key"] == "blah"
+    assert snapshot_config.timezone is pytz.timezone("Europe/Berlin")
+
+
+def test_snapshot_of_changed_config_is_not_used(tmp_path):
+    path = copy_config(tmp_path)
+    assert cf.load_config(path).temperature_warm_from == 20
+
+    change_config(path, "temp_warm=20", "temp_warm=25")
+
+    assert cf.load_snapshot(path) is None
+    assert cf.load_config(path).temperature_warm_from == 25
+    assert cf.load_snapshot(path)["temperature_warm_from"] == 25
+
+
+def test_snapshot_of_other_package_version_is_not_used(tmp_path, monkeypatch):
+    # a copy of the package files the snapshot key depends on
+    package_path = tmp_path / "rhasspy_weather"
+    shutil.copytree(os.path.join(os.path.dirname(cf.__file__), os.pardir, "output_templates"), str(package_path / "output_templates"))
+    module_path = package_path / "data_types" / "config.py"
+    module_path.parent.mkdir()
+    shutil.copy(cf.__file__, str(module_path))
+    monkeypatch.setattr(cf, "__file__", str(module_path))
+    path = copy_config(tmp_path)
+    cf.load_config(path)
+    assert cf.load_snapshot(path) is not None
+
+    stat = os.stat(str(module_path))
+    os.utime(str(module_path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert cf.load_snapshot(path) is None
+
+
+def test_snapshot_turned_off(tmp_path):
+    path = copy_config(tmp_path)
+    cf.load_config(path)
+    assert cf.load_snapshot(path) is not None
+
+    with open(path, "a") as config_file:
+        config_file.write("\n[Cache]\nconfig_snapshot=False\n")
+
+    assert cf.load_config(path).temperature_warm_from == 20
+    assert cf.load_snapshot(path) is None
+    assert not os.listdir(cf.snapshot_path)
+
+
+def test_reload_config(current_config):
+    config = cf.get_config()
+    context = WeatherContext(config)
+    assert not cf.reload_config()
+
+    change_config(current_config, "temp_warm=20", "temp_warm=25")
+    assert cf.reload_config()
+    assert cf.get_config().temperature_warm_from == 25
+    # requests that already started keep their config
+    assert context.temperature_warm_from == 20
+    assert not cf.reload_config()
+
+
+def test_reload_config_keeps_forecasts(current_config):
+    cf.get_config()
+    memory.clear()
+    answers.clear()
+    memory.put("forecast", SimpleNamespace(fetch_time=time.time()))
+    answers.put("answer", 1, "rendered")
+
+    change_config(current_config, "temp_warm=20", "temp_warm=25")
+    assert cf.reload_config()
+    assert memory.get("forecast") is not None
+    assert answers.get_statistics()["entries"] == 0
+
+
+def test_reload_config_keeps_reports_of_old_config_apart(current_config, monkeypatch):
+    monkeypatch.setattr(answers, "enabled", True)
+    monkeypatch.setattr(answers, "variants", 1)
+    old_context = WeatherContext(cf.get_config())
+    intent = {"intent": {"name": "GetWeatherForecastTemperature"}, "slots": {"when_day": "morgen", "temperature": "warm"}}
+    request = weather.get_request(intent, context=old_context)
+
+    change_config(current_config, "temp_warm=20", "temp_warm=25")
+    assert cf.reload_config()
+    # a request that started before the reload adds its report afterwards
+    answers.put(weather.get_answer_key(request, old_context), 1, "built with temp_warm=20")
+
+    new_context = WeatherContext(cf.get_config())
+    assert answers.get(weather.get_answer_key(weather.get_request(intent, context=new_context), new_context), 1) is None
+    answers.clear()
+
+
+def test_reload_unchanged_config(current_config):
+    config = cf.get_config()
+    change_config(current_config, "temp_warm=20", "temp_warm=20")
+    assert not cf.reload_config()
+    assert cf.get_config() is config
+
+
+def test_reload_invalid_config(current_config):
+    config = cf.get_config()
+    change_config(current_config, "locale=german", "locale=klingon")
+    assert not cf.reload_config()
+    assert cf.get_config() is config
+    assert not cf.reload_config()
+
+    change_config(current_config, "locale=klingon", "locale=english")
+    assert cf.reload_config()
+    assert cf.get_config().locale.language_code == "en"
+
+
+def test_reload_config_with_invalid_module_settings(current_config):
+    config = cf.get_config()
+    forecast_url = openweathermap.forecast_url
+    change_config(current_config, "api_key=blah", "api_key=\nurl=http://localhost:1/forecast")
+    assert not cf.reload_config()
+    assert cf.get_config() is config
+    # the settings of the current config are still in use
+    assert openweathermap.api_key == "blah"
+    assert openweathermap.forecast_url == forecast_url
+
+
+def test_watch_config(current_config):
+    config = cf.get_config()
+    cf.watch_config(0.01)
+    change_config(current_config, "temp_warm=20", "temp_warm=25")
+    for _ in range(200):
+        if cf.get_config() is not config:
+            break
+        time.sleep(0.01)
+    assert cf.get_config().temperature_warm_from == 25
@@ -0,0 +1,71 @@
+import datetime
+import json
+import os
+from pathlib import Path
+
+import pytest
+import pytz
+
+import rhasspy_weather.data_types.config as cf
+from rhasspy_weather import weather
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.cache import answers, memory
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.context import WeatherContext, get_context
+from rhasspy_weather.languages import english
+from rhasspy_weather.parser import rhasspy_intent
+from rhasspy_weather.utils.parser import parse_date
+from tests.data.openweathermap_weather import MockResponse
+
+timezone = pytz.timezone("Europe/Berlin")
+# Friday, 1.3.2030 10:00
+friday = timezone.localize(datetime.datetime(2030, 3, 1, 10, 0)).timestamp()
+
+
+def test_context_delegates_to_config(mock_config_detail_true):
+    config = get_config()
+    context = WeatherContext(config)
+    assert context.locale is config.locale
+    assert context.detail is True
+    assert context.temperature_warm_from == 20
+    assert get_context(context) is context
+    assert get_context(config).config is config
+
+
+def test_context_clock(mock_config_detail_false):
+    context = WeatherContext(get_config(), clock=lambda: friday)
+    assert context.today() == datetime.date(2030, 3, 1)
+    assert parse_date("morgen", context.locale, context) == (datetime.date(2030, 3, 2), "morgen")
+    assert parse_date("wochenende", context.locale, context)[0] == (datetime.date(2030, 3, 2), datetime.date(2030, 3, 3))
+
+
+def test_context_locale(mock_config_detail_false):
+    context = WeatherContext(get_config(), locale=english, clock=lambda: friday)
+    request = rhasspy_intent.parse_intent_message({"intent": {"name": "GetWeatherForecast"}, "slots": {"when_day": "tomorrow"}}, context)
+    assert request.request_date == datetime.date(2030, 3, 2)
+    assert request.weekday == "Saturday"
+    assert request.time_difference == 1
+
+
+@pytest.mark.parametrize("slots", [{"when_day": "morgen"}, {"when_day": "morgen", "item": "Schirm"}, {"when_day": "blah"}])
+def test_request_only_uses_its_context(slots, monkeypatch, capsys):
+    test_config_path = os.path.join(str(Path(__file__).parent), "test_config_parser_rhasspy.ini")
+    context = WeatherContext(cf.load_config(test_config_path))
+    data = [{"temp": 20, "f_temp": 19, "min_temp": 18, "max_temp": 21, "pressure": 1009, "humidity": 50, "weather_id": 500}] * 16
+    response = MockResponse("response_200", data, start_date=datetime.date.today(), start_time=datetime.time(0, 0)).json()
+
+    def mock_api(location, context=None):
+        return openweathermap.parse_forecast(response, location, context.timezone, context=context)
+
+    def mock_get_config():
+        raise AssertionError("the config changed in the middle of a request")
+
+    monkeypatch.setattr(openweathermap, "get_weather", mock_api)
+    monkeypatch.setattr(answers, "enabled", False)
+    memory.clear()
+    # a config swapped in by reload_config is only seen by functions that look up the current config
+    monkeypatch.setattr("rhasspy_weather.data_types.config.get_config.__code__", mock_get_config.__code__)
+    intent_name = "GetWeatherForecastItem" if "item" in slots else "GetWeatherForecast"
+    weather.get_weather_forecast({"intent": {"name": intent_name}, "slots": slots, "text": ""}, context=context)
+    memory.clear()
+    assert json.loads(capsys.readouterr().out)["speech"]["text"] != ""
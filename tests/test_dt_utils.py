@@ -6,7 +6,7 @@ from rhasspy_weather.data_types.config import get_config
 from rhasspy_weather.data_types.error import WeatherError, ErrorCode
 
 from rhasspy_weather.utils.dt_utils import get_date_with_year, named_day_to_date, weekday_to_date, date_string_to_date, \
-    named_time_to_time
+    named_time_to_time, named_range_to_dates, named_range_to_str
 
 
 def test_get_date_with_year(mock_config_detail_true):
@@ -70,6 +70,21 @@ def test_weekday_to_date(mock_config_detail_true):
     assert weekday_to_date(config.locale.weekday_names[today.weekday()]) == today + datetime.timedelta(days=7)
 
 
+def test_named_range_to_dates(mock_config_detail_true):
+    config = get_config()
+    today = datetime.datetime.now(tz=config.timezone).date()
+    assert named_range_to_dates("die nächsten drei Tage") == (today, today + datetime.timedelta(days=2))
+    assert named_range_to_str("die nächsten drei Tage") == "in den nächsten drei Tagen"
+
+    first, last = named_range_to_dates("Wochenende")
+    assert last.weekday() == 6
+    assert first == today if today.weekday() >= 5 else first.weekday() == 5
+    assert today <= first <= last
+
+    with pytest.raises(WeatherError):
+        named_range_to_dates("blah")
+
+
 def test_date_string_to_date(mock_config_detail_true):
     config = get_config()
     result = date_string_to_date("31 " + config.locale.month_names[4])
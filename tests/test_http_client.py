@@ -0,0 +1,57 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from rhasspy_weather.utils import http_client
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = set()
+
+    def do_GET(self):
+        StubHandler.connections.add(self.client_address)
+        body = b'{"cod": "200"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+    http_client.close_session()
+
+
+def test_session_is_reused(stub_server):
+    for _ in range(5):
+        assert http_client.get(stub_server).json() == {"cod": "200"}
+    assert len(StubHandler.connections) == 1
+    assert http_client.get_session() is http_client.get_session()
+
+
+def test_parse_config(monkeypatch):
+    monkeypatch.setattr(http_client, "connect_timeout", http_client.connect_timeout)
+    monkeypatch.setattr(http_client, "read_timeout", http_client.read_timeout)
+    monkeypatch.setattr(http_client, "retries", http_client.retries)
+    session = http_client.get_session()
+
+    http_client.parse_config({"connect_timeout": "1.5", "read_timeout": "", "retries": "blah"})
+    assert http_client.connect_timeout == 1.5
+    assert http_client.read_timeout == 10
+    assert http_client.retries == 2
+    assert http_client.get_session() is not session
+    http_client.close_session()
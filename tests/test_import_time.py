@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+root_path = str(Path(__file__).parent.parent)
+config_path = os.path.join(root_path, "tests", "test_config_parser_rhasspy.ini")
+
+# answers an intent from a cached forecast in a new interpreter, like a command script started by rhasspy
+answer_script = """
+import datetime
+import sys
+import rhasspy_weather.weather as weather
+import rhasspy_weather.data_types.config as cf
+from rhasspy_weather.api import openweathermap
+from tests.data.openweathermap_weather import MockResponse
+
+cf.snapshot_path = sys.argv[2]
+cf.set_config_path(sys.argv[1])
+config = cf.get_config()
+data = [{"temp": 20, "f_temp": 19, "min_temp": 18, "max_temp": 21, "pressure": 1009, "humidity": 50, "weather_id": 800}] * 16
+response = MockResponse("response_200", data, start_date=datetime.date.today(), start_time=datetime.time(0, 0)).json()
+key = weather.get_cache_key(config.location)
+config.location.set_lat_and_lon(52.52, 13.405)
+forecast = openweathermap.parse_forecast(response, config.location, config.timezone)
+config.cache[0].put(key, forecast)
+config.cache[0].put(weather.get_cache_key(config.location), forecast)
+intent = {"intent": {"name": "GetWeatherForecast"}, "slots": {"when_day": "morgen"}, "text": "wie wird das wetter morgen"}
+weather.get_weather_forecast(intent)
+"""
+
+# only needed to fetch forecasts or for outputs that are not configured
+deferred_modules = ["requests", "urllib3", "dateutil", "paho"]
+
+# cumulative import time of the package, it was about 230 ms before api and outputs imported their dependencies lazily.
+# It depends on the machine, the test is only run with RHASSPY_WEATHER_TIMING_TESTS=1
+import_budget = 0.175
+
+
+def import_times(snapshot_path) -> dict:
+    """
+    Cumulative import time in seconds of the modules imported while answering, by module name. Modules imported by
+    other modules are included with 0, their time is part of the module that imported them.
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", answer_script, config_path, str(snapshot_path)],
+                             cwd=root_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert process.returncode == 0, process.stderr
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:"):
+            _, cumulative, module = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                # nested imports are indented below the module that imported them
+                times[module.strip()] = int(cumulative) / 1e6 if module[1] != " " else 0
+    return times
+
+
+def test_cached_answer_does_not_import_deferred_modules(tmp_path):
+    imported = import_times(tmp_path)
+    for module in deferred_modules:
+        assert module not in imported
+
+
+@pytest.mark.skipif(os.environ.get("RHASSPY_WEATHER_TIMING_TESTS") != "1", reason="timing depends on the machine")
+def test_import_time_budget(tmp_path):
+    # the best of a few runs, a single start can be slowed down by everything else running on the machine
+    best = min(sum(seconds for module, seconds in import_times(tmp_path).items() if module.startswith("rhasspy_weather."))
+               for _ in range(3))
+    assert best < import_budget
@@ -0,0 +1,37 @@
+import pytest
+
+from rhasspy_weather.utils.interpolation import Interpolation
+
+timestamps = [0, 3 * 3600, 6 * 3600, 9 * 3600]
+temperatures = [10, 16, 13, 13]
+
+
+def test_resampled_series():
+    interpolation = Interpolation(timestamps, {"temperature": temperatures})
+    # one sample per hour until the end of the last slot
+    assert len(interpolation) == 13
+    assert list(interpolation.columns["temperature"][:7]) == [10, 12, 14, 16, 15, 14, 13]
+    assert list(interpolation.columns["temperature"][9:]) == [13, 13, 13, 13]
+
+
+def test_at():
+    interpolation = Interpolation(timestamps, {"temperature": temperatures})
+    assert interpolation.at(0)["temperature"] == 10
+    assert interpolation.at(1.5 * 3600)["temperature"] == pytest.approx(13)
+    assert interpolation.at(4.5 * 3600)["temperature"] == pytest.approx(14.5)
+    assert interpolation.at(12 * 3600)["temperature"] == 13
+    with pytest.raises(ValueError):
+        interpolation.at(13 * 3600)
+    assert Interpolation(timestamps, {"temperature": temperatures}, 900).at(4.5 * 3600) == interpolation.at(4.5 * 3600)
+
+
+def test_extremes():
+    interpolation = Interpolation(timestamps, {"temperature": temperatures})
+    assert interpolation.extremes(1.5 * 3600, 4.5 * 3600) == {"min_temperature": pytest.approx(13), "max_temperature": 16}
+    assert interpolation.extremes(0.5 * 3600, 1.5 * 3600) == {"min_temperature": pytest.approx(11), "max_temperature": pytest.approx(13)}
+
+
+def test_empty():
+    interpolation = Interpolation([], {"temperature": []})
+    assert len(interpolation) == 0
+    assert 0 not in interpolation
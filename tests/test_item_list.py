@@ -0,0 +1,72 @@
+import pytest
+
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.data_types.item import NounType
+from rhasspy_weather.data_types.item_list import WeatherItemList
+from rhasspy_weather.data_types.temperature import TemperatureType
+from rhasspy_weather.languages import english, german
+from rhasspy_weather.parser import rhasspy_intent
+
+
+def create_item_list():
+    items = WeatherItemList()
+    items.add_item("umbrella", NounType.SINGULAR, article="an", weather_list=[ConditionType.RAIN, ConditionType.SNOW])
+    items.add_item("boots", NounType.PLURAL, weather_list=[TemperatureType.COLD, ConditionType.WIND])
+    items.add_item("sunglasses", NounType.PLURAL, weather_list=[ConditionType.SUN])
+    items.add_item("boots", NounType.PLURAL, weather_list=[ConditionType.RAIN])
+    items.add_item("raincoat", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN, ConditionType.RAIN])
+    items.add_item("rain coat", NounType.SINGULAR, article="a", weather_list=[ConditionType.RAIN], variant_of="raincoat")
+    return items
+
+
+def test_item_lookup():
+    items = create_item_list()
+    assert len(items) == 5
+    assert items.is_in_list("boots")
+    assert not items.is_in_list("scarf")
+    assert items.get_item("scarf") is None
+    # the first item with a name wins
+    assert items.get_item("boots").weather_types == [TemperatureType.COLD, ConditionType.WIND]
+    assert items.get_all_item_names() == ["umbrella", "boots", "sunglasses", "raincoat", "rain coat"]
+    assert items.get_item("rain coat").variant_of == "raincoat"
+
+
+def test_items_for_weather():
+    items = create_item_list()
+    assert items.get_item_names_for_weather(ConditionType.RAIN) == ["umbrella", "raincoat", "rain coat"]
+    assert items.get_items_for_weather(ConditionType.CLOUDS) == []
+    items.get_items_for_weather(ConditionType.RAIN).clear()
+    assert len(items.get_items_for_weather(ConditionType.RAIN)) == 3
+
+    # variants are not listed again
+    useful = items.get_items_for_weather_types({ConditionType.RAIN, TemperatureType.COLD, ConditionType.SNOW})
+    assert [item.name for item in useful] == ["umbrella", "boots", "raincoat"]
+    assert items.get_items_for_weather_types([]) == []
+
+
+def test_locale_items_match_list_scan():
+    for locale in [german, english]:
+        for weather_type in list(ConditionType) + list(TemperatureType):
+            expected = [item.name for item in locale.items if weather_type in item.weather_types]
+            assert locale.items.get_item_names_for_weather(weather_type) == expected
+
+
+def test_locale_variants_exist():
+    for locale in [german, english]:
+        for item in locale.items:
+            if item.variant_of is not None:
+                assert locale.items.get_item(item.variant_of).variant_of is None
+
+
+def test_parse_item_intent(mock_config_detail_false):
+    def parse(slots):
+        return rhasspy_intent.parse_intent_message({"intent": {"name": "GetWeatherForecastItem"}, "slots": slots})
+
+    assert parse({"item": "schirm"}).requested == "Schirm"
+    # without an item all useful items are asked for
+    assert not parse({}).requested
+    assert not parse({"item": ""}).requested
+    with pytest.raises(WeatherError) as error:
+        parse({"item": "Teleporter"})
+    assert error.value.error_code == ErrorCode.ITEM_ERROR
@@ -0,0 +1,47 @@
+import datetime
+
+import pytest
+
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.temperature import TemperatureType
+from rhasspy_weather.languages import english, german
+from rhasspy_weather.utils.locale_index import get_locale_index
+from rhasspy_weather.utils.parser import parse_condition, parse_temperature, parse_item, parse_time, parse_date
+
+
+@pytest.mark.parametrize("locale", [german, english])
+def test_locale_index_contains_every_name(locale):
+    index = get_locale_index(locale)
+    assert index is get_locale_index(locale)
+    for name in list(locale.named_days) + list(locale.named_days_synonyms):
+        assert name.upper().casefold() in index.named_days
+    for name in list(locale.named_times) + list(locale.named_times_synonyms):
+        assert index.named_times[name.casefold()][0] == name
+    for synonym, name in locale.named_ranges_synonyms.items():
+        assert index.named_ranges[synonym.casefold()] == (name, locale.named_ranges[name])
+    for number, name in enumerate(locale.weekday_names):
+        assert index.weekdays[name.casefold()] == number
+    for number, name in enumerate(locale.month_names, 1):
+        assert index.months[name.casefold()] == number
+    for name in locale.items.get_all_item_names():
+        assert index.items[name.casefold()] == name
+
+
+def test_parse_with_locale_index():
+    assert parse_condition("Bewölkt", german) == ConditionType.CLOUDS
+    assert parse_condition("Regen", german) == ConditionType.RAIN
+    assert parse_condition("blah", german) == ConditionType.UNKNOWN
+    assert parse_temperature("Heiß", german) == TemperatureType.WARM
+    assert parse_temperature("blah", german) is None
+    assert parse_item("schirm", german) == "Schirm"
+    assert parse_item("umbrella", german) is None
+    assert parse_item("UMBRELLA", english) == "umbrella"
+
+
+def test_parse_named_time(mock_config_detail_true):
+    # "Morgen" is a named time and, in lower case, a named day
+    assert parse_time("morgen", german) == (german.named_times["Morgen"], "Morgen")
+    assert parse_time("früh", german) == (german.named_times["Morgen"], "früh")
+    today = datetime.datetime.now(tz=get_config().timezone).date()
+    assert parse_date("Morgen", german) == (today + datetime.timedelta(days=1), "morgen")
@@ -0,0 +1,63 @@
+import datetime
+
+import pytest
+import pytz
+
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.data_types.location import Location
+from tests.data.openweathermap_weather import MockResponse
+
+forecast_data = [
+    {"temp": 30, "f_temp": 29, "min_temp": 28, "max_temp": 31, "pressure": 1009, "humidity": 50, "weather_id": 500},
+    {"temp": 25, "f_temp": 27, "min_temp": 23, "max_temp": 28, "pressure": 1006, "humidity": 58, "weather_id": 503},
+    {"temp": 0, "f_temp": 3, "min_temp": -3, "max_temp": 5, "pressure": 1009, "humidity": 11, "weather_id": 601},
+    {"temp": 5, "f_temp": 4, "min_temp": 3, "max_temp": 7, "pressure": 1015, "humidity": 20, "weather_id": 800},
+    {"temp": 15, "f_temp": 18, "min_temp": 14, "max_temp": 17, "pressure": 1020, "humidity": 33, "weather_id": 800},
+    {"temp": 18, "f_temp": 16, "min_temp": 17, "max_temp": 18, "pressure": 1019, "humidity": 35, "weather_id": 803}
+] * 5
+
+
+def test_parse_forecast(mock_config_detail_false):
+    timezone = pytz.timezone("Europe/Berlin")
+    start_date = datetime.date(2020, 8, 20)
+    response = MockResponse("response_200", forecast_data, start_date=start_date, start_time=datetime.time(0, 0)).json()
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.1167, 8.6833)
+
+    weather = openweathermap.parse_forecast(response, location, timezone)
+
+    slot_count = 0
+    for offset in range(5):
+        date = start_date + datetime.timedelta(days=offset)
+        slots = weather.get_weather_for_date(date)
+        slot_count = slot_count + len(slots)
+        for slot in slots:
+            assert slot.date == date
+    assert slot_count == len(forecast_data)
+
+    first = response["list"][0]
+    first_slot = weather.get_weather_for_date(datetime.datetime.fromtimestamp(first["dt"], timezone).date())[0]
+    assert first_slot.time == datetime.datetime.fromtimestamp(first["dt"], timezone).time()
+    assert first_slot.temperature == 30
+    assert first_slot.weather_condition == ConditionType.RAIN
+    assert first_slot.weather_description == "Leichter Regen"
+
+
+def test_get_weather(mock_config_detail_false, mock_request_200):
+    location = Location("Frankfurt")
+    weather = openweathermap.get_weather(location)
+    assert location.lat == 50.1167
+    assert location.cache_key == "lat=50.1167,lon=8.6833"
+    assert location.requested_key == "q=frankfurt"
+    today = datetime.datetime.now(pytz.timezone("Europe/Berlin")).date()
+    assert len(weather.get_weather_for_date(today) + weather.get_weather_for_date(today + datetime.timedelta(1))) > 0
+
+
+@pytest.mark.parametrize("mock_request, error_code", [("mock_request_401", ErrorCode.API_ERROR), ("mock_request_404", ErrorCode.LOCATION_ERROR)])
+def test_get_weather_error(mock_config_detail_false, mock_request, error_code, request):
+    request.getfixturevalue(mock_request)
+    with pytest.raises(WeatherError) as error:
+        openweathermap.get_weather(Location("Frankfurt"))
+    assert error.value.error_code == error_code
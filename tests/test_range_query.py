@@ -0,0 +1,26 @@
+import random
+
+import pytest
+
+from rhasspy_weather.utils.range_query import SparseTable, PrefixCounts
+
+
+def test_sparse_table():
+    values = [random.uniform(-20, 40) for _ in range(37)]
+    table = SparseTable(values)
+    assert len(table) == 37
+    for start in range(len(values)):
+        for end in range(start + 1, len(values) + 1):
+            assert table.query(start, end) == (min(values[start:end]), max(values[start:end]))
+    with pytest.raises(ValueError):
+        table.query(3, 3)
+
+
+def test_prefix_counts():
+    rows = [["rain", "wind"], ["wind"], [], ["rain", "rain"], ["snow"]]
+    counts = PrefixCounts(rows)
+    assert counts.count("rain", 0, 5) == 3
+    assert counts.count("rain", 1, 3) == 0
+    assert counts.count("clouds", 0, 5) == 0
+    assert counts.counts(1, 4) == {"wind": 1, "rain": 2}
+    assert counts.counts(2, 2) == {}
@@ -0,0 +1,210 @@
+import datetime
+from string import Template
+
+import pytest
+import pytz
+
+from rhasspy_weather.api import openweathermap
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.error import WeatherError, ErrorCode
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.report import WeatherReport
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+from rhasspy_weather.templates import uses_speech, weather_report_to_template_values
+from tests.data.openweathermap_weather import MockResponse
+
+timezone = pytz.timezone("Europe/Berlin")
+tomorrow = datetime.datetime.now(timezone).date() + datetime.timedelta(days=1)
+
+# one forecast every three hours for tomorrow, starting at midnight
+forecast_data = [
+    {"temp": 10, "f_temp": 9, "min_temp": 9, "max_temp": 11, "pressure": 1009, "humidity": 50, "weather_id": 800},
+    {"temp": 8, "f_temp": 7, "min_temp": 7, "max_temp": 9, "pressure": 1006, "humidity": 58, "weather_id": 800},
+    {"temp": 12, "f_temp": 11, "min_temp": 11, "max_temp": 13, "pressure": 1010, "humidity": 40, "weather_id": 801},
+    {"temp": 15, "f_temp": 14, "min_temp": 14, "max_temp": 16, "pressure": 1015, "humidity": 30, "weather_id": 500},
+    {"temp": 21, "f_temp": 20, "min_temp": 20, "max_temp": 22, "pressure": 1020, "humidity": 33, "weather_id": 501},
+    {"temp": 19, "f_temp": 18, "min_temp": 18, "max_temp": 20, "pressure": 1019, "humidity": 35, "weather_id": 803},
+    {"temp": 16, "f_temp": 15, "min_temp": 15, "max_temp": 17, "pressure": 1012, "humidity": 60, "weather_id": 804},
+    {"temp": 13, "f_temp": 12, "min_temp": 12, "max_temp": 14, "pressure": 1011, "humidity": 70, "weather_id": 800}
+]
+
+
+@pytest.fixture
+def forecast(mock_config_detail_false):
+    return create_forecast(forecast_data)
+
+
+@pytest.fixture
+def forecast_two_days(mock_config_detail_false):
+    return create_forecast(forecast_data + [{**x, "temp": x["temp"] + 5} for x in forecast_data])
+
+
+def create_forecast(data):
+    start = timezone.localize(datetime.datetime.combine(tomorrow, datetime.time(0, 0)))
+    response = MockResponse("response_200", data).json()
+    for index, slot in enumerate(response["list"]):
+        slot["dt"] = int(start.timestamp()) + index * 3 * 3600
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.1167, 8.6833)
+    return openweathermap.parse_forecast(response, location, timezone)
+
+
+def test_report_day(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    report = WeatherReport(request, forecast)
+    assert report.min_temperature == 8
+    assert report.max_temperature == 21
+    assert report.min_pressure == 1006
+    assert report.max_humidity == 70
+    assert len(report.weather) == 8
+    condition_types = [x.condition_type for x in report.weather_condition_list]
+    assert ConditionType.RAIN in condition_types
+    assert ConditionType.CLOUDS in condition_types
+    assert report.is_weather_chance(ConditionType.RAIN)
+    assert not report.is_weather_chance(ConditionType.SNOW)
+    rain = next(x for x in report.weather_condition_list if x.condition_type == ConditionType.RAIN)
+    assert rain.severity == 1
+    assert report.speech[ForecastType.FULL] != ""
+
+
+def test_report_interval(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    report = WeatherReport(request, forecast, (datetime.time(12, 0), datetime.time(18, 0)))
+    assert report.min_temperature == 19
+    assert report.max_temperature == 21
+    assert not report.is_weather_chance(ConditionType.SNOW)
+    assert "19" in report.speech[ForecastType.TEMPERATURE]
+
+
+def test_report_condition(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    request.requested = ConditionType.RAIN
+    report = WeatherReport(request, forecast)
+    assert report.speech[ForecastType.CONDITION].startswith("Ja")
+
+
+def test_speech_is_created_on_first_access(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    report = WeatherReport(request, forecast)
+    assert not report.speech.is_rendered
+    assert weather_report_to_template_values(report, include_speech=False)["report_min_temperature"] == 8
+    assert not report.speech.is_rendered
+    assert ForecastType.TEMPERATURE in report.speech
+    assert report.speech.is_rendered
+    assert ForecastType.ITEM not in report.speech
+    assert report.speech[ForecastType.FULL].startswith(report.speech[ForecastType.CONDITION].split(" ")[0])
+
+
+def test_uses_speech():
+    assert uses_speech(Template('{"text": "$speech"}'))
+    assert uses_speech(Template("${speech}!"))
+    assert not uses_speech(Template("$report_min_temperature $speeches $$speech"))
+
+
+def test_report_detailed(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    request.detail = True
+    report = WeatherReport(request, forecast)
+    assert [(x.min_temperature, x.max_temperature) for x in report.segments] == [(8, 15), (19, 21), (13, 16)]
+    assert ConditionType.RAIN in [x.condition_type for x in report.segments[0].weather_condition_list]
+    assert report.min_temperature == 8
+    assert report.max_temperature == 21
+    speech = report.speech[ForecastType.FULL]
+    assert "Morgens" in speech and "Mittags" in speech and "Abends" in speech
+    assert report.segments[0].speech in speech
+
+
+def test_report_detailed_not_for_specific_requests(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    request.detail = True
+    request.requested = ConditionType.RAIN
+    report = WeatherReport(request, forecast)
+    assert report.segments == []
+    assert "Morgens" not in report.speech[ForecastType.CONDITION]
+
+
+def test_report_several_days(forecast_two_days):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    request.set_date((tomorrow, tomorrow + datetime.timedelta(days=2)), "")
+    assert request.grain == Grain.WEEK
+    assert len(request.dates) == 3
+    report = WeatherReport(request, forecast_two_days)
+    assert report.min_temperature == 8
+    assert report.max_temperature == 26
+    assert [(x.date, x.min_temperature, x.max_temperature) for x in report.segments] == \
+           [(tomorrow, 8, 21), (tomorrow + datetime.timedelta(days=1), 13, 26)]
+    speech = report.speech[ForecastType.FULL]
+    assert "von " + request.weekday + " bis " in speech
+    assert all(x.speech in speech for x in report.segments)
+
+
+def test_report_several_days_specific(forecast_two_days):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    request.set_date((tomorrow, tomorrow + datetime.timedelta(days=1)), "am Wochenende")
+    request.requested = ConditionType.SNOW
+    report = WeatherReport(request, forecast_two_days)
+    assert report.segments == []
+    assert report.max_temperature == 26
+    assert report.speech[ForecastType.CONDITION].startswith("Nein")
+
+
+def test_report_hour_is_interpolated(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    request.set_time(datetime.time(10, 30), "")
+    report = WeatherReport(request, forecast)
+    # between 15 degrees at 9:00 and 21 degrees at 12:00
+    assert report.min_temperature == report.max_temperature == pytest.approx(18)
+    assert "18" in report.speech[ForecastType.TEMPERATURE]
+
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    request.set_time((datetime.time(10, 30), datetime.time(13, 30)), "")
+    report = WeatherReport(request, forecast)
+    assert report.min_temperature == pytest.approx(18)
+    assert report.max_temperature == 21
+
+
+def test_template_values_of_every_report(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    first = weather_report_to_template_values(WeatherReport(request, forecast))
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.TEMPERATURE)
+    request.set_time(datetime.time(12, 0), "")
+    second = weather_report_to_template_values(WeatherReport(request, forecast))
+    assert first["report_max_temperature"] == 21
+    assert second["report_max_temperature"] == 21 and second["report_min_temperature"] == 21
+    assert first["report_min_temperature"] == 8
+    assert first["speech"] != second["speech"]
+
+
+def test_report_item(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.ITEM)
+    request.requested = "Schirm"
+    report = WeatherReport(request, forecast)
+    assert report.speech[ForecastType.ITEM].startswith("Ja")
+
+    request.requested = "Sonnenbrille"
+    assert WeatherReport(request, forecast).speech[ForecastType.ITEM].startswith("Nein")
+    # other spellings are found like in the fingerprint of the request
+    request.requested = "schirm"
+    assert WeatherReport(request, forecast).speech[ForecastType.ITEM].startswith("Ja")
+
+    request.requested = "Teleporter"
+    report = WeatherReport(request, forecast)
+    # an error of the rendering is raised again on every access
+    for _ in range(2):
+        with pytest.raises(WeatherError) as error:
+            report.speech[ForecastType.ITEM]
+        assert error.value.error_code == ErrorCode.ITEM_ERROR
+    assert not report.speech.is_rendered
+
+
+def test_report_useful_items(forecast):
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.ITEM)
+    report = WeatherReport(request, forecast)
+    assert ConditionType.RAIN in report.get_weather_types()
+    names = [item.name for item in report.get_useful_items()]
+    assert "Schirm" in names
+    assert "Sonnenbrille" not in names
+    # "Regenschirm" and "paar Gummistiefel" are other wordings of "Schirm" and "Gummistiefel"
+    assert "Regenschirm" not in names
+    assert "paar Gummistiefel" not in names
+    assert "Schirm" in report.speech[ForecastType.ITEM]
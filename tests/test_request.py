@@ -0,0 +1,75 @@
+import datetime
+
+from rhasspy_weather.data_types.config import get_config
+from rhasspy_weather.data_types.condition import ConditionType
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.request import WeatherRequest, DateType, Grain, ForecastType
+from rhasspy_weather.utils.parser import parse_date
+
+
+def test_fingerprint_of_differently_phrased_requests(mock_config_detail_false):
+    config = get_config()
+    tomorrow = datetime.datetime.now(config.timezone).date() + datetime.timedelta(days=1)
+    by_name = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.ITEM)
+    by_name.set_date(*parse_date("morgen", config.locale))
+    by_name.requested = "Regenschirm"
+    by_date = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.ITEM)
+    by_date.set_date(*parse_date(f"{tomorrow.day} {tomorrow.month}", config.locale))
+    by_date.requested = " regenschirm"
+    assert by_name.date_specified != by_date.date_specified
+    assert by_name.fingerprint == by_date.fingerprint
+    assert len({by_name.fingerprint, by_date.fingerprint}) == 1
+
+
+def test_fingerprint_uses_item_name_of_locale(mock_config_detail_false):
+    config = get_config()
+    tomorrow = datetime.datetime.now(config.timezone).date() + datetime.timedelta(days=1)
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.ITEM)
+    request.requested = "regenschirm"
+    assert request.fingerprint.requested == "Regenschirm"
+    request.requested = "Teleporter"
+    assert request.fingerprint.requested == "Teleporter"
+    fingerprint = request.fingerprint
+    request.detail = True
+    assert request.fingerprint != fingerprint
+
+
+def test_fingerprint_is_frozen(mock_config_detail_false):
+    config = get_config()
+    tomorrow = datetime.datetime.now(config.timezone).date() + datetime.timedelta(days=1)
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    request.requested = ConditionType.RAIN
+    fingerprint = request.fingerprint
+    assert fingerprint.first_date == fingerprint.last_date == tomorrow
+    assert fingerprint.times == ((datetime.time.min, datetime.time(23, 59)),)
+
+    request.set_time(datetime.time(15, 0, 30), "")
+    assert request.fingerprint != fingerprint
+    assert request.fingerprint.times == ((datetime.time(15, 0), datetime.time(15, 0)),)
+    assert fingerprint.grain == Grain.DAY
+
+    location = Location("Frankfurt")
+    location.set_lat_and_lon(50.11671, 8.68329)
+    request.location = location
+    other = Location("frankfurt am main")
+    other.set_lat_and_lon(50.1167, 8.6833)
+    other_request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.CONDITION)
+    other_request.requested = ConditionType.RAIN
+    other_request.set_time(datetime.time(15, 0), "um 15 Uhr")
+    other_request.location = other
+    assert request.fingerprint == other_request.fingerprint
+
+
+def test_fingerprint_uses_requested_location(mock_config_detail_false):
+    config = get_config()
+    tomorrow = datetime.datetime.now(config.timezone).date() + datetime.timedelta(days=1)
+    request = WeatherRequest(DateType.FIXED, Grain.DAY, tomorrow, ForecastType.FULL)
+    request.location = Location("Frankfurt")
+    fingerprint = request.fingerprint
+    # coordinates looked up by the api don't change the question
+    request.location.set_resolved_lat_and_lon(50.1167, 8.6833)
+    assert request.fingerprint == fingerprint
+    assert request.fingerprint.location == "q=frankfurt"
+    # coordinates that were asked for are part of it
+    request.location = Location("Frankfurt", lat=50.1167, lon=8.6833)
+    assert request.fingerprint.location == "lat=50.1167,lon=8.6833"
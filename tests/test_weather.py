@@ -0,0 +1,92 @@
+import datetime
+
+import pytz
+
+from rhasspy_weather.data_types.aggregate import WeatherAggregate
+from rhasspy_weather.data_types.condition import WeatherCondition, ConditionType
+from rhasspy_weather.data_types.location import Location
+from rhasspy_weather.data_types.weather import Weather
+
+timezone = pytz.timezone("Europe/Berlin")
+start = timezone.localize(datetime.datetime(2020, 8, 20, 0, 0))
+
+
+def build_weather(slot_count=16):
+    weather = Weather(None, 3, timezone)
+    for index in range(slot_count):
+        weather.add(start.timestamp() + index * 3 * 3600, index, WeatherCondition(0, "Klarer Himmel", ConditionType.CLOUDS), 1000 + index, 50, 1, 90)
+    return weather
+
+
+def test_get_range(mock_config_detail_false):
+    weather = build_weather()
+    assert weather.get_slot_range(datetime.date(2020, 8, 20), (datetime.time.min, datetime.time.max)) == (0, 8)
+    assert weather.get_slot_range(datetime.date(2020, 8, 21), (datetime.time.min, datetime.time.max)) == (8, 16)
+    assert weather.get_slot_range(datetime.date(2020, 8, 22), (datetime.time.min, datetime.time.max)) == (0, 0)
+    # a point in time is inside exactly one slot
+    assert weather.get_slot_range(datetime.date(2020, 8, 20), (datetime.time(13, 30), datetime.time(13, 30))) == (4, 5)
+    assert weather.get_slot_range(datetime.date(2020, 8, 20), (datetime.time(12, 0), datetime.time(18, 0))) == (4, 6)
+    # the night starts at 22:00 and ends the next day at 06:00
+    assert weather.get_slot_range(datetime.date(2020, 8, 20), (datetime.time(22, 0), datetime.time(6, 0))) == (7, 10)
+    # ranges can span several days
+    assert weather.get_range(datetime.datetime(2020, 8, 20, 12, 0), datetime.datetime(2020, 8, 21, 12, 0)) == (4, 12)
+    assert [x.temperature for x in weather.get_weather_in_range(datetime.datetime(2020, 8, 20, 21, 0), datetime.datetime(2020, 8, 21, 3, 0))] == [7, 8]
+
+
+def test_add_out_of_order():
+    weather = Weather(None, 3, timezone)
+    for index in [2, 0, 1]:
+        weather.add(start.timestamp() + index * 3 * 3600, index, WeatherCondition(index, str(index), ConditionType.RAIN), 1000, 50, 1, 90)
+    assert list(weather.temperatures) == [0, 1, 2]
+    assert list(weather.severities) == [0, 1, 2]
+    assert [weather.descriptions[x] for x in weather.description_ids] == ["0", "1", "2"]
+
+
+def test_aggregates(mock_config_detail_false):
+    weather = build_weather()
+    weather.build_aggregates()
+    day = weather.get_aggregate(*weather.get_slot_range(datetime.date(2020, 8, 21), (datetime.time.min, datetime.time.max)))
+    assert day is weather.get_aggregate(8, 16)
+    assert (day.count, day.min_temperature, day.max_temperature, day.max_pressure) == (8, 8, 15, 1015)
+    assert day.condition_counts[ConditionType.CLOUDS] == 8
+    # ranges without a precomputed aggregate are calculated
+    assert weather.get_aggregate(2, 4).max_temperature == 3
+    # adding a slot replaces the aggregates
+    weather.add(start.timestamp() + 16 * 3 * 3600 - 3600, 30, WeatherCondition(1, "Regen", ConditionType.RAIN), 1000, 50, 1, 90)
+    day = weather.get_aggregate(*weather.get_slot_range(datetime.date(2020, 8, 21), (datetime.time.min, datetime.time.max)))
+    assert (day.count, day.max_temperature) == (9, 30)
+    assert day.conditions[-1].condition_type == ConditionType.RAIN
+
+
+def test_day_and_night_use_date_of_slot(mock_config_detail_false):
+    location = Location("Frankfurt", lat=50.1167, lon=8.6833)
+    weather = Weather(location, 3, timezone)
+    for date in [datetime.date(2020, 6, 21), datetime.date(2020, 12, 21)]:
+        weather.add(timezone.localize(datetime.datetime.combine(date, datetime.time(7, 0))).timestamp(), 10,
+                    WeatherCondition(0, "Klarer Himmel", ConditionType.CLEAR), 1000, 50, 1, 90)
+    summer, winter = weather.get_slots(0, 2)
+    assert summer.is_during_day and not summer.is_during_night
+    assert winter.is_during_night and not winter.is_during_day
+    assert ConditionType.SUN in [x.condition_type for x in summer.other_conditions]
+    assert ConditionType.STARS in [x.condition_type for x in winter.other_conditions]
+    assert location.get_sunrise_and_sunset(datetime.date(2020, 6, 21), timezone)[0] < datetime.time(5, 30)
+    assert Location("Frankfurt").get_sunrise_and_sunset(datetime.date(2020, 6, 21)) == (None, None)
+
+
+def test_range_queries(mock_config_detail_false):
+    weather = build_weather()
+    weather.add(start.timestamp() + 16 * 3 * 3600, -5, WeatherCondition(1, "Regen", ConditionType.RAIN), 990, 90, 1, 90)
+    assert weather.get_extremes(3, 17) == {"min_temperature": -5, "max_temperature": 15, "min_pressure": 990,
+                                           "max_pressure": 1015, "min_humidity": 50, "max_humidity": 90}
+    counts = weather.count_condition_types(10, 17)
+    assert (counts[ConditionType.CLOUDS], counts[ConditionType.RAIN], counts[ConditionType.WIND]) == (6, 1, 7)
+    assert weather.count_condition_types(0, 16)[ConditionType.RAIN] == 0
+
+
+def test_aggregate_keeps_first_order(mock_config_detail_false):
+    aggregate = WeatherAggregate()
+    for condition in [WeatherCondition(0, "Nieselregen", ConditionType.RAIN), WeatherCondition(0, "Wolken", ConditionType.CLOUDS),
+                      WeatherCondition(2, "Starkregen", ConditionType.RAIN), WeatherCondition(1, "Regen", ConditionType.RAIN)]:
+        aggregate.add_condition(condition)
+    assert [x.description for x in aggregate.conditions] == ["Starkregen", "Wolken"]
+    assert aggregate.condition_counts == {ConditionType.RAIN: 3, ConditionType.CLOUDS: 1}